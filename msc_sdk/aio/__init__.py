@@ -0,0 +1,22 @@
+"""
+Async entry point of the SDK.
+
+Every resource exposes async equivalents of its API calls, prefixed with ``a`` (e.g.
+``await Contract.aget_by_key(...)``, ``await RecurrenceList.aget(...)``), sharing the same models and errors as the
+sync calls. Requests are sent through the pooled AsyncTransport of the SDK configuration, which requires the optional
+``httpx`` dependency.
+"""
+
+from msc_sdk.authenticate import Authenticate
+from msc_sdk.contract import ContractOwnershipAssignment
+from msc_sdk.contract.contract import Contract, LazyContract
+from msc_sdk.position import Position, PositionHandle, arequest_position_report
+from msc_sdk.recurrence import (
+    Recurrence,
+    RecurrenceList,
+    Operation,
+    OperationList,
+    RecurrenceReceivableUnit,
+    RecurrenceReceivableUnitList,
+)
+from msc_sdk.utils.transport import AsyncTransport
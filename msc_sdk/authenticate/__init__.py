@@ -1,2 +1,4 @@
 from .authenticate import Authenticate
 from .credential import Credential, CredentialPool
+from .token_manager import TokenManager, token_manager, authorized_execute, async_authorized_execute
+from .token_store import TokenStore, MemoryTokenStore, FileTokenStore
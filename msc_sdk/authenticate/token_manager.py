@@ -0,0 +1,327 @@
+import asyncio
+import hashlib
+import threading
+import time
+
+from msc_sdk.authenticate.credential import Credential
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.enums import APINamespaces
+from msc_sdk.errors import Unauthorized
+from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.executor import execute, async_execute
+from msc_sdk.utils.token_store import TokenStore, MemoryTokenStore
+
+
+class TokenManager:
+    """
+    Manages the bearer tokens of every credential.
+
+    Tokens are kept until the expiry announced by the API (``expires_in``) and refreshed in the background once
+    they are within ``refresh_margin`` seconds of expiring. Concurrent refreshes of the same credential are
+    single-flighted, so only one token request is sent at a time per credential. Tokens are persisted in a
+    TokenStore, which can be shared between processes (e.g. FileTokenStore).
+    """
+
+    def __init__(self, refresh_margin: float = 60.0, default_ttl: float = 6000.0, store: TokenStore = None):
+        """
+        Args:
+            refresh_margin (float): The time, in seconds, before the expiry when a token starts being refreshed.
+            Defaults to 60.
+            default_ttl (float): The lifetime, in seconds, of a token whose response has no ``expires_in``.
+            Defaults to 6000.
+            store (TokenStore, optional): The backend where tokens are persisted. Defaults to the token store of the
+            SDK configuration, else to a MemoryTokenStore of the manager.
+        """
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._store_override = store
+        self._memory_store = MemoryTokenStore()
+        self._tokens = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        self._async_refreshes = {}
+
+    @property
+    def store(self) -> TokenStore:
+        if self._store_override is not None:
+            return self._store_override
+
+        configured = ConfigSDK.get_config().token_store
+
+        return configured if configured is not None else self._memory_store
+
+    @store.setter
+    def store(self, store: TokenStore):
+        self._store_override = store
+
+    def get(self, credential: Credential) -> str:
+        """
+        Returns a valid access token of the credential, requesting a new one if needed.
+
+        Args:
+            credential (Credential): The credential object containing the API user and password.
+
+        Returns:
+            str: The access token.
+
+        Raises:
+            Unauthorized: If the credential is wrong.
+        """
+        key = self._key(credential)
+        token = self._tokens.get(key)
+        now = time.time()
+
+        if token is not None and now < token[1]:
+            if now >= token[1] - self.refresh_margin:
+                self._refresh_in_background(key, credential)
+
+            return token[0]
+
+        with self._lock(key):
+            token = self._valid_token(key)
+
+            if token is None:
+                with self.store.locked():
+                    token = self._load(key)
+
+                    if token is None:
+                        token = self._store(key, _token_request(credential))
+
+        return token[0]
+
+    async def aget(self, credential: Credential) -> str:
+        """
+        Async equivalent of TokenManager.get.
+        """
+        key = self._key(credential)
+        token = self._tokens.get(key)
+        now = time.time()
+
+        if token is not None and now < token[1]:
+            if now >= token[1] - self.refresh_margin:
+                self._async_refresh(key, credential)
+
+            return token[0]
+
+        # The store may block, e.g. on the file lock of another process, so it is read out of the event loop.
+        token = await asyncio.to_thread(self._load, key)
+
+        if token is None:
+            # The refresh is shared by the concurrent callers, cancelling one of them must not cancel it.
+            token = await asyncio.shield(self._async_refresh(key, credential))
+
+        return token[0]
+
+    def invalidate(self, credential: Credential, access_token: str = None):
+        """
+        Drops the token of the credential, e.g. after the API rejected it.
+
+        Args:
+            credential (Credential): The credential whose token is dropped.
+            access_token (str, optional): Only drops the token if it is still this one, so a token refreshed
+            meanwhile by another caller is kept. Defaults to None.
+        """
+        key = self._key(credential)
+        token = self._tokens.get(key)
+
+        if token is not None and (access_token is None or token[0] == access_token):
+            self._tokens.pop(key, None)
+
+        stored = self.store.get(key)
+
+        if stored is not None and (access_token is None or stored[0] == access_token):
+            self.store.delete(key)
+
+    def clear(self):
+        """
+        Drops every token.
+        """
+        self._tokens.clear()
+        self.store.clear()
+
+    def _refresh_in_background(self, key: str, credential: Credential):
+        lock = self._lock(key)
+
+        if not lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                with self.store.locked():
+                    token = self.store.get(key)
+
+                    if token is None or time.time() >= token[1] - self.refresh_margin:
+                        self._store(key, _token_request(credential))
+                    else:
+                        self._tokens[key] = token
+            except Exception:
+                pass
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _async_refresh(self, key: str, credential: Credential) -> asyncio.Task:
+        task = self._async_refreshes.get(key)
+
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+
+            loop = asyncio.get_running_loop()
+
+            def locked_refresh() -> tuple[str, float]:
+                # Holds the store lock in a worker thread, as the sync refresh does, while the token request is sent
+                # by the event loop.
+                with self.store.locked():
+                    token = self.store.get(key)
+
+                    if token is None or time.time() >= token[1] - self.refresh_margin:
+                        response_data = asyncio.run_coroutine_threadsafe(_async_token_request(credential), loop)
+                        return self._store(key, response_data.result())
+
+                    self._tokens[key] = token
+
+                    return token
+
+            async def refresh() -> tuple[str, float]:
+                try:
+                    return await asyncio.to_thread(locked_refresh)
+                finally:
+                    self._async_refreshes.pop(key, None)
+
+            task = asyncio.ensure_future(refresh())
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._async_refreshes[key] = task
+
+        return task
+
+    def _valid_token(self, key: str) -> tuple[str, float] | None:
+        token = self._tokens.get(key)
+
+        if token is None or time.time() >= token[1]:
+            return None
+
+        return token
+
+    def _load(self, key: str) -> tuple[str, float] | None:
+        token = self.store.get(key)
+
+        if token is None or time.time() >= token[1]:
+            return None
+
+        self._tokens[key] = token
+
+        return token
+
+    def _store(self, key: str, response_data: dict) -> tuple[str, float]:
+        ttl = response_data.get("expires_in")
+
+        if ttl is None:
+            ttl = self.default_ttl
+
+        token = (response_data["access_token"], time.time() + float(ttl))
+        self._tokens[key] = token
+        self.store.set(key, *token)
+
+        return token
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_lock:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+
+            return self._locks[key]
+
+    @staticmethod
+    def _key(credential: Credential) -> str:
+        """
+        Hashes the credential, so secrets are never written to a shared store.
+        """
+        return hashlib.sha256(
+            "\x00".join(
+                [
+                    get_url(APINamespaces.AUTHENTICATE, "token"),
+                    credential.api_user.get_secret_value(),
+                    credential.api_pass.get_secret_value(),
+                ]
+            ).encode()
+        ).hexdigest()
+
+
+token_manager = TokenManager()
+
+
+def authorized_execute(credential: Credential, method: str, url: str, **kwargs):
+    """
+    Sends an authenticated request through the request executor, re-authenticating once if the token is rejected.
+
+    Args:
+        credential (Credential): The credential used for authentication.
+        method (str): The HTTP method.
+        url (str): The URL of the request.
+        **kwargs: Extra arguments forwarded to the executor.
+
+    Returns:
+        requests.Response: The successful response of the request.
+    """
+    headers = kwargs.pop("headers", None) or {}
+    access_token = token_manager.get(credential)
+
+    try:
+        return execute(method, url, headers={**headers, "Authorization": f"Bearer {access_token}"}, **kwargs)
+    except Unauthorized:
+        token_manager.invalidate(credential, access_token)
+        access_token = token_manager.get(credential)
+
+        return execute(method, url, headers={**headers, "Authorization": f"Bearer {access_token}"}, **kwargs)
+
+
+async def async_authorized_execute(credential: Credential, method: str, url: str, **kwargs):
+    """
+    Async equivalent of authorized_execute.
+    """
+    headers = kwargs.pop("headers", None) or {}
+    access_token = await token_manager.aget(credential)
+
+    try:
+        return await async_execute(
+            method, url, headers={**headers, "Authorization": f"Bearer {access_token}"}, **kwargs
+        )
+    except Unauthorized:
+        token_manager.invalidate(credential, access_token)
+        access_token = await token_manager.aget(credential)
+
+        return await async_execute(
+            method, url, headers={**headers, "Authorization": f"Bearer {access_token}"}, **kwargs
+        )
+
+
+def _token_request(credential: Credential) -> dict:
+    """
+    A function that sends a token request and returns the response data.
+
+    Args:
+        credential (Credential): The credential object containing the API user and password.
+
+    Returns:
+        dict: The response data of the token request.
+    """
+    response = execute(
+        "POST",
+        url=get_url(APINamespaces.AUTHENTICATE, "token"),
+        auth=(credential.api_user.get_secret_value(), credential.api_pass.get_secret_value()),
+    )
+
+    return response.json()
+
+
+async def _async_token_request(credential: Credential) -> dict:
+    """
+    Async equivalent of _token_request.
+    """
+    response = await async_execute(
+        "POST",
+        url=get_url(APINamespaces.AUTHENTICATE, "token"),
+        auth=(credential.api_user.get_secret_value(), credential.api_pass.get_secret_value()),
+    )
+
+    return response.json()
@@ -0,0 +1,2 @@
+# The token stores live with the other configurable backends of the SDK, re-exported here for compatibility.
+from msc_sdk.utils.token_store import TokenStore, MemoryTokenStore, FileTokenStore  # noqa: F401
@@ -1,9 +1,17 @@
 from enum import Enum
 from typing import Self, Annotated
 
-from pydantic import BaseModel, model_validator, UrlConstraints
+from pydantic import BaseModel, Field, field_validator, model_validator, UrlConstraints
 from pydantic_core import Url
 
+from msc_sdk.utils.cache import ResourceCache
+from msc_sdk.utils.money import MoneyMode
+from msc_sdk.utils.retry import RetryPolicy
+from msc_sdk.utils.token_store import TokenStore
+from msc_sdk.utils.transport import Transport, AsyncTransport
+
+_LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "[::1]")
+
 
 class Environment(str, Enum):
     TEST = "test"
@@ -18,12 +26,19 @@ class ConfigSDK(BaseModel):
     environment: Environment
     base_url: Annotated[
         Url,
-        UrlConstraints(max_length=2083, allowed_schemes=["https"], host_required=True),
+        UrlConstraints(max_length=2083, allowed_schemes=["http", "https"], host_required=True),
     ] = None
+    transport: Transport = Field(default_factory=Transport, exclude=True)
+    async_transport: AsyncTransport = Field(default_factory=AsyncTransport, exclude=True)
+    retry_policy: RetryPolicy = Field(default_factory=RetryPolicy, exclude=True)
+    money_mode: MoneyMode = MoneyMode.FLOAT
+    cache: ResourceCache | None = Field(default=None, exclude=True)
+    token_store: TokenStore | None = Field(default=None, exclude=True)
 
     class Config:
         validate_assignment = True
         use_enum_values = True
+        arbitrary_types_allowed = True
 
     @model_validator(mode="before")
     def validate(self):
@@ -35,10 +50,74 @@ class ConfigSDK(BaseModel):
 
         return self
 
+    @field_validator("base_url")
+    @classmethod
+    def validate_base_url(cls, base_url: Url) -> Url:
+        if base_url is not None and base_url.scheme == "http" and base_url.host not in _LOOPBACK_HOSTS:
+            raise ValueError("base_url must use https, except for local servers")
+
+        return base_url
+
     @classmethod
-    def setup(cls, environment: Environment) -> Self:
+    def setup(
+        cls,
+        environment: Environment,
+        transport: Transport = None,
+        async_transport: AsyncTransport = None,
+        retry_policy: RetryPolicy = None,
+        base_url: str = None,
+        money_mode: MoneyMode = None,
+        cache: ResourceCache = None,
+        token_store: TokenStore = None,
+    ) -> Self:
+        """
+        Sets up the SDK configuration, shared by every API call.
+
+        Args:
+            environment (Environment): The environment of the MSC API.
+            transport (Transport, optional): The HTTP transport used to send the requests. Defaults to a pooled
+            Transport with the default pool sizes.
+            async_transport (AsyncTransport, optional): The HTTP transport used to send the async requests.
+            Defaults to a pooled AsyncTransport with the default limits.
+            retry_policy (RetryPolicy, optional): The retry policy applied to every API call. Defaults to a
+            RetryPolicy with exponential backoff and jitter.
+            base_url (str, optional): Overrides the URL of the MSC API, e.g. to use a local FakeMSCServer. Defaults
+            to the URL of the environment.
+            money_mode (MoneyMode, optional): How amounts are kept in the models. Defaults to MoneyMode.FLOAT;
+            MoneyMode.CENTS keeps them as exact integer Cents.
+            cache (ResourceCache, optional): A read-through cache of the resources fetched by key. Defaults to None,
+            which disables caching.
+            token_store (TokenStore, optional): Where the access tokens are persisted, e.g. a FileTokenStore shared
+            between processes. Defaults to None, which keeps them in the memory of the process.
+
+        Returns:
+            ConfigSDK: The SDK configuration.
+        """
         if not hasattr(cls, "_instance"):
-            cls._instance = cls(environment=environment)
+            data = dict(environment=environment)
+
+            if transport:
+                data["transport"] = transport
+
+            if async_transport:
+                data["async_transport"] = async_transport
+
+            if retry_policy:
+                data["retry_policy"] = retry_policy
+
+            if base_url:
+                data["base_url"] = base_url
+
+            if money_mode:
+                data["money_mode"] = money_mode
+
+            if cache:
+                data["cache"] = cache
+
+            if token_store is not None:
+                data["token_store"] = token_store
+
+            cls._instance = cls(**data)
             return cls._instance
         return cls._instance
 
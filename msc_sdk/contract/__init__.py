@@ -1,2 +1,3 @@
+from .contract import LazyContract
 from .ownership_assignment import ContractOwnershipAssignment, ContractPositionList
 from .warranty import ContractWarranty
@@ -1,23 +1,20 @@
-import json
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Self
+from typing import Any, Dict, Iterable, List, Self
 
-import requests
 from pydantic import BaseModel, model_validator, Field
 
-from msc_sdk.authenticate import Authenticate, Credential
+from msc_sdk.authenticate import Credential, authorized_execute, async_authorized_execute
 from msc_sdk.commons import BankAccount
 from msc_sdk.enums import APINamespaces
-from msc_sdk.errors import Unauthorized, ServerError, NotFound
-from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.api_tools import get_url, cached_model, acached_model, invalidate_cached
+from msc_sdk.utils.concurrency import run_concurrently, arun_concurrently
 from msc_sdk.utils.validators import validate_cnpj
 from msc_sdk.utils.converters import (
-    dict_int_to_float,
-    list_int_to_float,
-    dict_float_to_int,
-    list_float_to_int,
+    dict_cents_to_amount,
+    list_cents_to_amount,
 )
+from msc_sdk.utils.money import Amount, WIRE_FORMAT
 
 
 class EffectStrategy(str, Enum):
@@ -41,8 +38,8 @@ class ContractUR(BaseModel):
     acquirer: str = None
     payment_scheme: str = None
     due_date: datetime
-    effect_amount: float = 0
-    committed_effect_amount: float = 0
+    effect_amount: Amount = 0
+    committed_effect_amount: Amount = 0
     effect_priority: int = 0
 
     class Config:
@@ -66,8 +63,8 @@ class Contract(BaseModel):
     effect_type: EffectType
     division_method: DivisionMethod
     effect_strategy: EffectStrategy
-    balance_due: float = 0
-    committed_effect_amount: float = 0
+    balance_due: Amount = 0
+    committed_effect_amount: Amount = 0
     percentage_value: int = 0
     process_key_tag: str = None
     ur_list: List[ContractUR]
@@ -108,50 +105,80 @@ class Contract(BaseModel):
             ServerError: If a server error occurs.
             Exception: For unexpected errors including the response status code and text.
         """
-        auth = Authenticate.token(credential)
+        return cached_model(
+            "contract",
+            credential,
+            (key,),
+            lambda headers: authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.CONTRACTS),
+                params=dict(key=key, msc_customer=credential.document),
+                headers=headers,
+                not_found_message="Contract not found",
+            ),
+            cls._from_response_data,
+        )
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.CONTRACTS),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=dict(key=key, msc_customer=credential.document),
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+    @classmethod
+    async def aget_by_key(cls, key: str, credential: Credential) -> Self:
+        """
+        Async equivalent of Contract.get_by_key.
+        """
 
-        if response.status_code == 200:
-            data = dict_int_to_float(response.json(), ["balance_due", "committed_effect_amount"])
+        def request(headers: dict):
+            return async_authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.CONTRACTS),
+                params=dict(key=key, msc_customer=credential.document),
+                headers=headers,
+                not_found_message="Contract not found",
+            )
 
-            if data.get("ur_list", None):
-                data["ur_list"] = list_int_to_float(data["ur_list"], ["effect_amount", "committed_effect_amount"])
+        return await acached_model("contract", credential, (key,), request, cls._from_response_data)
 
-            return cls(**data)
+    @classmethod
+    def get_many(cls, keys: Iterable[str], credential: Credential, concurrency: int = 8) -> Dict[str, Self | Exception]:
+        """
+        A class method to retrieve many contracts by key, fetching up to ``concurrency`` contracts at a time.
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+        Parameters:
+            keys (Iterable[str]): The keys of the contracts to retrieve.
+            credential (Credential): The credential object used for authentication.
+            concurrency (int, optional): The maximum number of contracts fetched at the same time. Defaults to 8.
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        Returns:
+            Dict[str, Self | Exception]: The retrieved contract of each key, or the error raised while fetching it.
+        """
+        calls = {key: (lambda key=key: cls.get_by_key(key=key, credential=credential)) for key in keys}
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        return run_concurrently(calls, concurrency=concurrency)
 
-        raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+    @classmethod
+    async def aget_many(
+        cls, keys: Iterable[str], credential: Credential, concurrency: int = 8
+    ) -> Dict[str, Self | Exception]:
+        """
+        Async equivalent of Contract.get_many.
+        """
+        calls = {key: (lambda key=key: cls.aget_by_key(key=key, credential=credential)) for key in keys}
+
+        return await arun_concurrently(calls, concurrency=concurrency)
 
     @classmethod
-    def cancel_by_key(cls, key: str, credential: Credential) -> Self:
+    def cancel_by_key(cls, key: str, credential: Credential, fetch: bool = True) -> Self | "LazyContract":
         """
         A class method to cancel a contract by its key using the provided credential.
 
         Parameters:
             key (str): The key of the contract to be canceled.
             credential (Credential): The credential used for authentication.
+            fetch (bool, optional): Fetches the canceled contract. If False, a LazyContract is returned instead,
+            which only fetches it when one of its attributes is accessed. Defaults to True.
 
         Returns:
-            Self: The canceled contract.
+            Self | LazyContract: The canceled contract.
 
         Raises:
             NotFound: If the contract is not found.
@@ -161,42 +188,101 @@ class Contract(BaseModel):
         """
         api_path = "cancel"
 
-        auth = Authenticate.token(credential)
+        authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.CONTRACTS, api_path),
+            json=dict(key=key),
+            not_found_message="Contract not found",
+        )
 
-        for i in range(5):
-            try:
-                response = requests.patch(
-                    url=get_url(APINamespaces.CONTRACTS, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    json=dict(key=key),
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        invalidate_cached("contract", credential, key)
 
-        if response.status_code == 200:
-            contract = cls.get_by_key(key=key, credential=credential)
+        if not fetch:
+            return LazyContract(key=key, credential=credential, contract_class=cls)
 
-            return contract
+        contract = cls.get_by_key(key=key, credential=credential)
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+        return contract
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+    @classmethod
+    async def acancel_by_key(cls, key: str, credential: Credential, fetch: bool = True) -> Self | "LazyContract":
+        """
+        Async equivalent of Contract.cancel_by_key.
+        """
+        api_path = "cancel"
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        await async_authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.CONTRACTS, api_path),
+            json=dict(key=key),
+            not_found_message="Contract not found",
+        )
 
-        raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        invalidate_cached("contract", credential, key)
 
-    def model_dump_json(self, *args, **kwargs):
-        data = json.loads(super().model_dump_json(*args, **kwargs))
+        if not fetch:
+            return LazyContract(key=key, credential=credential, contract_class=cls)
 
-        data = dict_float_to_int(data, ["balance_due", "committed_effect_amount"])
+        return await cls.aget_by_key(key=key, credential=credential)
+
+    @classmethod
+    def _from_response_data(cls, data: dict) -> Self:
+        data = dict_cents_to_amount(data, ["balance_due", "committed_effect_amount"])
 
         if data.get("ur_list", None):
-            data["ur_list"] = list_float_to_int(data["ur_list"], ["effect_amount", "committed_effect_amount"])
+            data["ur_list"] = list_cents_to_amount(data["ur_list"], ["effect_amount", "committed_effect_amount"])
+
+        return cls(**data)
+
+    def model_dump_json(self, *args, **kwargs) -> str:
+        """
+        Dumps the contract in the API wire format, with the amounts in integer cents, in a single pass.
+        """
+        kwargs["context"] = {**(kwargs.get("context") or {}), **WIRE_FORMAT}
+
+        return super().model_dump_json(*args, **kwargs)
+
+
+class LazyContract:
+    """
+    Lightweight result of a contract mutation, holding only the key of the contract.
+
+    The full contract is fetched with ``get_by_key`` on the first access to any other attribute, or explicitly
+    with ``fetch``/``afetch``, and kept afterwards. Async code should await ``afetch`` before reading attributes,
+    since attribute access fetches synchronously.
+    """
+
+    def __init__(self, key: str, credential: Credential, contract_class: type = Contract):
+        self.key = key
+        self._credential = credential
+        self._contract_class = contract_class
+        self._contract = None
+
+    def fetch(self) -> Contract:
+        """
+        Returns the full contract, fetching it on the first call.
+        """
+        if self._contract is None:
+            self._contract = self._contract_class.get_by_key(key=self.key, credential=self._credential)
+
+        return self._contract
+
+    async def afetch(self) -> Contract:
+        """
+        Async equivalent of LazyContract.fetch.
+        """
+        if self._contract is None:
+            self._contract = await self._contract_class.aget_by_key(key=self.key, credential=self._credential)
+
+        return self._contract
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self.fetch(), name)
 
-        return json.dumps(data)
+    def __repr__(self) -> str:
+        return f"LazyContract(key={self.key!r}, fetched={self._contract is not None})"
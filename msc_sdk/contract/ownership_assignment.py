@@ -1,32 +1,48 @@
-import json
 from datetime import date, datetime
 from typing import Self, List
 
-import requests
 from pydantic import BaseModel, Field, model_validator
 
-from msc_sdk.authenticate import Credential, Authenticate
+from msc_sdk.authenticate import Credential, authorized_execute, async_authorized_execute
 from msc_sdk.enums import APINamespaces
-from msc_sdk.contract.contract import Contract, EffectType, DivisionMethod
-from msc_sdk.errors import Unauthorized, ServerError, BillingError
-from msc_sdk.position import PositionUR
-from msc_sdk.utils.api_tools import get_url
-from msc_sdk.utils.converters import list_float_to_int
+from msc_sdk.contract.contract import Contract, EffectType, DivisionMethod, LazyContract
+from msc_sdk.position import PositionUR, URSchedule
+from msc_sdk.utils.api_tools import get_url, invalidate_cached
+from msc_sdk.utils.money import Amount, WIRE_FORMAT
 from msc_sdk.utils.validators import validate_cnpj
 
 
 class ContractURData(BaseModel):
     due_date: date
-    value_available: float
+    value_available: Amount
 
     class Config:
-        validate_assignment = True
+        frozen = True
+
+
+class ContractURSchedule(URSchedule):
+    """
+    A compact schedule of the receivable units of a contract position, dumped as ContractURData.
+    """
+
+    __slots__ = ()
+
+    _item_class = ContractURData
+    _amount_fields = ("value_available",)
+    _date_only = True
+
+    @classmethod
+    def from_schedule(cls, schedule: URSchedule) -> Self:
+        """
+        Builds the schedule from the due dates and available values of a position schedule, sharing its columns.
+        """
+        return cls._from_columns(schedule._due_dates, {"value_available": schedule._amounts["value_available"]})
 
 
 class ContractPosition(BaseModel):
     payment_scheme: str
     acquirer: str
-    ur_list: List[ContractURData]
+    ur_list: ContractURSchedule
     max_due_date: datetime = Field(exclude=True)
 
     class Config:
@@ -40,31 +56,33 @@ class ContractPosition(BaseModel):
         return self
 
     @classmethod
-    def from_position_urs(cls, position_urs: List[PositionUR], payment_scheme: str, acquirer: str) -> Self:
+    def from_position_urs(cls, position_urs: List[PositionUR] | URSchedule, payment_scheme: str, acquirer: str) -> Self:
         """
         Generate a new instance of ContractPosition from a list of PositionUR objects, a payment scheme and an acquirer.
 
         Parameters:
-            position_urs (List[PositionUR]): A list of PositionUR objects.
+            position_urs (List[PositionUR] | URSchedule): A list of PositionUR objects, or the ur_list_resume of a
+            Position, whose arrays are reused without building a model per receivable unit.
             payment_scheme (str): The payment scheme for the new instance.
             acquirer (str): The acquirer for the new instance.
 
         Returns:
             Self: A new instance of ContractPosition.
         """
-        ur_data_list = []
-        max_due_date = datetime.now()
+        if isinstance(position_urs, URSchedule):
+            ur_list = ContractURSchedule.from_schedule(position_urs)
+        else:
+            ur_list = ContractURSchedule(position_urs)
 
-        for ur in position_urs:
-            ur_data_list.append(ContractURData(due_date=ur.due_date, value_available=ur.value_available))
+        max_due_date = datetime.now()
 
-            if ur.due_date > max_due_date:
-                max_due_date = ur.due_date
+        if len(ur_list) and ur_list.max_due_date > max_due_date:
+            max_due_date = ur_list.max_due_date
 
         return cls(
             payment_scheme=payment_scheme,
             acquirer=acquirer,
-            ur_list=ur_data_list,
+            ur_list=ur_list,
             max_due_date=max_due_date,
         )
 
@@ -73,12 +91,13 @@ class ContractPositionList(BaseModel):
     positions: List[ContractPosition] = []
     max_due_date: datetime = Field(default_factory=datetime.now, exclude=True)
 
-    def add_from_position_urs(self, position_urs: List[PositionUR], payment_scheme: str, acquirer: str):
+    def add_from_position_urs(self, position_urs: List[PositionUR] | URSchedule, payment_scheme: str, acquirer: str):
         """
         Generate ContractPositions from PositionURs and append them to the positions list.
 
         Args:
-            position_urs (List[PositionUR]): List of PositionUR objects to create ContractPositions from.
+            position_urs (List[PositionUR] | URSchedule): List of PositionUR objects, or the ur_list_resume of a
+            Position, to create ContractPositions from.
             payment_scheme (str): The payment scheme to use for creating ContractPositions.
             acquirer (str): The acquirer to associate with the ContractPositions.
         """
@@ -91,18 +110,20 @@ class ContractPositionList(BaseModel):
 
         self.positions.append(positions)
 
-    def model_dump_json(self, *args, **kwargs):
-        data = json.loads(super().model_dump_json(*args, **kwargs))
-
-        for position in data["positions"]:
-            position["ur_list"] = list_float_to_int(position["ur_list"], ["value_available"])
+    def model_dump_json(self, *args, **kwargs) -> str:
+        """
+        Dumps the positions in the API wire format, with the amounts in integer cents, in a single pass.
+        """
+        kwargs["context"] = {**(kwargs.get("context") or {}), **WIRE_FORMAT}
 
-        return json.dumps(data)
+        return super().model_dump_json(*args, **kwargs)
 
 
 class ContractOwnershipAssignment(Contract):
     @classmethod
-    def new(cls, credential: Credential, asset_holder: str, positions: ContractPositionList) -> Self:
+    def new(
+        cls, credential: Credential, asset_holder: str, positions: ContractPositionList, fetch: bool = True
+    ) -> Self | LazyContract:
         """
         A class method to create a new contract of ownership assignment with detailed information.
 
@@ -110,49 +131,72 @@ class ContractOwnershipAssignment(Contract):
             credential (Credential): The credential used for authentication.
             asset_holder (str): The asset holder's information.
             positions (ContractPositionList): A list of contract positions.
+            fetch (bool, optional): Fetches the created contract. If False, a LazyContract is returned instead,
+            which only fetches it when one of its attributes is accessed. Defaults to True.
 
         Returns:
-            Self: The newly created contract.
+            Self | LazyContract: The newly created contract.
         """
         api_path = "detailed/fixed_amount"
 
-        auth = Authenticate.token(credential)
+        payload = cls._new_payload(credential, asset_holder, positions)
 
-        payload = dict(
-            asset_holder=asset_holder,
-            contract_due_date=positions.max_due_date.strftime("%Y-%m-%d"),
-            bank_account=credential.model_dump()["bank_account"],
-            effect_type=EffectType.OWNERSHIP_ASSIGNMENT.value,
-            division_method=DivisionMethod.FIXED_AMOUNT.value,
-            positions=json.loads(positions.model_dump_json())["positions"],
+        response = authorized_execute(
+            credential,
+            "POST",
+            url=get_url(APINamespaces.CONTRACTS, api_path),
+            json=payload,
         )
 
-        for i in range(5):
-            try:
-                response = requests.post(
-                    url=get_url(APINamespaces.CONTRACTS, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    json=payload,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        cls._invalidate_positions(credential, asset_holder, positions)
+
+        response = response.json()
+
+        if not fetch:
+            return LazyContract(key=response["key"], credential=credential, contract_class=cls)
 
-        if response.status_code == 200:
-            response = response.json()
+        contract = cls.get_by_key(key=response["key"], credential=credential)
 
-            contract = cls.get_by_key(key=response["key"], credential=credential)
+        return contract
 
-            return contract
+    @classmethod
+    async def anew(
+        cls, credential: Credential, asset_holder: str, positions: ContractPositionList, fetch: bool = True
+    ) -> Self | LazyContract:
+        """
+        Async equivalent of ContractOwnershipAssignment.new.
+        """
+        api_path = "detailed/fixed_amount"
+
+        response = await async_authorized_execute(
+            credential,
+            "POST",
+            url=get_url(APINamespaces.CONTRACTS, api_path),
+            json=cls._new_payload(credential, asset_holder, positions),
+        )
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        cls._invalidate_positions(credential, asset_holder, positions)
 
-        elif response.status_code == 402:
-            raise BillingError(response.text)
+        key = response.json()["key"]
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        if not fetch:
+            return LazyContract(key=key, credential=credential, contract_class=cls)
 
-        raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return await cls.aget_by_key(key=key, credential=credential)
+
+    @staticmethod
+    def _invalidate_positions(credential: Credential, asset_holder: str, positions: ContractPositionList):
+        # The contract takes the available value of the positions, so their cached reports are stale.
+        for position in positions.positions:
+            invalidate_cached("position", credential, position.payment_scheme, position.acquirer, asset_holder)
+
+    @staticmethod
+    def _new_payload(credential: Credential, asset_holder: str, positions: ContractPositionList) -> dict:
+        return dict(
+            asset_holder=asset_holder,
+            contract_due_date=positions.max_due_date.strftime("%Y-%m-%d"),
+            bank_account=credential.model_dump()["bank_account"],
+            effect_type=EffectType.OWNERSHIP_ASSIGNMENT.value,
+            division_method=DivisionMethod.FIXED_AMOUNT.value,
+            positions=positions.model_dump(mode="json", context=WIRE_FORMAT)["positions"],
+        )
@@ -41,3 +41,12 @@ class ServerError(Exception):
 
     def __str__(self):
         return self.message
+
+
+class NotModified(Exception):
+    def __init__(self, message: str = None):
+        self.message = message if message else "Not modified"
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
@@ -1 +1,10 @@
-from .position import PositionUR, Position, request_position_report, RequestPositionType, RequestPositionURList
+from .position import (
+    PositionUR,
+    URSchedule,
+    Position,
+    PositionHandle,
+    request_position_report,
+    arequest_position_report,
+    RequestPositionType,
+    RequestPositionURList,
+)
@@ -1,15 +1,19 @@
-from datetime import datetime
+from array import array
+from collections.abc import Sequence
+from datetime import date, datetime, time, timezone
 from enum import Enum
-from typing import List, Self
+from typing import Any, Dict, Iterable, List, Self
 
-import requests
-from pydantic import BaseModel, model_validator, Field
+from pydantic import BaseModel, GetCoreSchemaHandler, SerializationInfo, ValidationInfo, model_validator, Field
+from pydantic_core import core_schema
 
-from msc_sdk.authenticate import Authenticate, Credential
+from msc_sdk.authenticate import Credential, authorized_execute, async_authorized_execute
+from msc_sdk.config_sdk import ConfigSDK
 from msc_sdk.enums import APINamespaces
-from msc_sdk.errors import Unauthorized, ServerError, NotFound, BillingError, BadRequest
-from msc_sdk.utils.api_tools import get_url
-from msc_sdk.utils.converters import dict_int_to_float, list_int_to_float
+from msc_sdk.utils.api_tools import get_url, cached_model, acached_model, invalidate_cached
+from msc_sdk.utils.concurrency import run_concurrently, arun_concurrently
+from msc_sdk.utils.converters import dict_cents_to_amount
+from msc_sdk.utils.money import Amount, Cents, MoneyMode
 from msc_sdk.utils.validators import validate_cnpj
 
 
@@ -51,11 +55,263 @@ class RequestPositionURList(BaseModel):
 
 class PositionUR(BaseModel):
     due_date: datetime
-    ur_amount: float
-    value_available: float
+    ur_amount: Amount
+    value_available: Amount
 
     class Config:
-        validate_assignment = True
+        frozen = True
+
+
+class _AmountColumn:
+    """
+    A column of amounts, kept in an array when its values are homogeneous.
+
+    Kinds: "cents" holds Cents, "api_cents" holds the integer cents sent by the API, shown as floats (MoneyMode.FLOAT),
+    "float" holds floats and "mixed" keeps a list of Cents and floats as they are.
+    """
+
+    __slots__ = ("values", "kind")
+
+    def __init__(self, values, kind: str):
+        self.values = values
+        self.kind = kind
+
+    @classmethod
+    def from_amounts(cls, amounts: List) -> "_AmountColumn":
+        amounts = [amount if isinstance(amount, Cents) else _to_float(amount) for amount in amounts]
+
+        if all(isinstance(amount, Cents) for amount in amounts):
+            return cls(array("q", amounts), "cents")
+
+        if all(isinstance(amount, float) for amount in amounts):
+            return cls(array("d", amounts), "float")
+
+        return cls(amounts, "mixed")
+
+    @classmethod
+    def from_cents(cls, cents: List[int]) -> "_AmountColumn":
+        kind = "cents" if ConfigSDK.get_config().money_mode == MoneyMode.CENTS else "api_cents"
+
+        return cls(array("q", cents), kind)
+
+    def __getitem__(self, index: int):
+        value = self.values[index]
+
+        if self.kind == "cents":
+            return Cents(value)
+
+        if self.kind == "api_cents":
+            return value / 100
+
+        return value
+
+    def dump(self, wire_format: bool = False) -> List:
+        if wire_format:
+            if self.kind in ("cents", "api_cents"):
+                return self.values.tolist()
+
+            return [Cents.from_amount(value) if isinstance(value, float) else value for value in self.values]
+
+        if self.kind == "cents":
+            return [Cents(value) for value in self.values]
+
+        if self.kind == "api_cents":
+            return [value / 100 for value in self.values]
+
+        return list(self.values)
+
+
+class URSchedule(Sequence):
+    """
+    A compact schedule of receivable units, kept as parallel columns of due dates and amounts.
+
+    Behaves as a read-only sequence of PositionUR, built on access, and is dumped to JSON straight from its columns,
+    so long schedules cost a few machine words per row instead of one model per row. Amounts parsed from the API are
+    kept in exact integer cents.
+
+    Unlike the list of PositionUR it replaces in ``Position.ur_list_resume``, a schedule can not be modified: its items
+    are frozen, so assigning to one of them raises, and it has no ``append``. Build a new schedule instead, e.g.
+    ``URSchedule([*schedule, ur])``, or use ``list(schedule)`` where a list is required.
+    """
+
+    __slots__ = ("_due_dates", "_amounts")
+
+    _item_class = PositionUR
+    _amount_fields = ("ur_amount", "value_available")
+    _date_only = False
+
+    def __init__(self, items: Iterable = ()):
+        """
+        Args:
+            items (Iterable, optional): The receivable units, as models or dicts with the due date and the amounts.
+            Defaults to an empty schedule.
+        """
+        due_dates, amounts = [], {field_name: [] for field_name in self._amount_fields}
+
+        for item in items:
+            get = item.get if isinstance(item, dict) else lambda name: getattr(item, name, None)
+            due_dates.append(get("due_date"))
+
+            for field_name, column in amounts.items():
+                column.append(get(field_name))
+
+        self._due_dates = [_to_due_date(due_date) for due_date in due_dates]
+        self._amounts = {field_name: _AmountColumn.from_amounts(column) for field_name, column in amounts.items()}
+
+    @classmethod
+    def from_response_data(cls, data: List[dict]) -> Self:
+        """
+        Builds the schedule from the API data, with the amounts in integer cents.
+        """
+        return cls._from_columns(
+            [_to_due_date(item["due_date"]) for item in data],
+            {
+                field_name: _AmountColumn.from_cents([item.get(field_name) or 0 for item in data])
+                for field_name in cls._amount_fields
+            },
+        )
+
+    @classmethod
+    def _from_columns(cls, due_dates: List[datetime], amounts: Dict[str, _AmountColumn]) -> Self:
+        schedule = cls.__new__(cls)
+        schedule._due_dates = due_dates
+        schedule._amounts = amounts
+
+        return schedule
+
+    @property
+    def max_due_date(self) -> datetime | None:
+        """
+        The latest due date of the schedule, or None if it is empty.
+
+        It is the local date and time of the latest receivable unit, without its UTC offset, so it compares with the
+        naive datetimes of the contracts.
+        """
+        if not self._due_dates:
+            return None
+
+        return max(self._due_dates, key=_utc).replace(tzinfo=None)
+
+    def due_dates(self) -> List[datetime | date]:
+        """
+        Returns the due dates of the schedule.
+        """
+        return [self._due_date(index) for index in range(len(self))]
+
+    def amounts(self, field_name: str) -> List:
+        """
+        Returns the amounts of the given field, e.g. ``schedule.amounts("value_available")``.
+        """
+        return self._amounts[field_name].dump()
+
+    def _due_date(self, index: int) -> datetime | date:
+        due_date = self._due_dates[index]
+
+        return due_date.date() if self._date_only else due_date
+
+    def __len__(self) -> int:
+        return len(self._due_dates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_columns(
+                self._due_dates[index],
+                {
+                    field_name: _AmountColumn(column.values[index], column.kind)
+                    for field_name, column in self._amounts.items()
+                },
+            )
+
+        return self._item_class.model_construct(
+            due_date=self._due_date(index),
+            **{field_name: column[index] for field_name, column in self._amounts.items()},
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Sequence, list)) and not isinstance(other, str):
+            return len(self) == len(other) and all(item == other_item for item, other_item in zip(self, other))
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} receivable units)"
+
+    def dump(self, json_mode: bool = False, wire_format: bool = False) -> List[dict]:
+        """
+        Dumps the schedule as a list of dicts, column by column.
+
+        Args:
+            json_mode (bool, optional): Dumps the due dates as ISO strings. Defaults to False.
+            wire_format (bool, optional): Dumps the amounts in the API integer cents. Defaults to False.
+
+        Returns:
+            List[dict]: One dict per receivable unit.
+        """
+        due_dates = self.due_dates()
+
+        if json_mode:
+            due_dates = [due_date.isoformat() for due_date in due_dates]
+
+        columns = [due_dates] + [column.dump(wire_format) for column in self._amounts.values()]
+        names = ("due_date",) + tuple(self._amounts)
+
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        items_schema = handler.generate_schema(List[cls._item_class])
+
+        return core_schema.with_info_plain_validator_function(
+            cls._validate,
+            json_schema_input_schema=items_schema,
+            # The receivable units are dumped as dicts, checked as such when serialized.
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, info_arg=True, return_schema=core_schema.list_schema(core_schema.dict_schema())
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, value, info: ValidationInfo) -> Self:
+        if isinstance(value, cls):
+            return value
+
+        if isinstance(value, list) and info.context and info.context.get("wire_format"):
+            return cls.from_response_data(value)
+
+        if isinstance(value, (list, tuple, URSchedule)):
+            return cls(value)
+
+        raise ValueError(f"{cls.__name__} must be built from a list of receivable units")
+
+    def _serialize(self, info: SerializationInfo) -> List[dict]:
+        return self.dump(info.mode_is_json(), bool(info.context and info.context.get("wire_format")))
+
+
+def _to_float(amount) -> float:
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+        raise ValueError(f"Invalid amount: {amount!r}")
+
+    return float(amount)
+
+
+def _to_due_date(value: datetime | date | str) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time())
+
+    return value
+
+
+def _utc(due_date: datetime) -> datetime:
+    """
+    Returns the due date as a naive UTC datetime, so aware and naive due dates compare.
+    """
+    if due_date.tzinfo is None:
+        return due_date
+
+    return due_date.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class Position(BaseModel):
@@ -66,9 +322,9 @@ class Position(BaseModel):
     update_position_start: datetime | None = None
     update_position_end: datetime
     key_optin_tag: str = None
-    ur_list_resume: List[PositionUR] = None
-    total_ur_amount: float | None = 0
-    total_value_available: float | None = 0
+    ur_list_resume: URSchedule | None = None
+    total_ur_amount: Amount | None = 0
+    total_value_available: Amount | None = 0
     ur_list_last_update: datetime | None = None
     created_on: datetime = Field(default_factory=datetime.now)
     updated_on: datetime | None = None
@@ -108,42 +364,105 @@ class Position(BaseModel):
             Self: An instance of the class with the retrieved data.
         """
         api_path = "report"
-        auth = Authenticate.token(credential)
-
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.POSITIONS, api_path),
-                    headers={"Authorization": f"Bearer {auth.access_token.get_secret_value()}"},
-                    params={
-                        "payment_scheme": payment_scheme,
-                        "acquirer": acquirer,
-                        "asset_holder": asset_holder,
-                        "msc_customer": credential.document,
-                    },
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
 
-        if response.status_code == 200:
-            data = dict_int_to_float(response.json(), ["total_ur_amount", "total_value_available"])
+        return cached_model(
+            "position",
+            credential,
+            (payment_scheme, acquirer, asset_holder),
+            lambda headers: authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.POSITIONS, api_path),
+                params={
+                    "payment_scheme": payment_scheme,
+                    "acquirer": acquirer,
+                    "asset_holder": asset_holder,
+                    "msc_customer": credential.document,
+                },
+                headers=headers,
+                not_found_message="Position not found",
+            ),
+            cls._from_response_data,
+        )
+
+    @classmethod
+    async def aget_by_data(
+        cls,
+        credential: Credential,
+        payment_scheme: str,
+        acquirer: str,
+        asset_holder: str,
+    ) -> Self:
+        """
+        Async equivalent of Position.get_by_data.
+        """
+        api_path = "report"
+
+        def request(headers: dict):
+            return async_authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.POSITIONS, api_path),
+                params={
+                    "payment_scheme": payment_scheme,
+                    "acquirer": acquirer,
+                    "asset_holder": asset_holder,
+                    "msc_customer": credential.document,
+                },
+                headers=headers,
+                not_found_message="Position not found",
+            )
+
+        return await acached_model(
+            "position", credential, (payment_scheme, acquirer, asset_holder), request, cls._from_response_data
+        )
+
+    @classmethod
+    def _from_response_data(cls, data: dict) -> Self:
+        data = dict_cents_to_amount(data, ["total_ur_amount", "total_value_available"])
 
-            data["ur_list_resume"] = list_int_to_float(data["ur_list_resume"], ["ur_amount", "value_available"])
+        if data.get("ur_list_resume") is not None:
+            data["ur_list_resume"] = URSchedule.from_response_data(data["ur_list_resume"])
 
-            return cls(**data)
+        return cls(**data)
 
-        elif response.status_code == 204:
-            raise NotFound("Position not found")
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+class PositionHandle(BaseModel):
+    """
+    Reference to a requested position, to be fetched later with ``fetch``.
+    """
+
+    asset_holder: str
+    payment_scheme: str
+    acquirer: str
+
+    def fetch(self, credential: Credential) -> Position:
+        """
+        Fetches the referenced position.
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        Args:
+            credential (Credential): The credential used for authentication.
 
-        raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        Returns:
+            Position: The referenced position.
+        """
+        return Position.get_by_data(
+            credential=credential,
+            payment_scheme=self.payment_scheme,
+            acquirer=self.acquirer,
+            asset_holder=self.asset_holder,
+        )
+
+    async def afetch(self, credential: Credential) -> Position:
+        """
+        Async equivalent of PositionHandle.fetch.
+        """
+        return await Position.aget_by_data(
+            credential=credential,
+            payment_scheme=self.payment_scheme,
+            acquirer=self.acquirer,
+            asset_holder=self.asset_holder,
+        )
 
 
 def request_position_report(
@@ -152,7 +471,9 @@ def request_position_report(
     request_position_type: RequestPositionType,
     request_position_ur_list: RequestPositionURList,
     update_position_end: datetime = None,
-) -> tuple[List[Position], RequestPositionURList]:
+    concurrency: int = 8,
+    fetch_positions: bool = True,
+) -> tuple[List[Position] | List[PositionHandle], RequestPositionURList]:
     """
     Create request for position report.
 
@@ -163,14 +484,92 @@ def request_position_report(
         request_position_ur_list (RequestPositionURList): List of URs
         update_position_end (datetime, optional): End date of the recurrent position, used only for
         request_position_type = RequestPositionType.RECURRENT. Defaults to None.
+        concurrency (int, optional): The maximum number of positions fetched at the same time. Defaults to 8.
+        fetch_positions (bool, optional): Fetches the requested positions. If False, handles to fetch them
+        later are returned instead. Defaults to True.
 
     Returns:
-        tuple[List[Position], RequestPositionURList]: List of positions and RequestPositionURList with
-        requested positions errors
+        tuple[List[Position] | List[PositionHandle], RequestPositionURList]: List of positions (or handles)
+        and RequestPositionURList with requested positions errors
+    """
+    api_path = "report"
+
+    payload = _position_report_payload(
+        asset_holder, request_position_type, request_position_ur_list, update_position_end
+    )
+
+    response = authorized_execute(
+        credential,
+        "POST",
+        url=get_url(APINamespaces.POSITIONS, api_path),
+        json=payload,
+    )
+
+    handles = _position_handles(asset_holder, response.json(), request_position_ur_list)
+    _invalidate_positions(credential, handles)
+
+    if not fetch_positions:
+        return _delete_requested(handles, request_position_ur_list), request_position_ur_list
+
+    positions = run_concurrently(
+        {index: (lambda handle=handle: handle.fetch(credential)) for index, handle in enumerate(handles)},
+        concurrency=concurrency,
+    )
+
+    return _delete_fetched(handles, list(positions.values()), request_position_ur_list), request_position_ur_list
+
+
+async def arequest_position_report(
+    credential: Credential,
+    asset_holder: str,
+    request_position_type: RequestPositionType,
+    request_position_ur_list: RequestPositionURList,
+    update_position_end: datetime = None,
+    concurrency: int = 8,
+    fetch_positions: bool = True,
+) -> tuple[List[Position] | List[PositionHandle], RequestPositionURList]:
+    """
+    Async equivalent of request_position_report.
     """
     api_path = "report"
-    auth = Authenticate.token(credential)
 
+    payload = _position_report_payload(
+        asset_holder, request_position_type, request_position_ur_list, update_position_end
+    )
+
+    response = await async_authorized_execute(
+        credential,
+        "POST",
+        url=get_url(APINamespaces.POSITIONS, api_path),
+        json=payload,
+    )
+
+    handles = _position_handles(asset_holder, response.json(), request_position_ur_list)
+    _invalidate_positions(credential, handles)
+
+    if not fetch_positions:
+        return _delete_requested(handles, request_position_ur_list), request_position_ur_list
+
+    positions = await arun_concurrently(
+        {index: (lambda handle=handle: handle.afetch(credential)) for index, handle in enumerate(handles)},
+        concurrency=concurrency,
+    )
+
+    return _delete_fetched(handles, list(positions.values()), request_position_ur_list), request_position_ur_list
+
+
+def _invalidate_positions(credential: Credential, handles: List[PositionHandle]):
+    # A requested report replaces the position on the API, so the cached one must not be served.
+    for handle in handles:
+        invalidate_cached("position", credential, handle.payment_scheme, handle.acquirer, handle.asset_holder)
+
+
+def _position_report_payload(
+    asset_holder: str,
+    request_position_type: RequestPositionType,
+    request_position_ur_list: RequestPositionURList,
+    update_position_end: datetime = None,
+) -> dict:
     payload = {
         "asset_holder": asset_holder,
         "type": request_position_type.value,
@@ -182,55 +581,64 @@ def request_position_report(
             raise ValueError("Recurrent positions must have an end date 'update_position_end'")
         payload["update_position_end"] = update_position_end.strftime("%Y-%m-%d")
 
-    for i in range(5):
-        try:
-            response = requests.post(
-                url=get_url(APINamespaces.POSITIONS, api_path),
-                headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                json=payload,
+    return payload
+
+
+def _position_report_optin(response: dict, request_position_ur_list: RequestPositionURList) -> List[dict]:
+    """
+    Updates the requested URs with the opt-in errors and returns the successful opt-in items, which stay requested
+    until their positions are fetched.
+    """
+    successful = []
+    if response.get("optin", None):
+        for item in response["optin"]:
+            if item["success"]:
+                successful.append(item)
+            else:
+                request_position_ur_list.update_errors(
+                    payment_scheme=item["payment_scheme"],
+                    acquirer=item["acquirer"],
+                    error_message=item["msg_err"],
+                )
+
+    return successful
+
+
+def _position_handles(
+    asset_holder: str, response: dict, request_position_ur_list: RequestPositionURList
+) -> List[PositionHandle]:
+    return [
+        PositionHandle(asset_holder=asset_holder, payment_scheme=item["payment_scheme"], acquirer=item["acquirer"])
+        for item in _position_report_optin(response, request_position_ur_list)
+    ]
+
+
+def _delete_requested(
+    handles: List[PositionHandle], request_position_ur_list: RequestPositionURList
+) -> List[PositionHandle]:
+    for handle in handles:
+        request_position_ur_list.delete_one(payment_scheme=handle.payment_scheme, acquirer=handle.acquirer)
+
+    return handles
+
+
+def _delete_fetched(
+    handles: List[PositionHandle], results: List, request_position_ur_list: RequestPositionURList
+) -> List[Position]:
+    """
+    Deletes the requested URs whose positions were fetched, keeping the others with the error of their fetch, then
+    raises the first error.
+    """
+    for handle, result in zip(handles, results):
+        if isinstance(result, Exception):
+            request_position_ur_list.update_errors(
+                payment_scheme=handle.payment_scheme, acquirer=handle.acquirer, error_message=str(result)
             )
-            break
-        except Exception as e:
-            if i == 4:
-                raise e
-
-    if response.status_code == 200:
-        response = response.json()
-
-        positions = []
-        if response.get("optin", None):
-            for item in response["optin"]:
-                if item["success"]:
-                    positions.append(
-                        Position.get_by_data(
-                            credential=credential,
-                            payment_scheme=item["payment_scheme"],
-                            acquirer=item["acquirer"],
-                            asset_holder=asset_holder,
-                        )
-                    )
-                    request_position_ur_list.delete_one(
-                        payment_scheme=item["payment_scheme"], acquirer=item["acquirer"]
-                    )
-                else:
-                    request_position_ur_list.update_errors(
-                        payment_scheme=item["payment_scheme"],
-                        acquirer=item["acquirer"],
-                        error_message=item["msg_err"],
-                    )
-
-        return positions, request_position_ur_list
-
-    elif response.status_code == 400:
-        raise BadRequest(response.text)
-
-    elif response.status_code == 401:
-        raise Unauthorized("Wrong credentials")
-
-    elif response.status_code == 402:
-        raise BillingError(response.text)
-
-    elif response.status_code >= 500:
-        raise ServerError(response.text)
-
-    raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        else:
+            request_position_ur_list.delete_one(payment_scheme=handle.payment_scheme, acquirer=handle.acquirer)
+
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+    return results
@@ -0,0 +1,325 @@
+import csv
+import json
+import os
+from datetime import datetime
+from functools import lru_cache
+from inspect import isclass
+from types import UnionType
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from msc_sdk.authenticate import Credential
+from msc_sdk.recurrence.operation import Operation, OperationList, OperationReceivableUnit, Payment
+from msc_sdk.recurrence.rru import OperationResume, RecurrenceReceivableUnit, RecurrenceReceivableUnitList
+from msc_sdk.utils.money import Amount, Cents
+from msc_sdk.utils.pagination import iter_pages
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+Tables = Dict[str, List[dict]]
+
+# Each table: (model, nested list field holding its rows in the parent, parent table, (parent field, key column)).
+_OPERATION_TABLES = {
+    "operations": (Operation, None, None, None),
+    "operation_receivable_units": (
+        OperationReceivableUnit,
+        "operation_receivable_units",
+        "operations",
+        ("id", "operation_id"),
+    ),
+    "payments": (Payment, "payments", "operations", ("id", "operation_id")),
+}
+_RRU_TABLES = {
+    "rrus": (RecurrenceReceivableUnit, None, None, None),
+    "rru_operations": (OperationResume, "operations", "rrus", ("id", "rru_id")),
+}
+
+
+def iter_operation_tables(
+    credential: Credential,
+    recurrence_id: str,
+    page_size: int = 100,
+    msc_integrator: str = None,
+    prefetch: bool = True,
+) -> Iterator[Tables]:
+    """
+    Streams the operations of a recurrence as flat tables, one page at a time.
+
+    Each page is fetched in raw mode, so no model is built, and flattened into the ``operations``,
+    ``operation_receivable_units`` and ``payments`` tables; child rows carry the ``operation_id`` of their operation.
+
+    Args:
+        credential (Credential): The credential used for authentication.
+        recurrence_id (str): The id of the recurrence.
+        page_size (int, optional): The number of operations fetched per page. Defaults to 100.
+        msc_integrator (str, optional): Filters the operations of an integrator. Defaults to None.
+        prefetch (bool, optional): Fetches the next page in the background. Defaults to True.
+
+    Yields:
+        Tables: The rows of each table in the page.
+    """
+    pages = iter_pages(
+        lambda page: OperationList.get(credential, recurrence_id, page, page_size, msc_integrator, raw=True),
+        page_size,
+        prefetch=prefetch,
+    )
+    for page in pages:
+        yield _flatten(page, _OPERATION_TABLES)
+
+
+def iter_rru_tables(
+    credential: Credential,
+    recurrence_id: str,
+    page_size: int = 100,
+    msc_integrator: str = None,
+    prefetch: bool = True,
+) -> Iterator[Tables]:
+    """
+    Streams the receivable units of a recurrence as flat tables, one page at a time.
+
+    Works like iter_operation_tables, yielding the ``rrus`` and ``rru_operations`` tables; operation rows carry the
+    ``rru_id`` of their receivable unit.
+    """
+    pages = iter_pages(
+        lambda page: RecurrenceReceivableUnitList.get(
+            credential, recurrence_id, page, page_size, msc_integrator, raw=True
+        ),
+        page_size,
+        prefetch=prefetch,
+    )
+    for page in pages:
+        yield _flatten(page, _RRU_TABLES)
+
+
+def _flatten(items: List[dict], tables: dict) -> Tables:
+    """
+    Flattens raw API items into one list of rows per table.
+
+    Nested objects become prefixed columns (e.g. ``bank_account_ispb``), nested lists become rows of their child
+    table, and free-form values (dicts, lists and non-string values of untyped fields) are kept as JSON strings.
+    Amounts are exported in integer cents whatever the money mode of the SDK, so the files of every mode match.
+
+    Args:
+        items (List[dict]): The raw items of the root table.
+        tables (dict): The table layout, e.g. _OPERATION_TABLES.
+
+    Returns:
+        Tables: The rows of each table.
+    """
+    (root, (root_class, *_)), *children = tables.items()
+    rows = {name: [] for name in tables}
+
+    for item in items:
+        rows[root].append(_flat_row(root_class, item))
+
+        for name, (model_class, field_name, _, (parent_field, key)) in children:
+            for child in item.get(field_name) or []:
+                rows[name].append({key: item.get(parent_field), **_flat_row(model_class, child)})
+
+    return rows
+
+
+def _columns(tables: dict) -> Dict[str, List[Tuple[str, type]]]:
+    """
+    Returns the columns of each table and their Python types, derived from the models.
+    """
+    result = {}
+
+    for name, (model_class, _, _, parent_key) in tables.items():
+        result[name] = ([(parent_key[1], str)] if parent_key else []) + _model_columns(model_class)
+
+    return result
+
+
+def write_csv(table_pages: Iterable[Tables], directory: str, prefix: str = "") -> Dict[str, str]:
+    """
+    Writes streamed tables to one CSV file per table, page by page.
+
+    Args:
+        table_pages (Iterable[Tables]): The tables of each page, e.g. from iter_operation_tables.
+        directory (str): The directory where the files are written.
+        prefix (str, optional): A prefix of the file names. Defaults to "".
+
+    Returns:
+        Dict[str, str]: The path of the file of each table.
+    """
+    writers, files, paths = {}, [], {}
+    try:
+        for page in table_pages:
+            if not writers:
+                layout = _columns(_layout_of(page))
+
+                for name, table_columns in layout.items():
+                    paths[name] = os.path.join(directory, f"{prefix}{name}.csv")
+                    file = open(paths[name], "w", newline="")
+                    files.append(file)
+                    writers[name] = csv.DictWriter(file, [column for column, _ in table_columns], extrasaction="ignore")
+                    writers[name].writeheader()
+
+            for name, rows in page.items():
+                writers[name].writerows(rows)
+    finally:
+        for file in files:
+            file.close()
+
+    return paths
+
+
+def iter_record_batches(table_pages: Iterable[Tables]) -> Iterator[Dict[str, "pyarrow.RecordBatch"]]:
+    """
+    Converts streamed tables to Arrow record batches with a fixed schema per table.
+
+    Requires the optional ``pyarrow`` dependency (``pip install msc-sdk[arrow]``).
+
+    Args:
+        table_pages (Iterable[Tables]): The tables of each page, e.g. from iter_operation_tables.
+
+    Yields:
+        Dict[str, pyarrow.RecordBatch]: The record batch of each table in the page.
+    """
+    _require_pyarrow()
+    schemas = None
+
+    for page in table_pages:
+        if schemas is None:
+            schemas = _arrow_schemas(_layout_of(page))
+
+        yield {name: pyarrow.RecordBatch.from_pylist(rows, schema=schemas[name]) for name, rows in page.items()}
+
+
+def write_parquet(table_pages: Iterable[Tables], directory: str, prefix: str = "") -> Dict[str, str]:
+    """
+    Writes streamed tables to one Parquet file per table, a row group per page.
+
+    Requires the optional ``pyarrow`` dependency (``pip install msc-sdk[arrow]``).
+
+    Args:
+        table_pages (Iterable[Tables]): The tables of each page, e.g. from iter_operation_tables.
+        directory (str): The directory where the files are written.
+        prefix (str, optional): A prefix of the file names. Defaults to "".
+
+    Returns:
+        Dict[str, str]: The path of the file of each table.
+    """
+    _require_pyarrow()
+    writers, paths = {}, {}
+    try:
+        for batches in iter_record_batches(table_pages):
+            for name, batch in batches.items():
+                if name not in writers:
+                    paths[name] = os.path.join(directory, f"{prefix}{name}.parquet")
+                    writers[name] = pyarrow.parquet.ParquetWriter(paths[name], batch.schema)
+
+                if batch.num_rows:
+                    writers[name].write_batch(batch)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return paths
+
+
+def _arrow_schemas(tables: dict) -> Dict[str, "pyarrow.Schema"]:
+    """
+    Returns the Arrow schema of each table. Amounts are integer cents and datetimes are kept as the ISO strings sent
+    by the API.
+    """
+    _require_pyarrow()
+    types = {float: pyarrow.float64(), int: pyarrow.int64(), Cents: pyarrow.int64(), bool: pyarrow.bool_()}
+
+    return {
+        name: pyarrow.schema([(column, types.get(kind, pyarrow.string())) for column, kind in table_columns])
+        for name, table_columns in _columns(tables).items()
+    }
+
+
+def _layout_of(page: Tables) -> dict:
+    for layout in (_OPERATION_TABLES, _RRU_TABLES):
+        if page.keys() == layout.keys():
+            return layout
+
+    raise ValueError(f"Unknown tables: {', '.join(page)}")
+
+
+def _flat_row(model_class: Type[BaseModel], data: dict, prefix: str = "") -> dict:
+    row = {}
+
+    for name, alias, kind, nested in _fields(model_class):
+        value = data.get(name, data.get(alias))
+
+        if kind == "model":
+            row.update(_flat_row(nested, value or {}, f"{prefix}{name}_"))
+        elif kind == "scalar":
+            row[f"{prefix}{name}"] = _cell(nested, value)
+
+    return row
+
+
+def _cell(column_type: type, value: Any):
+    if value is None:
+        return None
+
+    if column_type is Cents:
+        return int(value if isinstance(value, Cents) else Cents.from_amount(value))
+
+    if isinstance(value, (dict, list)) or (column_type is str and not isinstance(value, str)):
+        return json.dumps(value, default=str)
+
+    return value
+
+
+def _model_columns(model_class: Type[BaseModel], prefix: str = "") -> List[Tuple[str, type]]:
+    result = []
+
+    for name, _, kind, nested in _fields(model_class):
+        if kind == "model":
+            result.extend(_model_columns(nested, f"{prefix}{name}_"))
+        elif kind == "scalar":
+            result.append((f"{prefix}{name}", nested))
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def _fields(model_class: Type[BaseModel]) -> List[Tuple[str, str | None, str, type]]:
+    """
+    Classifies the fields of the model as nested models, child lists (own tables) or scalar columns.
+    """
+    result = []
+
+    for name, field in model_class.model_fields.items():
+        annotation = field.annotation
+
+        if get_origin(annotation) in (Union, UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation = args[0] if len(args) == 1 else str
+
+        if get_origin(annotation) in (list, List):
+            item = (get_args(annotation) or (None,))[0]
+
+            if isclass(item) and issubclass(item, BaseModel):
+                result.append((name, field.alias, "list", item))
+                continue
+
+        if isclass(annotation) and issubclass(annotation, BaseModel):
+            result.append((name, field.alias, "model", annotation))
+        elif annotation is Amount or field.metadata == list(Amount.__metadata__):
+            result.append((name, field.alias, "scalar", Cents))
+        elif annotation in (float, int, bool):
+            result.append((name, field.alias, "scalar", annotation))
+        else:
+            result.append((name, field.alias, "scalar", datetime if annotation is datetime else str))
+
+    return result
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet exports, install it with 'pip install msc-sdk[arrow]'"
+        )
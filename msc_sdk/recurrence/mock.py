@@ -0,0 +1,235 @@
+import os
+import random
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from msc_sdk.commons import BankAccount
+from msc_sdk.enums import AccountType
+
+_asset_holders = ["15365935000149"]
+_acquirers = ["01027058000191", "15111975000164"]
+_payment_schemes = ["VCC", "MCC", "ECC"]
+_discount_rate = 0.01
+
+_mock_data = None
+_mock_data_lock = threading.Lock()
+
+
+def get_mock_data() -> dict:
+    """
+    Returns the mock dataset used by the recurrence resources in the DEV environment, building it on first use.
+
+    The dataset is seeded by the ``MSC_MOCK_SEED`` environment variable, if set.
+    """
+    global _mock_data
+
+    if _mock_data is None:
+        with _mock_data_lock:
+            if _mock_data is None:
+                seed = os.getenv("MSC_MOCK_SEED")
+                _mock_data = build_mock_data(seed=int(seed) if seed is not None else None)
+
+    return _mock_data
+
+
+def seed_mock_data(seed: int = None) -> dict:
+    """
+    Rebuilds the mock dataset with the given seed, so ids and amounts are reproducible between runs.
+
+    Args:
+        seed (int, optional): The seed of the random generator. Defaults to None, for a random dataset.
+
+    Returns:
+        dict: The new mock dataset.
+    """
+    global _mock_data
+
+    with _mock_data_lock:
+        _mock_data = build_mock_data(seed=seed)
+
+    return _mock_data
+
+
+def build_mock_data(seed: int = None) -> dict:
+    """
+    Builds a mock dataset of recurrences, operations and recurrence receivable units.
+
+    Args:
+        seed (int, optional): The seed of the random generator used for ids and amounts. Defaults to None.
+
+    Returns:
+        dict: The mock dataset.
+    """
+    rng = random.Random(seed)
+    msc_customer = os.getenv("MSC_DOCUMENT")
+    bank_account = BankAccount(
+        branch="1234",
+        account="123456",
+        account_digit="1",
+        account_type=AccountType.CHECKING_ACCOUNT,
+        ispb="60701190",
+        document_type="CNPJ",
+        document_number="74634410000120",
+    )
+
+    # MOCK URS
+    urs_count = 5
+    urs_list = []
+
+    delta_months = 1
+    base_delta_days = 2
+    for _ in range(urs_count):
+        for asset_holder in _asset_holders:
+            for acquirer in _acquirers:
+                for payment_scheme in _payment_schemes:
+                    delta_days = base_delta_days
+                    for m in range(delta_months):
+                        urs_list.append(
+                            dict(
+                                id=_uuid4(rng),
+                                asset_holder=_asset_holders,
+                                payment_scheme=payment_scheme,
+                                acquirer=acquirer,
+                                due_date=datetime.now() + timedelta(days=(m + 1) * 30 - delta_days),
+                                amount=round(rng.uniform(10.00, 1000.00), 2),
+                            )
+                        )
+                        delta_days -= 1
+
+    #  MOCK RECURRENCE
+    recurrence_ids = [_uuid4(rng), _uuid4(rng)]
+
+    recurrence_list = []
+    history = {"updated_data": [], "snapshot": {}}
+    for asset_holder in _asset_holders:
+        for recurrence_id in recurrence_ids:
+            for acquirer in _acquirers:
+                recurrence_list.append(
+                    dict(
+                        id=recurrence_id,
+                        asset_holder=asset_holder,
+                        payment_scheme=_payment_schemes,
+                        msc_customer=msc_customer,
+                        msc_integrator=_uuid4(rng),
+                        acquirer=acquirer,
+                        bank_account=bank_account,
+                        ur_percentage=100,
+                        discount_rate_per_year=12,
+                        created_at=datetime.now(),
+                        history=history,
+                    )
+                )
+
+    #  MOCK OPERATION
+    operation_list = []
+
+    for recurrence in recurrence_list:
+        operation_receivable_units = []
+
+        total_amount = 0
+        total_discount_amount = 0
+        for ur in urs_list:
+            days_to_charge = (ur["due_date"] - datetime.now()).days
+
+            total_amount += ur["amount"]
+            total_discount_amount += round(ur["amount"] * (_discount_rate / 30) * days_to_charge, 2)
+
+            operation_receivable_units.append(
+                dict(
+                    ur_id=_uuid4(rng),
+                    msc_customer=msc_customer,
+                    asset_holder=recurrence["asset_holder"],
+                    payment_scheme=ur["payment_scheme"],
+                    acquirer=ur["acquirer"],
+                    due_date=ur["due_date"],
+                    payment_due_date=ur["due_date"],
+                    amount=ur["amount"],
+                    discount_rate_per_year=recurrence["discount_rate_per_year"],
+                    discount_rate=_discount_rate,
+                    discount_amount=total_discount_amount,
+                    amount_due=ur["amount"] - total_discount_amount,
+                )
+            )
+
+        operation_list.append(
+            dict(
+                id=_uuid4(rng),
+                operation_date=datetime.now() - timedelta(days=base_delta_days),
+                recurrence_id=recurrence["id"],
+                asset_holder=recurrence["asset_holder"],
+                operation_receivable_units=operation_receivable_units,
+                amount=total_amount,
+                amount_due=total_amount - total_discount_amount,
+                amount_paid=0 if base_delta_days == 0 else total_amount - total_discount_amount,
+                bank_account=bank_account,
+                created_at=datetime.now() - timedelta(days=base_delta_days),
+            )
+        )
+
+    #  MOCK RRU
+    rru_list = []
+
+    for operation in operation_list:
+        for ur in operation["operation_receivable_units"]:
+            operations_resume = [
+                dict(
+                    operation_id=_uuid4(rng),
+                    operation_date=operation["operation_date"] - timedelta(days=1),
+                    previous_ur_amount=0,
+                    previous_total_operated_amount_gross=0,
+                    previous_total_operated_amount_net=0,
+                    ur_amount=ur["amount"] - 5,
+                    operated_amount_gross=ur["amount"] - 5,
+                    operated_amount_net=ur["amount_due"] - 4.5,
+                    total_operated_amount_gross=ur["amount"] - 5,
+                    total_operated_amount_net=ur["amount_due"] - 4.5,
+                ),
+                dict(
+                    operation_id=operation["id"],
+                    operation_date=operation["operation_date"],
+                    previous_ur_amount=ur["amount"] - 5,
+                    previous_total_operated_amount_gross=ur["amount"] - 5,
+                    previous_total_operated_amount_net=ur["amount_due"] - 4.5,
+                    ur_amount=ur["amount"],
+                    operated_amount_gross=5,
+                    operated_amount_net=4.5,
+                    total_operated_amount_gross=ur["amount"],
+                    total_operated_amount_net=ur["amount_due"],
+                ),
+            ]
+            rru_list.append(
+                dict(
+                    id=_uuid4(rng),
+                    recurrence_id=operation["recurrence_id"],
+                    ur_id=ur["ur_id"],
+                    asset_holder=ur["asset_holder"],
+                    msc_integrator=operation["asset_holder"],
+                    msc_customer=msc_customer,
+                    acquirer=ur["acquirer"],
+                    payment_scheme=ur["payment_scheme"],
+                    due_date=ur["due_date"],
+                    amount=ur["amount"],
+                    total_operated_amount_gross=ur["amount"],
+                    total_operated_amount_net=ur["amount_due"],
+                    available_amount=0,
+                    created_at=datetime.now() - timedelta(days=base_delta_days),
+                    operations=operations_resume,
+                    previous_amount=ur["amount"] - 5,
+                    previous_operated_amount_gross=ur["amount"] - 5,
+                    previous_operated_amount_net=ur["amount_due"] - 4.5,
+                    history=history,
+                )
+            )
+
+    return dict(
+        msc_customer=msc_customer,
+        asset_holders=_asset_holders,
+        recurrence_list=recurrence_list,
+        operation_list=operation_list,
+        rru_list=rru_list,
+    )
+
+
+def _uuid4(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
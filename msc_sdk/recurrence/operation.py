@@ -1,21 +1,22 @@
 from datetime import datetime
-from typing import Any, Dict, List, Self
+from typing import Any, AsyncIterator, Dict, Iterator, List, Self
 
-import requests
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ValidationInfo, model_validator
 
-from msc_sdk.authenticate import Credential, Authenticate
+from msc_sdk.authenticate import Credential, authorized_execute, async_authorized_execute
 from msc_sdk.commons import BankAccount
 from msc_sdk.config_sdk import Environment, ConfigSDK
 from msc_sdk.enums import APINamespaces
-from msc_sdk.errors import NotFound, Unauthorized, ServerError
-from msc_sdk.recurrence import mock_data
-from msc_sdk.utils.api_tools import get_url
-from msc_sdk.utils.converters import dict_int_to_float, list_int_to_float
+from msc_sdk.errors import NotFound
+from msc_sdk.recurrence.mock import get_mock_data
+from msc_sdk.utils.api_tools import get_url, cached_response, acached_response
+from msc_sdk.utils.converters import dict_int_to_float, list_int_to_float, dict_cents_to_amount, list_cents_to_amount
+from msc_sdk.utils.money import Amount, Cents
+from msc_sdk.utils.pagination import iter_pages, aiter_pages, fetch_pages, afetch_pages
 
 
 class Payment(BaseModel):
-    amount_paid: float
+    amount_paid: Amount
     bank_account: BankAccount
     payment_date: datetime
     proof_of_payment: Any = None
@@ -25,10 +26,14 @@ class Payment(BaseModel):
         validate_assignment = True
 
     @model_validator(mode="before")
-    def from_int_to_float(self):
+    def from_int_to_float(self, info: ValidationInfo):
+        # In wire format, the integer cents are read by the Amount fields themselves.
+        if info.context and info.context.get("wire_format"):
+            return self
+
         in_field_list = ["amount_paid"]
-        in_field_list = [field for field in in_field_list if not isinstance(self.get(field), float)]
-        convertor = dict_int_to_float(self, in_field_list)
+        in_field_list = [field for field in in_field_list if not isinstance(self.get(field), (float, Cents))]
+        convertor = dict_cents_to_amount(self, in_field_list)
         return convertor
 
 
@@ -39,11 +44,11 @@ class OperationReceivableUnit(BaseModel):
     acquirer: str
     due_date: datetime
     payment_due_date: datetime
-    amount: float
+    amount: Amount
     discount_rate_per_year: float
     discount_rate: float = 0
-    discount_amount: float = 0
-    amount_due: float = 0
+    discount_amount: Amount = 0
+    amount_due: Amount = 0
 
     class Config:
         validate_assignment = True
@@ -57,9 +62,9 @@ class Operation(BaseModel):
     msc_customer: str
     msc_integrator: str | None = None
     operation_receivable_units: List[OperationReceivableUnit] = []
-    amount: float = 0
-    amount_due: float = 0
-    amount_paid: float = 0
+    amount: Amount = 0
+    amount_due: Amount = 0
+    amount_paid: Amount = 0
     bank_account: BankAccount
     payments: List[Payment] = []
     created_at: datetime
@@ -73,57 +78,88 @@ class Operation(BaseModel):
         cls, credential: Credential, recurrence_id: str, operation_id: str, msc_integrator: str = None
     ) -> Self:
         if ConfigSDK.get_config().environment == Environment.DEV:
-            for operation in mock_data["operation_list"]:
+            for operation in get_mock_data()["operation_list"]:
+                if operation["id"] == operation_id:
+                    return cls(**operation)
+
+            raise NotFound("Operation not found")
+
+        api_path = f"{recurrence_id}/operations/{operation_id}"
+        param = {"msc_customer": credential.document}
+
+        if msc_integrator:
+            param["msc_integrator"] = msc_integrator
+
+        data = cached_response(
+            "operation",
+            credential,
+            (recurrence_id, operation_id, msc_integrator),
+            lambda: authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.RECURRENCES, api_path),
+                params=param,
+                not_found_message="Contract not found",
+            ).json(),
+        )
+
+        return cls._from_response_data(data)
+
+    @classmethod
+    async def aget_by_id(
+        cls, credential: Credential, recurrence_id: str, operation_id: str, msc_integrator: str = None
+    ) -> Self:
+        if ConfigSDK.get_config().environment == Environment.DEV:
+            for operation in get_mock_data()["operation_list"]:
                 if operation["id"] == operation_id:
                     return cls(**operation)
 
-            return NotFound("Operation not found")
+            raise NotFound("Operation not found")
 
         api_path = f"{recurrence_id}/operations/{operation_id}"
-        auth = Authenticate.token(credential)
         param = {"msc_customer": credential.document}
 
         if msc_integrator:
             param["msc_integrator"] = msc_integrator
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=param,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        async def request() -> dict:
+            response = await async_authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.RECURRENCES, api_path),
+                params=param,
+                not_found_message="Contract not found",
+            )
 
-        if response.status_code == 200:
-            operation_json = response.json()
-            data = dict_int_to_float(operation_json, ["amount", "amount_due", "amount_paid"])
+            return response.json()
 
-            if data.get("operation_receivable_units", None):
-                data["operation_receivable_units"] = list_int_to_float(
-                    data["operation_receivable_units"],
-                    ["amount", "discount_rate_per_year", "discount_rate", "discount_amount", "amount_due"],
-                )
+        data = await acached_response("operation", credential, (recurrence_id, operation_id, msc_integrator), request)
 
-            if data.get("payments", None):
-                data["payments"] = list_int_to_float(data["payments"], ["amount_paid"])
+        return cls._from_response_data(data)
 
-            return cls(**data)
+    @classmethod
+    def _from_response_data(cls, data: dict) -> Self:
+        return cls(**cls._convert_response_data(data))
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+    @classmethod
+    def _convert_response_data(cls, data: dict) -> dict:
+        """
+        Converts the response data of a Operation to the values of the model, e.g. amounts from cents.
+        """
+        data = dict_cents_to_amount(data, ["amount", "amount_due", "amount_paid"])
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        if data.get("operation_receivable_units", None):
+            data["operation_receivable_units"] = list_int_to_float(
+                data["operation_receivable_units"], ["discount_rate_per_year", "discount_rate"]
+            )
+            data["operation_receivable_units"] = list_cents_to_amount(
+                data["operation_receivable_units"], ["amount", "discount_amount", "amount_due"]
+            )
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        if data.get("payments", None):
+            data["payments"] = list_cents_to_amount(data["payments"], ["amount_paid"])
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return data
 
 
 class OperationList(BaseModel):
@@ -131,12 +167,18 @@ class OperationList(BaseModel):
 
     @classmethod
     def get(
-        cls, credential: Credential, recurrence_id: str, page: int, page_size: int, msc_integrator: str = None
-    ) -> Self:
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page: int,
+        page_size: int,
+        msc_integrator: str = None,
+        raw: bool = False,
+    ) -> Self | List[dict]:
         if ConfigSDK.get_config().environment == Environment.DEV:
-            return cls(operations=mock_data["operation_list"])
+            operations = get_mock_data()["operation_list"][(page - 1) * page_size : page * page_size]
 
-        auth = Authenticate.token(credential)
+            return [dict(operation) for operation in operations] if raw else cls(operations=operations)
 
         api_path = f"{recurrence_id}/operations/list"
         params = {"msc_customer": credential.document, "page": page, "page_size": page_size}
@@ -144,46 +186,168 @@ class OperationList(BaseModel):
         if msc_integrator:
             params["msc_integrator"] = msc_integrator
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=params,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        response = authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=params,
+            not_found_message="Contract not found",
+        )
 
-        if response.status_code == 200:
-            operation_list_json = response.json()["operations"]
+        return cls._from_response_data(response.json(), raw)
 
-            operation_list = []
-            for operation in operation_list_json:
-                data = dict_int_to_float(operation, ["amount", "amount_due", "amount_paid"])
+    @classmethod
+    async def aget(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page: int,
+        page_size: int,
+        msc_integrator: str = None,
+        raw: bool = False,
+    ) -> Self | List[dict]:
+        if ConfigSDK.get_config().environment == Environment.DEV:
+            operations = get_mock_data()["operation_list"][(page - 1) * page_size : page * page_size]
+
+            return [dict(operation) for operation in operations] if raw else cls(operations=operations)
+
+        api_path = f"{recurrence_id}/operations/list"
+        params = {"msc_customer": credential.document, "page": page, "page_size": page_size}
 
-                if data.get("operation_receivable_units", None):
-                    data["operation_receivable_units"] = list_int_to_float(
-                        data["operation_receivable_units"],
-                        ["amount", "discount_rate_per_year", "discount_rate", "discount_amount", "amount_due"],
-                    )
+        if msc_integrator:
+            params["msc_integrator"] = msc_integrator
 
-                if data.get("payments", None):
-                    data["payments"] = list_int_to_float(data["payments"], ["amount_paid"])
+        response = await async_authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=params,
+            not_found_message="Contract not found",
+        )
 
-                operation_list.append(Operation(**data))
+        return cls._from_response_data(response.json(), raw)
 
-            return cls(operations=operation_list)
+    @classmethod
+    def iter_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        prefetch: bool = False,
+        raw: bool = False,
+    ) -> Iterator[Operation | dict]:
+        """
+        Lazily walks every page of operations of a recurrence, yielding one operation at a time.
+
+        Args:
+            credential (Credential): The credential used for authentication.
+            recurrence_id (str): The id of the recurrence.
+            page_size (int, optional): The number of operations fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Filters the operations of an integrator. Defaults to None.
+            prefetch (bool, optional): Fetches the next page in the background. Defaults to False.
+            raw (bool, optional): Returns the operations as the plain API dicts, with the amounts converted,
+            instead of models, which skips building and validating the models. Defaults to False.
+
+        Yields:
+            Operation | dict: Each operation of the recurrence.
+        """
+        pages = iter_pages(
+            lambda page: cls._page_items(cls.get(credential, recurrence_id, page, page_size, msc_integrator, raw)),
+            page_size,
+            prefetch=prefetch,
+        )
+        for page in pages:
+            yield from page
+
+    @classmethod
+    async def aiter_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        prefetch: bool = False,
+        raw: bool = False,
+    ) -> AsyncIterator[Operation | dict]:
+        """
+        Async equivalent of OperationList.iter_all.
+        """
+
+        async def fetch_page(page: int) -> List[Operation | dict]:
+            return cls._page_items(await cls.aget(credential, recurrence_id, page, page_size, msc_integrator, raw))
+
+        async for page in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            for operation in page:
+                yield operation
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+    @classmethod
+    def get_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        concurrency: int = 4,
+        raw: bool = False,
+    ) -> Self | List[dict]:
+        """
+        Bulk exports every page of operations of a recurrence, fetching up to ``concurrency`` pages at a time.
+
+        Args:
+            credential (Credential): The credential used for authentication.
+            recurrence_id (str): The id of the recurrence.
+            page_size (int, optional): The number of operations fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Filters the operations of an integrator. Defaults to None.
+            concurrency (int, optional): The maximum number of pages fetched at the same time. Defaults to 4.
+            raw (bool, optional): Returns the operations as the plain API dicts, with the amounts converted,
+            instead of models, which skips building and validating the models. Defaults to False.
+
+        Returns:
+            Self | List[dict]: Every Operation, in page order.
+        """
+        pages = fetch_pages(
+            lambda page: cls._page_items(cls.get(credential, recurrence_id, page, page_size, msc_integrator, raw)),
+            page_size,
+            concurrency=concurrency,
+        )
+
+        items = [item for page in pages for item in page]
+
+        return items if raw else cls(operations=items)
+
+    @classmethod
+    async def aget_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        concurrency: int = 4,
+        raw: bool = False,
+    ) -> Self | List[dict]:
+        """
+        Async equivalent of OperationList.get_all.
+        """
+
+        async def fetch_page(page: int) -> List[Operation | dict]:
+            return cls._page_items(await cls.aget(credential, recurrence_id, page, page_size, msc_integrator, raw))
+
+        pages = await afetch_pages(fetch_page, page_size, concurrency=concurrency)
+
+        items = [item for page in pages for item in page]
+
+        return items if raw else cls(operations=items)
+
+    @classmethod
+    def _from_response_data(cls, data: dict, raw: bool = False) -> Self | List[dict]:
+        operations = [Operation._convert_response_data(operation) for operation in data["operations"]]
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        if raw:
+            return operations
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        return cls(operations=[Operation(**operation) for operation in operations])
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+    @staticmethod
+    def _page_items(page: Self | List[dict]) -> List[Operation | dict]:
+        return page if isinstance(page, list) else page.operations
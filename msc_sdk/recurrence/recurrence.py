@@ -1,18 +1,18 @@
 import enum
 from datetime import datetime
-from typing import Self, List
+from typing import AsyncIterator, Iterable, Iterator, List, Self
 
-import requests
 from pydantic import BaseModel, field_validator
 
-from msc_sdk.authenticate import Credential, Authenticate
+from msc_sdk.authenticate import Credential, authorized_execute, async_authorized_execute
 from msc_sdk.commons import BankAccount
 from msc_sdk.config_sdk import ConfigSDK, Environment
 from msc_sdk.enums import APINamespaces
-from msc_sdk.errors import NotFound, Unauthorized, ServerError
-from msc_sdk.recurrence import mock_data
-from msc_sdk.utils.api_tools import get_url
+from msc_sdk.recurrence.mock import get_mock_data
+from msc_sdk.utils.api_tools import get_url, cached_response, acached_response, invalidate_cached
+from msc_sdk.utils.concurrency import run_concurrently, arun_concurrently
 from msc_sdk.utils.converters import dict_float_to_int, dict_int_to_float
+from msc_sdk.utils.pagination import iter_pages, aiter_pages, fetch_pages, afetch_pages
 from msc_sdk.utils.validators import validate_cnpj
 
 
@@ -34,6 +34,23 @@ class PaymentScheme(enum.Enum):
     ELO = "ECC"
 
 
+class RecurrenceSpec(BaseModel):
+    """
+    The data of a recurrence to create with Recurrence.new_many.
+    """
+
+    asset_holder: str
+    acquirer: str
+    bank_account: BankAccount
+    ur_percentage: int
+    discount_rate_per_year: float
+    payment_scheme: list[PaymentScheme]
+
+    class Config:
+        validate_assignment = True
+        use_enum_values = True
+
+
 class Recurrence(BaseModel):
     id: str = None
     status: RecurrenceStatus = RecurrenceStatus.PENDING
@@ -74,234 +91,277 @@ class Recurrence(BaseModel):
         payment_scheme: list[PaymentScheme],
     ) -> "Recurrence":
         if ConfigSDK.get_config().environment == Environment.DEV:
-            return cls(**mock_data["recurrence_list"][0])
-
-        auth = Authenticate.token(credential)
-
-        body = {
-            "msc_customer": credential.document,
-            "asset_holder": asset_holder,
-            "acquirer": acquirer,
-            "bank_account": bank_account.model_dump(),
-            "ur_percentage": ur_percentage,
-            "discount_rate_per_year": discount_rate_per_year,
-            "payment_scheme": payment_scheme,
-        }
+            return cls(**get_mock_data()["recurrence_list"][0])
+
+        body = _new_body(
+            credential, asset_holder, acquirer, bank_account, ur_percentage, discount_rate_per_year, payment_scheme
+        )
 
-        body = dict_float_to_int(body, ["discount_rate_per_year"])
+        response = authorized_execute(
+            credential,
+            "POST",
+            url=get_url(APINamespaces.RECURRENCES),
+            json=body,
+        )
+
+        return cls._from_response_data(response.json())
+
+    @classmethod
+    async def anew(
+        cls,
+        credential: Credential,
+        asset_holder: str,
+        acquirer: str,
+        bank_account: BankAccount,
+        ur_percentage: int,
+        discount_rate_per_year: float,
+        payment_scheme: list[PaymentScheme],
+    ) -> "Recurrence":
+        if ConfigSDK.get_config().environment == Environment.DEV:
+            return cls(**get_mock_data()["recurrence_list"][0])
 
-        for i in range(5):
-            try:
-                response = requests.post(
-                    url=get_url(APINamespaces.RECURRENCES),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    json=body,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        response = await async_authorized_execute(
+            credential,
+            "POST",
+            url=get_url(APINamespaces.RECURRENCES),
+            json=_new_body(
+                credential, asset_holder, acquirer, bank_account, ur_percentage, discount_rate_per_year, payment_scheme
+            ),
+        )
 
-        if response.status_code == 200:
-            data = dict_int_to_float(response.json(), ["discount_rate_per_year"])
-            recurrence = cls(**data)
+        return cls._from_response_data(response.json())
 
-            return recurrence
+    @classmethod
+    def new_many(
+        cls, specs: Iterable[RecurrenceSpec], credential: Credential, concurrency: int = 8
+    ) -> List[Self | Exception]:
+        """
+        A class method to create many recurrences, submitting up to ``concurrency`` of them at a time.
+
+        The requests share the connection pool of the SDK transport and the cached token of the credential. A failed
+        creation is not retried on server errors, as for Recurrence.new, so a recurrence is never created twice.
+
+        Parameters:
+            specs (Iterable[RecurrenceSpec]): The recurrences to create, e.g. one per acquirer of a merchant.
+            credential (Credential): The credential object used for authentication.
+            concurrency (int, optional): The maximum number of recurrences created at the same time. Defaults to 8.
+
+        Returns:
+            List[Self | Exception]: The created recurrence of each spec, or the error raised while creating it, in
+            the order of the specs.
+        """
+        calls = {
+            index: (lambda spec=spec: cls.new(credential, **_spec_arguments(spec))) for index, spec in enumerate(specs)
+        }
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        return list(run_concurrently(calls, concurrency=concurrency).values())
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+    @classmethod
+    async def anew_many(
+        cls, specs: Iterable[RecurrenceSpec], credential: Credential, concurrency: int = 8
+    ) -> List[Self | Exception]:
+        """
+        Async equivalent of Recurrence.new_many.
+        """
+        calls = {
+            index: (lambda spec=spec: cls.anew(credential, **_spec_arguments(spec))) for index, spec in enumerate(specs)
+        }
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return list((await arun_concurrently(calls, concurrency=concurrency)).values())
 
     @classmethod
     def get_by_id(cls, credential: Credential, recurrence_id: str) -> Self:
         if ConfigSDK.get_config().environment == Environment.DEV:
-            for recurrence in mock_data["recurrence_list"]:
+            for recurrence in get_mock_data()["recurrence_list"]:
                 if recurrence["id"] == recurrence_id:
                     return cls(**recurrence)
 
-        auth = Authenticate.token(credential)
-
         param = {"recurrence_id": recurrence_id}
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=param,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
-
-        if response.status_code == 200:
-            recurrence_json = response.json()
-            data = dict_int_to_float(recurrence_json, ["discount_rate_per_year"])
-            recurrence = cls(**data)
+        data = cached_response(
+            "recurrence",
+            credential,
+            (recurrence_id,),
+            lambda: authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.RECURRENCES),
+                params=param,
+                not_found_message="Contract not found",
+            ).json(),
+        )
+
+        return cls._from_response_data(data)
 
-            return recurrence
-
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+    @classmethod
+    async def aget_by_id(cls, credential: Credential, recurrence_id: str) -> Self:
+        if ConfigSDK.get_config().environment == Environment.DEV:
+            for recurrence in get_mock_data()["recurrence_list"]:
+                if recurrence["id"] == recurrence_id:
+                    return cls(**recurrence)
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        async def request() -> dict:
+            response = await async_authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.RECURRENCES),
+                params={"recurrence_id": recurrence_id},
+                not_found_message="Contract not found",
+            )
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+            return response.json()
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return cls._from_response_data(await acached_response("recurrence", credential, (recurrence_id,), request))
 
     @classmethod
     def get_by_contract_key(cls, credential: Credential, contract_key: str) -> Self | None:
-        auth = Authenticate.token(credential)
 
         param = {"msc_customer": credential.document, "contract_key": contract_key}
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=param,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
-
-        if response.status_code == 200:
-            recurrence_json = response.json()
-            data = dict_int_to_float(recurrence_json, ["discount_rate_per_year"])
-            return cls(**data)
+        response = authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES),
+            params=param,
+            not_found_message="Contract not found",
+        )
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+        return cls._from_response_data(response.json())
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+    @classmethod
+    async def aget_by_contract_key(cls, credential: Credential, contract_key: str) -> Self | None:
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        response = await async_authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES),
+            params={"msc_customer": credential.document, "contract_key": contract_key},
+            not_found_message="Contract not found",
+        )
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return cls._from_response_data(response.json())
 
     @classmethod
     def cancel(cls, credential: Credential, recurrence_id: str, cancel_reason: RecurrenceCancelReason) -> Self:
-        auth = Authenticate.token(credential)
 
         api_path = f"{recurrence_id}/cancel"
         params = {"cancel_reason": cancel_reason.value}
 
-        for i in range(5):
-            try:
-                response = requests.patch(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=params,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        response = authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=params,
+            not_found_message="Contract not found",
+        )
+
+        invalidate_cached("recurrence", credential, recurrence_id)
 
-        if response.status_code == 200:
-            recurrence = cls(**response.json())
+        recurrence = cls(**response.json())
 
-            return recurrence
+        return recurrence
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+    @classmethod
+    async def acancel(cls, credential: Credential, recurrence_id: str, cancel_reason: RecurrenceCancelReason) -> Self:
+
+        api_path = f"{recurrence_id}/cancel"
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        response = await async_authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params={"cancel_reason": cancel_reason.value},
+            not_found_message="Contract not found",
+        )
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        invalidate_cached("recurrence", credential, recurrence_id)
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return cls(**response.json())
 
     @classmethod
     def update_bank_account(cls, credential: Credential, recurrence_id: str, bank_account: BankAccount) -> Self:
-        auth = Authenticate.token(credential)
 
         api_path = f"{recurrence_id}/bank-account"
 
-        for i in range(5):
-            try:
-                response = requests.patch(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    json=bank_account.model_dump(),
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        response = authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            json=bank_account.model_dump(),
+            not_found_message="Contract not found",
+        )
 
-        if response.status_code == 200:
-            bank_account = BankAccount(**response.json())
+        invalidate_cached("recurrence", credential, recurrence_id)
 
-            return bank_account
+        bank_account = BankAccount(**response.json())
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+        return bank_account
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+    @classmethod
+    async def aupdate_bank_account(
+        cls, credential: Credential, recurrence_id: str, bank_account: BankAccount
+    ) -> BankAccount:
+
+        api_path = f"{recurrence_id}/bank-account"
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        response = await async_authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            json=bank_account.model_dump(),
+            not_found_message="Contract not found",
+        )
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        invalidate_cached("recurrence", credential, recurrence_id)
+
+        return BankAccount(**response.json())
 
     @classmethod
     def update_discount_rate_per_year(
         cls, credential: Credential, recurrence_id: str, new_discount_rate_per_year: float
     ) -> Self:
-        auth = Authenticate.token(credential)
 
         api_path = f"{recurrence_id}/discount-rate-per-year"
         params = {"new_discount_rate": new_discount_rate_per_year}
 
-        for i in range(5):
-            try:
-                response = requests.patch(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=params,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        response = authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=params,
+            not_found_message="Contract not found",
+        )
+
+        invalidate_cached("recurrence", credential, recurrence_id)
+
+        recurrence = cls(**response.json())
+
+        return recurrence
+
+    @classmethod
+    async def aupdate_discount_rate_per_year(
+        cls, credential: Credential, recurrence_id: str, new_discount_rate_per_year: float
+    ) -> Self:
 
-        if response.status_code == 200:
-            recurrence = cls(**response.json())
+        api_path = f"{recurrence_id}/discount-rate-per-year"
 
-            return recurrence
+        response = await async_authorized_execute(
+            credential,
+            "PATCH",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params={"new_discount_rate": new_discount_rate_per_year},
+            not_found_message="Contract not found",
+        )
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+        invalidate_cached("recurrence", credential, recurrence_id)
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+        return cls(**response.json())
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+    @classmethod
+    def _from_response_data(cls, data: dict) -> Self:
+        data = dict_int_to_float(data, ["discount_rate_per_year"])
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        return cls(**data)
 
 
 class RecurrenceList(BaseModel):
@@ -309,43 +369,159 @@ class RecurrenceList(BaseModel):
 
     @classmethod
     def get(cls, credential: Credential, page: int, page_size: int, msc_integrator: str = None) -> Self:
-        auth = Authenticate.token(credential)
 
         api_path = "list"
-        params = {"masc_customer": credential.document, "page": page, "page_size": page_size}
+        params = {"msc_customer": credential.document, "page": page, "page_size": page_size}
+
+        if msc_integrator:
+            params["msc_integrator"] = msc_integrator
+
+        response = authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=params,
+            not_found_message="Contract not found",
+        )
+
+        return cls._from_response_data(response.json())
+
+    @classmethod
+    async def aget(cls, credential: Credential, page: int, page_size: int, msc_integrator: str = None) -> Self:
+
+        api_path = "list"
+        params = {"msc_customer": credential.document, "page": page, "page_size": page_size}
 
         if msc_integrator:
             params["msc_integrator"] = msc_integrator
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params={"msc_customer": credential.document, "page": page, "page_size": page_size},
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
-
-        if response.status_code == 200:
-            recurrence_lis_json = response.json()
-            recurrence_list = []
-            for recurrence in recurrence_lis_json["recurrences"]:
-                data = dict_int_to_float(recurrence, ["discount_rate_per_year"])
-                recurrence_list.append(data)
-
-            return cls(recurrences=recurrence_list)
-
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
-
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
-
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
-
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        response = await async_authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=params,
+            not_found_message="Contract not found",
+        )
+
+        return cls._from_response_data(response.json())
+
+    @classmethod
+    def iter_all(
+        cls, credential: Credential, page_size: int = 100, msc_integrator: str = None, prefetch: bool = False
+    ) -> Iterator[Recurrence]:
+        """
+        Lazily walks every page of recurrences, yielding one recurrence at a time.
+
+        Args:
+            credential (Credential): The credential used for authentication.
+            page_size (int, optional): The number of recurrences fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Filters the recurrences of an integrator. Defaults to None.
+            prefetch (bool, optional): Fetches the next page in the background. Defaults to False.
+
+        Yields:
+            Recurrence: Each recurrence of the customer.
+        """
+        pages = iter_pages(
+            lambda page: cls.get(credential, page, page_size, msc_integrator).recurrences,
+            page_size,
+            prefetch=prefetch,
+        )
+        for page in pages:
+            yield from page
+
+    @classmethod
+    async def aiter_all(
+        cls, credential: Credential, page_size: int = 100, msc_integrator: str = None, prefetch: bool = False
+    ) -> AsyncIterator[Recurrence]:
+        """
+        Async equivalent of RecurrenceList.iter_all.
+        """
+
+        async def fetch_page(page: int) -> List[Recurrence]:
+            return (await cls.aget(credential, page, page_size, msc_integrator)).recurrences
+
+        async for page in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            for recurrence in page:
+                yield recurrence
+
+    @classmethod
+    def get_all(
+        cls,
+        credential: Credential,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        concurrency: int = 4,
+    ) -> Self:
+        """
+        Bulk exports every page of recurrences, fetching up to ``concurrency`` pages at a time.
+
+        Args:
+            credential (Credential): The credential used for authentication.
+            page_size (int, optional): The number of recurrences fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Filters the recurrences of an integrator. Defaults to None.
+            concurrency (int, optional): The maximum number of pages fetched at the same time. Defaults to 4.
+
+        Returns:
+            Self: Every Recurrence, in page order.
+        """
+        pages = fetch_pages(
+            lambda page: cls.get(credential, page, page_size, msc_integrator).recurrences,
+            page_size,
+            concurrency=concurrency,
+        )
+
+        return cls(recurrences=[item for page in pages for item in page])
+
+    @classmethod
+    async def aget_all(
+        cls,
+        credential: Credential,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        concurrency: int = 4,
+    ) -> Self:
+        """
+        Async equivalent of RecurrenceList.get_all.
+        """
+
+        async def fetch_page(page: int) -> List[Recurrence]:
+            return (await cls.aget(credential, page, page_size, msc_integrator)).recurrences
+
+        pages = await afetch_pages(fetch_page, page_size, concurrency=concurrency)
+
+        return cls(recurrences=[item for page in pages for item in page])
+
+    @classmethod
+    def _from_response_data(cls, data: dict) -> Self:
+        recurrence_list = []
+        for recurrence in data["recurrences"]:
+            recurrence_list.append(dict_int_to_float(recurrence, ["discount_rate_per_year"]))
+
+        return cls(recurrences=recurrence_list)
+
+
+def _new_body(
+    credential: Credential,
+    asset_holder: str,
+    acquirer: str,
+    bank_account: BankAccount,
+    ur_percentage: int,
+    discount_rate_per_year: float,
+    payment_scheme: list[PaymentScheme],
+) -> dict:
+    body = {
+        "msc_customer": credential.document,
+        "asset_holder": asset_holder,
+        "acquirer": acquirer,
+        "bank_account": bank_account.model_dump(),
+        "ur_percentage": ur_percentage,
+        "discount_rate_per_year": discount_rate_per_year,
+        "payment_scheme": payment_scheme,
+    }
+
+    return dict_float_to_int(body, ["discount_rate_per_year"])
+
+
+def _spec_arguments(spec: RecurrenceSpec) -> dict:
+    # The fields are read as attributes, not dumped, so the bank account stays a model.
+    return {field_name: getattr(spec, field_name) for field_name in RecurrenceSpec.model_fields}
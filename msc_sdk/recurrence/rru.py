@@ -1,30 +1,30 @@
 import uuid
 from datetime import datetime
-from typing import Self
+from typing import AsyncIterator, Iterator, List, Self
 
-import requests
 from pydantic import BaseModel, Field, model_validator
 
-from msc_sdk.authenticate import Credential, Authenticate
+from msc_sdk.authenticate import Credential, authorized_execute, async_authorized_execute
 from msc_sdk.config_sdk import ConfigSDK, Environment
 from msc_sdk.enums import APINamespaces
-from msc_sdk.errors import NotFound, Unauthorized, ServerError
-from msc_sdk.recurrence import mock_data
-from msc_sdk.utils.api_tools import get_url
-from msc_sdk.utils.converters import dict_string_to_datetime, dict_int_to_float, list_int_to_float
+from msc_sdk.recurrence.mock import get_mock_data
+from msc_sdk.utils.api_tools import get_url, cached_response, acached_response
+from msc_sdk.utils.converters import dict_string_to_datetime, dict_cents_to_amount, list_cents_to_amount
+from msc_sdk.utils.money import Amount
+from msc_sdk.utils.pagination import iter_pages, aiter_pages, fetch_pages, afetch_pages
 
 
 class OperationResume(BaseModel):
     operation_id: str
     operation_date: datetime
-    previous_ur_amount: float
-    previous_total_operated_amount_gross: float
-    previous_total_operated_amount_net: float
-    ur_amount: float
-    operated_amount_gross: float
-    operated_amount_net: float
-    total_operated_amount_gross: float
-    total_operated_amount_net: float
+    previous_ur_amount: Amount
+    previous_total_operated_amount_gross: Amount
+    previous_total_operated_amount_net: Amount
+    ur_amount: Amount
+    operated_amount_gross: Amount
+    operated_amount_net: Amount
+    total_operated_amount_gross: Amount
+    total_operated_amount_net: Amount
 
     class Config:
         validate_assignment = True
@@ -40,13 +40,13 @@ class RecurrenceReceivableUnit(BaseModel):
     acquirer: str
     payment_scheme: str
     due_date: datetime
-    amount: float
-    total_operated_amount_gross: float
-    total_operated_amount_net: float
-    available_amount: float
-    previous_amount: float
-    previous_operated_amount_gross: float
-    previous_operated_amount_net: float
+    amount: Amount
+    total_operated_amount_gross: Amount
+    total_operated_amount_net: Amount
+    available_amount: Amount
+    previous_amount: Amount
+    previous_operated_amount_gross: Amount
+    previous_operated_amount_net: Amount
     operations: list[OperationResume] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime | None = None
@@ -57,155 +57,286 @@ class RecurrenceReceivableUnit(BaseModel):
     @classmethod
     def get(cls, credential: Credential, rru_id: str, recurrence_id: str) -> Self:
         if ConfigSDK.get_config().environment == Environment.DEV:
-            for rru in mock_data["rru_list"]:
+            for rru in get_mock_data()["rru_list"]:
                 if rru["rru_id"] == rru_id:
                     return cls(**rru)
 
         api_path = f"{recurrence_id}/rrus/{rru_id}"
 
-        auth = Authenticate.token(credential)
+        data = cached_response(
+            "rru",
+            credential,
+            (recurrence_id, rru_id),
+            lambda: authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.RECURRENCES, api_path),
+                not_found_message="Contract not found",
+            ).json(),
+        )
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
+        return cls._from_response_data(data)
 
-        if response.status_code == 200:
-            rru_json = response.json()
+    @classmethod
+    async def aget(cls, credential: Credential, rru_id: str, recurrence_id: str) -> Self:
+        if ConfigSDK.get_config().environment == Environment.DEV:
+            for rru in get_mock_data()["rru_list"]:
+                if rru["rru_id"] == rru_id:
+                    return cls(**rru)
 
-            data = dict_int_to_float(
-                rru_json,
+        api_path = f"{recurrence_id}/rrus/{rru_id}"
+
+        async def request() -> dict:
+            response = await async_authorized_execute(
+                credential,
+                "GET",
+                url=get_url(APINamespaces.RECURRENCES, api_path),
+                not_found_message="Contract not found",
+            )
+
+            return response.json()
+
+        return cls._from_response_data(await acached_response("rru", credential, (recurrence_id, rru_id), request))
+
+    @classmethod
+    def _from_response_data(cls, data: dict) -> Self:
+        return cls(**cls._convert_response_data(data))
+
+    @classmethod
+    def _convert_response_data(cls, data: dict) -> dict:
+        """
+        Converts the response data of a RecurrenceReceivableUnit to the values of the model, e.g. amounts from cents.
+        """
+        data = dict_cents_to_amount(
+            data,
+            [
+                "amount",
+                "total_operated_amount_gross",
+                "total_operated_amount_net",
+                "available_amount",
+                "previous_amount",
+                "previous_operated_amount_gross",
+                "previous_operated_amount_net",
+            ],
+        )
+
+        if data.get("operations", None):
+            data["operations"] = list_cents_to_amount(
+                data["operations"],
                 [
-                    "amount",
+                    "previous_ur_amount",
+                    "previous_total_operated_amount_gross",
+                    "previous_total_operated_amount_net",
+                    "ur_amount",
+                    "operated_amount_gross",
+                    "operated_amount_net",
                     "total_operated_amount_gross",
                     "total_operated_amount_net",
-                    "available_amount",
-                    "previous_amount",
-                    "previous_operated_amount_gross",
-                    "previous_operated_amount_net",
                 ],
             )
 
-            if data.get("operations", None):
-                data["operations"] = list_int_to_float(
-                    data["operations"],
-                    [
-                        "previous_ur_amount",
-                        "previous_total_operated_amount_gross",
-                        "previous_total_operated_amount_net",
-                        "ur_amount",
-                        "operated_amount_gross",
-                        "operated_amount_net",
-                        "total_operated_amount_gross",
-                        "total_operated_amount_net",
-                    ],
-                )
+        return data
 
-            return cls(**data)
 
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
+class RecurrenceReceivableUnitList(BaseModel):
+    rrus: list[RecurrenceReceivableUnit] = Field(default_factory=list)
+
+    @classmethod
+    def get(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page: int,
+        page_size: int,
+        msc_integrator: str = None,
+        raw: bool = False,
+    ) -> Self | List[dict]:
+        if ConfigSDK.get_config().environment == Environment.DEV:
+            rru_list = cls._from_mock_data(recurrence_id, page, page_size)
 
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
+            if rru_list is not None:
+                return [rru.model_dump() for rru in rru_list.rrus] if raw else rru_list
 
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
+        api_path = f"{recurrence_id}/rrus/list"
 
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        param = {"page": page, "page_size": page_size}
 
+        if msc_integrator:
+            param["msc_integrator"] = msc_integrator
 
-class RecurrenceReceivableUnitList(BaseModel):
-    rrus: list[RecurrenceReceivableUnit] = Field(default_factory=list)
+        response = authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=param,
+            not_found_message="Contract not found",
+        )
+
+        return cls._from_response_data(response.json(), raw)
 
     @classmethod
-    def get(
-        cls, credential: Credential, recurrence_id: str, page: int, page_size: int, msc_integrator: str = None
-    ) -> Self:
+    async def aget(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page: int,
+        page_size: int,
+        msc_integrator: str = None,
+        raw: bool = False,
+    ) -> Self | List[dict]:
         if ConfigSDK.get_config().environment == Environment.DEV:
-            rru_list = cls()
-            found = False
-            for rru in mock_data["rru_list"]:
-                if rru["recurrence_id"] == recurrence_id:
-                    found = True
-                    rru_list.rrus.append(RecurrenceReceivableUnit(**rru))
+            rru_list = cls._from_mock_data(recurrence_id, page, page_size)
 
-            if found:
-                return rru_list
+            if rru_list is not None:
+                return [rru.model_dump() for rru in rru_list.rrus] if raw else rru_list
 
         api_path = f"{recurrence_id}/rrus/list"
 
-        auth = Authenticate.token(credential)
-
         param = {"page": page, "page_size": page_size}
 
         if msc_integrator:
             param["msc_integrator"] = msc_integrator
 
-        for i in range(5):
-            try:
-                response = requests.get(
-                    url=get_url(APINamespaces.RECURRENCES, api_path),
-                    headers=dict(Authorization=f"Bearer {auth.access_token.get_secret_value()}"),
-                    params=param,
-                )
-                break
-            except Exception as e:
-                if i == 4:
-                    raise e
-
-        if response.status_code == 200:
-            rru_list_json = response.json()["rrus"]
-
-            rru_list = []
-            for rru in rru_list_json:
-                data = dict_int_to_float(
-                    rru,
-                    [
-                        "amount",
-                        "total_operated_amount_gross",
-                        "total_operated_amount_net",
-                        "available_amount",
-                        "previous_amount",
-                        "previous_operated_amount_gross",
-                        "previous_operated_amount_net",
-                    ],
-                )
-
-                if data.get("operations", None):
-                    data["operations"] = list_int_to_float(
-                        data["operations"],
-                        [
-                            "previous_ur_amount",
-                            "previous_total_operated_amount_gross",
-                            "previous_total_operated_amount_net",
-                            "ur_amount",
-                            "operated_amount_gross",
-                            "operated_amount_net",
-                            "total_operated_amount_gross",
-                            "total_operated_amount_net",
-                        ],
-                    )
-
-                rru_list.append(RecurrenceReceivableUnit(**data))
-
-            return cls(rrus=rru_list)
-
-        elif response.status_code == 204:
-            raise NotFound("Contract not found")
-
-        elif response.status_code == 401:
-            raise Unauthorized("Wrong credentials")
-
-        elif response.status_code >= 500:
-            raise ServerError("Server error")
-
-        else:
-            raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
+        response = await async_authorized_execute(
+            credential,
+            "GET",
+            url=get_url(APINamespaces.RECURRENCES, api_path),
+            params=param,
+            not_found_message="Contract not found",
+        )
+
+        return cls._from_response_data(response.json(), raw)
+
+    @classmethod
+    def _from_mock_data(cls, recurrence_id: str, page: int, page_size: int) -> Self | None:
+        rrus = [rru for rru in get_mock_data()["rru_list"] if rru["recurrence_id"] == recurrence_id]
+
+        if not rrus:
+            return None
+
+        return cls(rrus=[RecurrenceReceivableUnit(**rru) for rru in rrus[(page - 1) * page_size : page * page_size]])
+
+    @classmethod
+    def iter_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        prefetch: bool = False,
+        raw: bool = False,
+    ) -> Iterator[RecurrenceReceivableUnit | dict]:
+        """
+        Lazily walks every page of receivable units of a recurrence, yielding one unit at a time.
+
+        Args:
+            credential (Credential): The credential used for authentication.
+            recurrence_id (str): The id of the recurrence.
+            page_size (int, optional): The number of receivable units fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Filters the receivable units of an integrator. Defaults to None.
+            prefetch (bool, optional): Fetches the next page in the background. Defaults to False.
+            raw (bool, optional): Returns the receivable units as the plain API dicts, with the amounts converted,
+            instead of models, which skips building and validating the models. Defaults to False.
+
+        Yields:
+            RecurrenceReceivableUnit | dict: Each receivable unit of the recurrence.
+        """
+        pages = iter_pages(
+            lambda page: cls._page_items(cls.get(credential, recurrence_id, page, page_size, msc_integrator, raw)),
+            page_size,
+            prefetch=prefetch,
+        )
+        for page in pages:
+            yield from page
+
+    @classmethod
+    async def aiter_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        prefetch: bool = False,
+        raw: bool = False,
+    ) -> AsyncIterator[RecurrenceReceivableUnit | dict]:
+        """
+        Async equivalent of RecurrenceReceivableUnitList.iter_all.
+        """
+
+        async def fetch_page(page: int) -> List[RecurrenceReceivableUnit | dict]:
+            return cls._page_items(await cls.aget(credential, recurrence_id, page, page_size, msc_integrator, raw))
+
+        async for page in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            for rru in page:
+                yield rru
+
+    @classmethod
+    def get_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        concurrency: int = 4,
+        raw: bool = False,
+    ) -> Self | List[dict]:
+        """
+        Bulk exports every page of receivable units of a recurrence, fetching up to ``concurrency`` pages at a time.
+
+        Args:
+            credential (Credential): The credential used for authentication.
+            recurrence_id (str): The id of the recurrence.
+            page_size (int, optional): The number of receivable units fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Filters the receivable units of an integrator. Defaults to None.
+            concurrency (int, optional): The maximum number of pages fetched at the same time. Defaults to 4.
+            raw (bool, optional): Returns the receivable units as the plain API dicts, with the amounts converted,
+            instead of models, which skips building and validating the models. Defaults to False.
+
+        Returns:
+            Self | List[dict]: Every RecurrenceReceivableUnit, in page order.
+        """
+        pages = fetch_pages(
+            lambda page: cls._page_items(cls.get(credential, recurrence_id, page, page_size, msc_integrator, raw)),
+            page_size,
+            concurrency=concurrency,
+        )
+
+        items = [item for page in pages for item in page]
+
+        return items if raw else cls(rrus=items)
+
+    @classmethod
+    async def aget_all(
+        cls,
+        credential: Credential,
+        recurrence_id: str,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        concurrency: int = 4,
+        raw: bool = False,
+    ) -> Self | List[dict]:
+        """
+        Async equivalent of RecurrenceReceivableUnitList.get_all.
+        """
+
+        async def fetch_page(page: int) -> List[RecurrenceReceivableUnit | dict]:
+            return cls._page_items(await cls.aget(credential, recurrence_id, page, page_size, msc_integrator, raw))
+
+        pages = await afetch_pages(fetch_page, page_size, concurrency=concurrency)
+
+        items = [item for page in pages for item in page]
+
+        return items if raw else cls(rrus=items)
+
+    @classmethod
+    def _from_response_data(cls, data: dict, raw: bool = False) -> Self | List[dict]:
+        rrus = [RecurrenceReceivableUnit._convert_response_data(rru) for rru in data["rrus"]]
+
+        if raw:
+            return rrus
+
+        return cls(rrus=[RecurrenceReceivableUnit(**rru) for rru in rrus])
+
+    @staticmethod
+    def _page_items(page: Self | List[dict]) -> List[RecurrenceReceivableUnit | dict]:
+        return page if isinstance(page, list) else page.rrus
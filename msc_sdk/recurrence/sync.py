@@ -0,0 +1,308 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Callable, Iterable, Iterator, List
+
+from pydantic import BaseModel
+
+from msc_sdk.authenticate import Credential
+from msc_sdk.recurrence.operation import Operation, OperationList
+from msc_sdk.recurrence.recurrence import Recurrence, RecurrenceList, RecurrenceStatus
+from msc_sdk.recurrence.rru import RecurrenceReceivableUnit, RecurrenceReceivableUnitList
+from msc_sdk.utils.pagination import iter_pages
+
+
+class ChangeType(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    CANCELLED = "cancelled"
+
+    def __str__(self):
+        return self.value
+
+
+class ChangeEvent(BaseModel):
+    """
+    A change of a recurrence, operation or receivable unit found by a RecurrenceSync run.
+    """
+
+    change: ChangeType
+    resource: str
+    recurrence_id: str
+    item: Recurrence | Operation | RecurrenceReceivableUnit
+
+
+class WatermarkStore:
+    """
+    Storage of the sync watermarks: the latest ``updated_at`` (or ``created_at``) seen of each synced list, as ISO
+    strings keyed by the list, e.g. ``"<recurrence_id>/operations"``.
+    """
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the watermark of the list, or None if it was never synced.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, watermark: str):
+        """
+        Stores the watermark of the list.
+        """
+        raise NotImplementedError
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    """
+    Keeps the watermarks in the memory of the current process.
+    """
+
+    def __init__(self):
+        self._watermarks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self._watermarks.get(key)
+
+    def set(self, key: str, watermark: str):
+        with self._lock:
+            self._watermarks[key] = watermark
+
+
+class FileWatermarkStore(MemoryWatermarkStore):
+    """
+    Persists the watermarks in a JSON file, rewritten atomically on every change.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The path of the JSON file, created on the first change.
+        """
+        super().__init__()
+        self.path = path
+
+        if os.path.exists(path):
+            with open(path) as file:
+                self._watermarks = json.load(file)
+
+    def set(self, key: str, watermark: str):
+        with self._lock:
+            self._watermarks[key] = watermark
+            temporary = f"{self.path}.tmp"
+
+            with open(temporary, "w") as file:
+                json.dump(self._watermarks, file, indent=2, sort_keys=True)
+
+            os.replace(temporary, self.path)
+
+
+class RecurrenceSync:
+    """
+    Keeps a local mirror of the recurrences of a customer, with their operations and receivable units, up to date.
+
+    Each run walks the lists and emits a ChangeEvent for every item created or updated since the watermark of its
+    list, the latest ``updated_at`` seen by the previous run. Only the changed items are built as models: the pages of
+    operations and receivable units are fetched in raw mode. A watermark is stored once its list is fully walked and
+    its events consumed, so an interrupted run is resumed by the next one.
+
+    The list endpoints have no filter by update date, so every page is still requested, unless the API lists the
+    items by descending ``updated_at`` (``ordered_by_update``), in which case the walk stops at the first unchanged
+    item.
+    """
+
+    def __init__(
+        self,
+        credential: Credential,
+        store: WatermarkStore = None,
+        page_size: int = 100,
+        msc_integrator: str = None,
+        ordered_by_update: bool = False,
+    ):
+        """
+        Args:
+            credential (Credential): The credential used for authentication.
+            store (WatermarkStore, optional): Where the watermarks are persisted. Defaults to a MemoryWatermarkStore.
+            page_size (int, optional): The number of items fetched per page. Defaults to 100.
+            msc_integrator (str, optional): Syncs the items of an integrator. Defaults to None.
+            ordered_by_update (bool, optional): Whether the API lists the items by descending ``updated_at``.
+            Defaults to False.
+        """
+        self.credential = credential
+        self.store = store or MemoryWatermarkStore()
+        self.page_size = page_size
+        self.msc_integrator = msc_integrator
+        self.ordered_by_update = ordered_by_update
+
+    def run(self, recurrence_ids: Iterable[str] = None) -> Iterator[ChangeEvent]:
+        """
+        Syncs the recurrences, then the operations and receivable units of each of them.
+
+        Args:
+            recurrence_ids (Iterable[str], optional): Syncs the operations and receivable units of these recurrences
+            only, without syncing the list of recurrences. Defaults to every recurrence of the customer.
+
+        Yields:
+            ChangeEvent: Each change since the previous run.
+        """
+        if recurrence_ids is None:
+            recurrence_ids = []
+            yield from self.sync_recurrences(on_item=lambda item: recurrence_ids.append(item.id))
+
+        for recurrence_id in recurrence_ids:
+            yield from self.sync_operations(recurrence_id)
+            yield from self.sync_rrus(recurrence_id)
+
+    def sync_recurrences(self, on_item: Callable[[Recurrence], None] = None) -> Iterator[ChangeEvent]:
+        """
+        Emits the recurrences created, updated or cancelled since the previous run.
+
+        Args:
+            on_item (Callable[[Recurrence], None], optional): Called with every listed recurrence, changed or not.
+            Defaults to None.
+        """
+
+        def fetch_page(page: int) -> List[Recurrence]:
+            return RecurrenceList.get(self.credential, page, self.page_size, self.msc_integrator).recurrences
+
+        def changed(recurrence: Recurrence) -> ChangeEvent | None:
+            if on_item is not None:
+                on_item(recurrence)
+
+            cancelled = recurrence.status == RecurrenceStatus.CANCELLED.value
+            change = _change(recurrence.created_at, recurrence.updated_at, watermark, cancelled)
+
+            if change is not None:
+                return ChangeEvent(change=change, resource="recurrence", recurrence_id=recurrence.id, item=recurrence)
+
+        watermark = self._watermark("recurrences")
+        # The recurrences are checked as models, their list has no raw mode. Every recurrence is walked when on_item
+        # must see all of them.
+        yield from self._walk(
+            "recurrences",
+            watermark,
+            fetch_page,
+            changed,
+            lambda recurrence: recurrence.updated_at or recurrence.created_at,
+            stop_early=on_item is None,
+        )
+
+    def sync_operations(self, recurrence_id: str) -> Iterator[ChangeEvent]:
+        """
+        Emits the operations of the recurrence created or updated since the previous run.
+        """
+
+        def fetch_page(page: int) -> List[dict]:
+            return OperationList.get(
+                self.credential, recurrence_id, page, self.page_size, self.msc_integrator, raw=True
+            )
+
+        def changed(item: dict) -> ChangeEvent | None:
+            change = _change(item.get("created_at"), item.get("updated_at"), watermark)
+
+            if change is not None:
+                return ChangeEvent(
+                    change=change, resource="operation", recurrence_id=recurrence_id, item=Operation(**item)
+                )
+
+        key = f"{recurrence_id}/operations"
+        watermark = self._watermark(key)
+        yield from self._walk(key, watermark, fetch_page, changed, _raw_stamp)
+
+    def sync_rrus(self, recurrence_id: str) -> Iterator[ChangeEvent]:
+        """
+        Emits the receivable units of the recurrence created or updated since the previous run.
+        """
+
+        def fetch_page(page: int) -> List[dict]:
+            return RecurrenceReceivableUnitList.get(
+                self.credential, recurrence_id, page, self.page_size, self.msc_integrator, raw=True
+            )
+
+        def changed(item: dict) -> ChangeEvent | None:
+            change = _change(item.get("created_at"), item.get("updated_at"), watermark)
+
+            if change is not None:
+                return ChangeEvent(
+                    change=change, resource="rru", recurrence_id=recurrence_id, item=RecurrenceReceivableUnit(**item)
+                )
+
+        key = f"{recurrence_id}/rrus"
+        watermark = self._watermark(key)
+        yield from self._walk(key, watermark, fetch_page, changed, _raw_stamp)
+
+    def _walk(
+        self,
+        key: str,
+        watermark: datetime | None,
+        fetch_page: Callable[[int], List],
+        changed: Callable,
+        stamp_of: Callable,
+        stop_early: bool = True,
+    ) -> Iterator[ChangeEvent]:
+        latest = watermark
+        items = (item for page in iter_pages(fetch_page, self.page_size) for item in page)
+
+        for item in items:
+            stamp = _stamp(stamp_of(item))
+            event = changed(item)
+
+            if stamp is not None and (latest is None or stamp > latest):
+                latest = stamp
+
+            if event is not None:
+                yield event
+            elif stop_early and self.ordered_by_update and watermark is not None:
+                break
+
+        if latest is not None and latest != watermark:
+            self.store.set(key, latest.isoformat())
+
+    def _watermark(self, key: str) -> datetime | None:
+        return _stamp(self.store.get(key))
+
+
+def _change(
+    created_at: datetime | str | None,
+    updated_at: datetime | str | None,
+    watermark: datetime | None,
+    cancelled: bool = False,
+) -> ChangeType | None:
+    """
+    Classifies an item against the watermark of its list: None if it did not change since.
+    """
+    created_at, updated_at = _stamp(created_at), _stamp(updated_at)
+    stamp = updated_at or created_at
+
+    if watermark is not None and stamp is not None and stamp <= watermark:
+        return None
+
+    if cancelled:
+        return ChangeType.CANCELLED
+
+    if watermark is None or created_at is None or created_at > watermark:
+        return ChangeType.CREATED
+
+    return ChangeType.UPDATED
+
+
+def _raw_stamp(item: dict) -> str | None:
+    return item.get("updated_at") or item.get("created_at")
+
+
+def _stamp(value: datetime | str | None) -> datetime | None:
+    """
+    Parses a timestamp as a naive UTC datetime, so the timestamps sent with and without an offset compare.
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value
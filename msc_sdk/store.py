@@ -0,0 +1,479 @@
+import sqlite3
+import threading
+from datetime import date, datetime, time, timezone
+from typing import TYPE_CHECKING, Iterable, List, Self
+
+from pydantic import BaseModel
+
+from msc_sdk.contract.contract import Contract
+from msc_sdk.position import Position, PositionUR
+from msc_sdk.recurrence import Operation, Recurrence, RecurrenceReceivableUnit
+from msc_sdk.utils.converters import list_cents_to_amount
+from msc_sdk.utils.money import WIRE_FORMAT
+
+if TYPE_CHECKING:
+    from msc_sdk.recurrence.sync import ChangeEvent
+
+SCHEMA_VERSION = 2
+"""
+The version of the tables. Stores written with another version are rebuilt empty when opened.
+"""
+
+_SCHEMA = """
+CREATE TABLE contracts (
+    key TEXT PRIMARY KEY, asset_holder TEXT, status TEXT, contract_due_date TEXT, model TEXT NOT NULL
+);
+CREATE INDEX contracts_asset_holder ON contracts (asset_holder);
+CREATE TABLE contract_urs (
+    contract_key TEXT NOT NULL, acquirer TEXT, payment_scheme TEXT, due_date TEXT
+);
+CREATE INDEX contract_urs_contract_key ON contract_urs (contract_key);
+CREATE INDEX contract_urs_acquirer ON contract_urs (acquirer, due_date);
+CREATE INDEX contract_urs_payment_scheme ON contract_urs (payment_scheme, due_date);
+CREATE INDEX contract_urs_due_date ON contract_urs (due_date);
+
+CREATE TABLE positions (
+    asset_holder TEXT, payment_scheme TEXT, acquirer TEXT, key TEXT, model TEXT NOT NULL,
+    PRIMARY KEY (asset_holder, payment_scheme, acquirer)
+);
+CREATE INDEX positions_acquirer ON positions (acquirer);
+CREATE INDEX positions_payment_scheme ON positions (payment_scheme);
+CREATE TABLE position_urs (
+    asset_holder TEXT, payment_scheme TEXT, acquirer TEXT, due_date TEXT, ur_amount INTEGER, value_available INTEGER
+);
+CREATE INDEX position_urs_position ON position_urs (asset_holder, payment_scheme, acquirer);
+CREATE INDEX position_urs_asset_holder ON position_urs (asset_holder, due_date);
+CREATE INDEX position_urs_acquirer ON position_urs (acquirer, due_date);
+CREATE INDEX position_urs_payment_scheme ON position_urs (payment_scheme, due_date);
+CREATE INDEX position_urs_due_date ON position_urs (due_date);
+
+CREATE TABLE recurrences (
+    id TEXT PRIMARY KEY, asset_holder TEXT, acquirer TEXT, status TEXT, model TEXT NOT NULL
+);
+CREATE INDEX recurrences_asset_holder ON recurrences (asset_holder);
+CREATE INDEX recurrences_acquirer ON recurrences (acquirer);
+
+CREATE TABLE operations (
+    id TEXT PRIMARY KEY, recurrence_id TEXT, asset_holder TEXT, operation_date TEXT, model TEXT NOT NULL
+);
+CREATE INDEX operations_recurrence_id ON operations (recurrence_id, operation_date);
+CREATE INDEX operations_asset_holder ON operations (asset_holder, operation_date);
+
+CREATE TABLE rrus (
+    id TEXT PRIMARY KEY, recurrence_id TEXT, asset_holder TEXT, acquirer TEXT, payment_scheme TEXT, due_date TEXT,
+    model TEXT NOT NULL
+);
+CREATE INDEX rrus_recurrence_id ON rrus (recurrence_id, due_date);
+CREATE INDEX rrus_asset_holder ON rrus (asset_holder, due_date);
+CREATE INDEX rrus_acquirer ON rrus (acquirer, due_date);
+CREATE INDEX rrus_payment_scheme ON rrus (payment_scheme, due_date);
+CREATE INDEX rrus_due_date ON rrus (due_date);
+"""
+
+_TABLES = ("contracts", "contract_urs", "positions", "position_urs", "recurrences", "operations", "rrus")
+
+
+class StoredUR(PositionUR):
+    """
+    A receivable unit of a stored position, with the keys of its position.
+    """
+
+    asset_holder: str
+    payment_scheme: str
+    acquirer: str
+
+
+class LocalStore:
+    """
+    A local SQLite mirror of the contracts, positions, recurrences, operations and receivable units fetched from the
+    API, queried by asset holder, acquirer, payment scheme and due date through indexes instead of API calls.
+
+    Models are kept as JSON next to their indexed fields, with the amounts in integer cents, so they are read back in
+    the money mode of the SDK whichever mode they were stored in.
+
+    Date ranges include their start and exclude their end, e.g. ``store.urs(acquirer=..., due_from=monday,
+    due_to=next_monday)`` returns the receivable units due in the week.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path (str, optional): The path of the SQLite database, created if missing. Defaults to an in-memory
+            database.
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                for table in _TABLES:
+                    self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+
+                self._connection.executescript(_SCHEMA)
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def put(self, *models: BaseModel):
+        """
+        Stores or replaces contracts, positions, recurrences, operations and receivable units, in one transaction.
+
+        Raises:
+            TypeError: If a model is none of the above.
+        """
+        with self._lock, self._connection:
+            for model in models:
+                if isinstance(model, Contract):
+                    self._put_contract(model)
+                elif isinstance(model, Position):
+                    self._put_position(model)
+                elif isinstance(model, Recurrence):
+                    self._put_recurrence(model)
+                elif isinstance(model, Operation):
+                    self._put_operation(model)
+                elif isinstance(model, RecurrenceReceivableUnit):
+                    self._put_rru(model)
+                else:
+                    raise TypeError(f"{type(model).__name__} can not be stored")
+
+    def apply(self, events: Iterable["ChangeEvent"]) -> int:
+        """
+        Stores the items of the change events of a RecurrenceSync run, keeping the mirror up to date.
+
+        Returns:
+            int: The number of events applied.
+        """
+        count = 0
+
+        for event in events:
+            self.put(event.item)
+            count += 1
+
+        return count
+
+    def contract(self, key: str) -> Contract | None:
+        """
+        Returns the stored contract with the key, or None.
+        """
+        return self._first(Contract, "SELECT model FROM contracts WHERE key = ?", (key,))
+
+    def contracts(
+        self,
+        asset_holder: str = None,
+        acquirer: str = None,
+        payment_scheme: str = None,
+        due_from: date | datetime = None,
+        due_to: date | datetime = None,
+    ) -> List[Contract]:
+        """
+        Returns the stored contracts of an asset holder and/or with receivable units matching the filters.
+
+        Args:
+            asset_holder (str, optional): The document of the asset holder. Defaults to None.
+            acquirer (str, optional): The acquirer of a receivable unit of the contract. Defaults to None.
+            payment_scheme (str, optional): The payment scheme of a receivable unit of the contract. Defaults to None.
+            due_from (date | datetime, optional): The first due date of a receivable unit of the contract.
+            Defaults to None.
+            due_to (date | datetime, optional): The due date where the range of due_from ends. Defaults to None.
+        """
+        where, params = _filters(asset_holder=asset_holder)
+        ur_where, ur_params = _filters(
+            acquirer=acquirer, payment_scheme=payment_scheme, due_from=due_from, due_to=due_to
+        )
+
+        if ur_where:
+            where.append(f"key IN (SELECT contract_key FROM contract_urs WHERE {' AND '.join(ur_where)})")
+            params.extend(ur_params)
+
+        return self._all(Contract, "SELECT model FROM contracts", where, params, "key")
+
+    def position(self, asset_holder: str, payment_scheme: str, acquirer: str) -> Position | None:
+        """
+        Returns the stored position of the asset holder, payment scheme and acquirer, or None.
+        """
+        return self._first(
+            Position,
+            "SELECT model FROM positions WHERE asset_holder = ? AND payment_scheme = ? AND acquirer = ?",
+            (asset_holder, payment_scheme, acquirer),
+        )
+
+    def positions(self, asset_holder: str = None, acquirer: str = None, payment_scheme: str = None) -> List[Position]:
+        """
+        Returns the stored positions matching the filters.
+        """
+        where, params = _filters(asset_holder=asset_holder, acquirer=acquirer, payment_scheme=payment_scheme)
+
+        return self._all(
+            Position, "SELECT model FROM positions", where, params, "asset_holder, payment_scheme, acquirer"
+        )
+
+    def urs(
+        self,
+        asset_holder: str = None,
+        acquirer: str = None,
+        payment_scheme: str = None,
+        due_from: date | datetime = None,
+        due_to: date | datetime = None,
+    ) -> List[StoredUR]:
+        """
+        Returns the receivable units of the stored positions matching the filters, by due date.
+
+        Args:
+            asset_holder (str, optional): The document of the asset holder. Defaults to None.
+            acquirer (str, optional): The acquirer. Defaults to None.
+            payment_scheme (str, optional): The payment scheme. Defaults to None.
+            due_from (date | datetime, optional): The first due date. Defaults to None.
+            due_to (date | datetime, optional): The due date where the range ends. Defaults to None.
+        """
+        where, params = _filters(
+            asset_holder=asset_holder,
+            acquirer=acquirer,
+            payment_scheme=payment_scheme,
+            due_from=due_from,
+            due_to=due_to,
+        )
+        query = (
+            "SELECT asset_holder, payment_scheme, acquirer, due_date, ur_amount, value_available FROM position_urs"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + " ORDER BY due_date"
+        )
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+
+        columns = ("asset_holder", "payment_scheme", "acquirer", "due_date", "ur_amount", "value_available")
+        urs = list_cents_to_amount([dict(zip(columns, row)) for row in rows], ["ur_amount", "value_available"])
+
+        return [StoredUR(**ur) for ur in urs]
+
+    def recurrence(self, recurrence_id: str) -> Recurrence | None:
+        """
+        Returns the stored recurrence with the id, or None.
+        """
+        return self._first(Recurrence, "SELECT model FROM recurrences WHERE id = ?", (recurrence_id,))
+
+    def recurrences(self, asset_holder: str = None, acquirer: str = None, status: str = None) -> List[Recurrence]:
+        """
+        Returns the stored recurrences matching the filters.
+        """
+        where, params = _filters(asset_holder=asset_holder, acquirer=acquirer, status=status)
+
+        return self._all(Recurrence, "SELECT model FROM recurrences", where, params, "id")
+
+    def operations(
+        self,
+        recurrence_id: str = None,
+        asset_holder: str = None,
+        date_from: date | datetime = None,
+        date_to: date | datetime = None,
+    ) -> List[Operation]:
+        """
+        Returns the stored operations matching the filters, by operation date.
+        """
+        where, params = _filters(recurrence_id=recurrence_id, asset_holder=asset_holder)
+        where_dates, params_dates = _range("operation_date", date_from, date_to)
+
+        return self._all(
+            Operation, "SELECT model FROM operations", where + where_dates, params + params_dates, "operation_date"
+        )
+
+    def rrus(
+        self,
+        recurrence_id: str = None,
+        asset_holder: str = None,
+        acquirer: str = None,
+        payment_scheme: str = None,
+        due_from: date | datetime = None,
+        due_to: date | datetime = None,
+    ) -> List[RecurrenceReceivableUnit]:
+        """
+        Returns the stored receivable units of recurrences matching the filters, by due date.
+        """
+        where, params = _filters(
+            recurrence_id=recurrence_id,
+            asset_holder=asset_holder,
+            acquirer=acquirer,
+            payment_scheme=payment_scheme,
+            due_from=due_from,
+            due_to=due_to,
+        )
+
+        return self._all(RecurrenceReceivableUnit, "SELECT model FROM rrus", where, params, "due_date")
+
+    def clear(self):
+        """
+        Drops every stored model.
+        """
+        with self._lock, self._connection:
+            for table in _TABLES:
+                self._connection.execute(f"DELETE FROM {table}")
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _put_contract(self, contract: Contract):
+        self._connection.execute("DELETE FROM contract_urs WHERE contract_key = ?", (contract.key,))
+        self._connection.execute(
+            "INSERT OR REPLACE INTO contracts VALUES (?, ?, ?, ?, ?)",
+            (
+                contract.key,
+                contract.asset_holder,
+                _text(contract.status),
+                _stamp(contract.contract_due_date),
+                _dump(contract),
+            ),
+        )
+        self._connection.executemany(
+            "INSERT INTO contract_urs VALUES (?, ?, ?, ?)",
+            [(contract.key, ur.acquirer, ur.payment_scheme, _stamp(ur.due_date)) for ur in contract.ur_list],
+        )
+
+    def _put_position(self, position: Position):
+        keys = (position.asset_holder, position.payment_scheme, position.acquirer)
+        schedule = position.ur_list_resume
+
+        self._connection.execute(
+            "DELETE FROM position_urs WHERE asset_holder = ? AND payment_scheme = ? AND acquirer = ?", keys
+        )
+        self._connection.execute(
+            "INSERT OR REPLACE INTO positions VALUES (?, ?, ?, ?, ?)", (*keys, position.key, _dump(position))
+        )
+
+        if schedule:
+            self._connection.executemany(
+                "INSERT INTO position_urs VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (*keys, _stamp(ur["due_date"]), ur["ur_amount"], ur["value_available"])
+                    for ur in schedule.dump(wire_format=True)
+                ],
+            )
+
+    def _put_recurrence(self, recurrence: Recurrence):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO recurrences VALUES (?, ?, ?, ?, ?)",
+            (recurrence.id, recurrence.asset_holder, recurrence.acquirer, _text(recurrence.status), _dump(recurrence)),
+        )
+
+    def _put_operation(self, operation: Operation):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO operations VALUES (?, ?, ?, ?, ?)",
+            (
+                operation.id,
+                operation.recurrence_id,
+                operation.asset_holder,
+                _stamp(operation.operation_date),
+                _dump(operation),
+            ),
+        )
+
+    def _put_rru(self, rru: RecurrenceReceivableUnit):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO rrus VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                rru.id,
+                rru.recurrence_id,
+                rru.asset_holder,
+                rru.acquirer,
+                rru.payment_scheme,
+                _stamp(rru.due_date),
+                _dump(rru),
+            ),
+        )
+
+    def _first(self, model_class: type[BaseModel], query: str, params: tuple) -> BaseModel | None:
+        with self._lock:
+            row = self._connection.execute(query, params).fetchone()
+
+        return None if row is None else _load(model_class, row[0])
+
+    def _all(self, model_class: type[BaseModel], query: str, where: List[str], params: List, order_by: str) -> List:
+        if where:
+            query += f" WHERE {' AND '.join(where)}"
+
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY {order_by}", params).fetchall()
+
+        return [_load(model_class, row[0]) for row in rows]
+
+
+def _filters(due_from: date | datetime = None, due_to: date | datetime = None, **equals) -> tuple[List[str], List]:
+    where = [f"{column} = ?" for column, value in equals.items() if value is not None]
+    params = [_text(value) for value in equals.values() if value is not None]
+    where_dates, params_dates = _range("due_date", due_from, due_to)
+
+    return where + where_dates, params + params_dates
+
+
+def _range(column: str, start: date | datetime = None, end: date | datetime = None) -> tuple[List[str], List]:
+    where, params = [], []
+
+    if start is not None:
+        where.append(f"{column} >= ?")
+        params.append(_stamp(start))
+
+    if end is not None:
+        where.append(f"{column} < ?")
+        params.append(_stamp(end))
+
+    return where, params
+
+
+def _dump(model: BaseModel) -> str:
+    return model.model_dump_json(context=WIRE_FORMAT, exclude=_unset_nones(model))
+
+
+def _unset_nones(model: BaseModel) -> dict:
+    """
+    Returns the fields, nested ones included, left to a None default, which are not dumped as None may not be a valid
+    value of them.
+    """
+    exclude = {}
+
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+
+        if value is None:
+            if name not in model.model_fields_set:
+                exclude[name] = True
+        elif isinstance(value, BaseModel):
+            if nested := _unset_nones(value):
+                exclude[name] = nested
+        elif isinstance(value, list):
+            items = {index: _unset_nones(item) for index, item in enumerate(value) if isinstance(item, BaseModel)}
+
+            if items := {index: nested for index, nested in items.items() if nested}:
+                exclude[name] = items
+
+    return exclude
+
+
+def _load(model_class: type[BaseModel], data: str) -> BaseModel:
+    return model_class.model_validate_json(data, context=WIRE_FORMAT)
+
+
+def _text(value) -> str | None:
+    return None if value is None else str(getattr(value, "value", value))
+
+
+def _stamp(value: date | datetime | None) -> str | None:
+    """
+    Formats a date as a sortable naive UTC ISO string, the form of every date column.
+    """
+    if value is None:
+        return None
+
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value.isoformat(timespec="microseconds")
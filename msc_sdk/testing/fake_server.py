@@ -0,0 +1,601 @@
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+from urllib.parse import parse_qs, urlsplit
+
+_ASSET_HOLDERS = ["15365935000149", "89785141000170"]
+_ACQUIRERS = ["01027058000191", "15111975000164"]
+_PAYMENT_SCHEMES = ["VCC", "MCC", "ECC"]
+_BANK_ACCOUNT = dict(
+    branch="1234",
+    account="123456",
+    account_digit="1",
+    account_type="CC",
+    ispb="60701190",
+    document_type="CNPJ",
+    document_number="74634410000120",
+)
+
+_ROUTES = [
+    ("POST", r"/authenticate/token", "_token"),
+    ("GET", r"/contracts", "_get_contract"),
+    ("POST", r"/contracts/detailed/fixed_amount", "_new_contract"),
+    ("PATCH", r"/contracts/cancel", "_cancel_contract"),
+    ("POST", r"/positions/report", "_request_position_report"),
+    ("GET", r"/positions/report", "_get_position"),
+    ("POST", r"/recurrences", "_new_recurrence"),
+    ("GET", r"/recurrences", "_get_recurrence"),
+    ("GET", r"/recurrences/list", "_list_recurrences"),
+    ("PATCH", r"/recurrences/(?P<recurrence_id>[^/]+)/cancel", "_cancel_recurrence"),
+    ("PATCH", r"/recurrences/(?P<recurrence_id>[^/]+)/bank-account", "_update_bank_account"),
+    ("PATCH", r"/recurrences/(?P<recurrence_id>[^/]+)/discount-rate-per-year", "_update_discount_rate"),
+    ("GET", r"/recurrences/(?P<recurrence_id>[^/]+)/operations/list", "_list_operations"),
+    ("GET", r"/recurrences/(?P<recurrence_id>[^/]+)/operations/(?P<operation_id>[^/]+)", "_get_operation"),
+    ("GET", r"/recurrences/(?P<recurrence_id>[^/]+)/rrus/list", "_list_rrus"),
+    ("GET", r"/recurrences/(?P<recurrence_id>[^/]+)/rrus/(?P<rru_id>[^/]+)", "_get_rru"),
+]
+
+
+class FakeMSCServer:
+    """
+    Local stand-in of the MSC API, to load-test integrations and measure the SDK throughput without network.
+
+    Serves the endpoints used by the SDK (authenticate/token, contracts, positions/report, recurrences with their
+    operations and receivable units) from an in-memory dataset, with configurable latency and error injection.
+    Point the SDK to it with ``ConfigSDK.setup(environment, base_url=server.url)``.
+
+    Example:
+        with FakeMSCServer(latency=0.05, error_rate=0.01, volume=1000) as server:
+            ConfigSDK.setup(Environment.TEST, base_url=server.url)
+            ...
+
+    It can also be run standalone with ``python -m msc_sdk.testing.fake_server --port 8080``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        volume: int = 10,
+        items_per_recurrence: int = 10,
+        token_ttl: int = 6000,
+        msc_customer: str = "20299078000166",
+        seed: int = None,
+    ):
+        """
+        Args:
+            host (str, optional): The host the server listens on. Defaults to 127.0.0.1.
+            port (int, optional): The port the server listens on. Defaults to 0, for a free port.
+            latency (float, optional): The delay, in seconds, added to every response. Defaults to 0.
+            latency_jitter (float, optional): The maximum random delay, in seconds, added on top of the latency.
+            Defaults to 0.
+            error_rate (float, optional): The fraction of requests answered with ``error_status``. Defaults to 0.
+            error_status (int, optional): The status code of the injected errors. Defaults to 503.
+            volume (int, optional): The number of recurrences and contracts of the dataset. Defaults to 10.
+            items_per_recurrence (int, optional): The number of operations and receivable units of each
+            recurrence. Defaults to 10.
+            token_ttl (int, optional): The lifetime, in seconds, of the issued access tokens. Defaults to 6000.
+            msc_customer (str, optional): The customer document of the dataset. Defaults to 20299078000166.
+            seed (int, optional): The seed of the dataset, latency jitter and error injection. Defaults to None.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_ttl = token_ttl
+        self.msc_customer = msc_customer
+        self.requests = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._positions = {}
+        self._contracts = {}
+        self._recurrences = {}
+        self._operations = {}
+        self._rrus = {}
+        self._httpd = None
+        self._thread = None
+
+        self._build_dataset(volume, items_per_recurrence)
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the server.
+        """
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def contract_keys(self) -> list[str]:
+        """
+        The keys of the contracts of the dataset.
+        """
+        return list(self._contracts)
+
+    @property
+    def recurrence_ids(self) -> list[str]:
+        """
+        The ids of the recurrences of the dataset.
+        """
+        return list(self._recurrences)
+
+    def start(self) -> Self:
+        """
+        Starts serving in a background thread.
+        """
+        self._bind()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def serve_forever(self):
+        """
+        Serves in the current thread until interrupted.
+        """
+        self._bind()
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """
+        Stops the server started with ``start``.
+        """
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _bind(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self.port = self._httpd.server_address[1]
+
+    def _handle(self, method: str, path: str, query: dict, body: dict, authorization: str) -> tuple[int, dict]:
+        for route_method, pattern, name in _ROUTES:
+            match = re.fullmatch(pattern, path.rstrip("/"))
+
+            if route_method == method and match:
+                break
+        else:
+            return 404, {"detail": "Not found"}
+
+        with self._lock:
+            self.requests[name] += 1
+            delay = self.latency + self._rng.uniform(0, self.latency_jitter)
+            inject_error = self._rng.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if inject_error:
+            return self.error_status, {"detail": "Injected error"}
+
+        if name != "_token" and not self._authorized(authorization):
+            return 401, {"detail": "Unauthorized"}
+
+        with self._lock:
+            return getattr(self, name)(query, body, authorization=authorization, **match.groupdict())
+
+    def _authorized(self, authorization: str) -> bool:
+        if not authorization or not authorization.startswith("Bearer "):
+            return False
+
+        expires_at = self._tokens.get(authorization.removeprefix("Bearer "))
+
+        return expires_at is not None and time.time() < expires_at
+
+    # Authenticate
+
+    def _token(self, query: dict, body: dict, authorization: str) -> tuple[int, dict]:
+        if not authorization or not authorization.startswith("Basic "):
+            return 401, {"detail": "Unauthorized"}
+
+        user, _, password = base64.b64decode(authorization.removeprefix("Basic ")).decode().partition(":")
+
+        if not user or not password:
+            return 401, {"detail": "Unauthorized"}
+
+        access_token = uuid.uuid4().hex
+        self._tokens[access_token] = time.time() + self.token_ttl
+
+        return 200, dict(access_token=access_token, token_type="bearer", expires_in=self.token_ttl)
+
+    # Contracts
+
+    def _get_contract(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        contract = self._contracts.get(query.get("key"))
+
+        return (200, contract) if contract else (204, {})
+
+    def _new_contract(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        ur_list = [
+            dict(
+                ur_id=self._uuid(),
+                acquirer=position["acquirer"],
+                payment_scheme=position["payment_scheme"],
+                due_date=ur["due_date"],
+                effect_amount=ur["value_available"],
+                committed_effect_amount=0,
+                effect_priority=0,
+            )
+            for position in body.get("positions", [])
+            for ur in position["ur_list"]
+        ]
+        contract = self._contract(
+            asset_holder=body["asset_holder"],
+            bank_account=body["bank_account"],
+            contract_due_date=body["contract_due_date"],
+            effect_type=body["effect_type"],
+            division_method=body["division_method"],
+            ur_list=ur_list,
+        )
+
+        return 200, dict(key=contract["key"], asset_holder=contract["asset_holder"])
+
+    def _cancel_contract(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        contract = self._contracts.get(body.get("key"))
+
+        if not contract:
+            return 204, {}
+
+        contract.update(status="CANCELED", canceled_on=_now(), updated_on=_now())
+
+        return 200, dict(key=contract["key"], status=contract["status"])
+
+    # Positions
+
+    def _request_position_report(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        optin = [
+            dict(payment_scheme=item["payment_scheme"], acquirer=item["acquirer"], success=True)
+            for item in body.get("optin", [])
+        ]
+
+        return 200, dict(asset_holder=body.get("asset_holder"), optin=optin)
+
+    def _get_position(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        position_key = (query.get("asset_holder"), query.get("payment_scheme"), query.get("acquirer"))
+
+        if not all(position_key):
+            return 400, {"detail": "asset_holder, payment_scheme and acquirer are required"}
+
+        if position_key not in self._positions:
+            ur_list_resume = [
+                dict(due_date=_date(30 * (month + 1)), ur_amount=amount, value_available=amount)
+                for month, amount in enumerate(self._amount() for _ in range(3))
+            ]
+            self._positions[position_key] = dict(
+                key=self._uuid(),
+                asset_holder=position_key[0],
+                payment_scheme=position_key[1],
+                acquirer=position_key[2],
+                update_position_start=_now(),
+                update_position_end=_now(),
+                key_optin_tag=self._uuid(),
+                ur_list_resume=ur_list_resume,
+                total_ur_amount=sum(ur["ur_amount"] for ur in ur_list_resume),
+                total_value_available=sum(ur["value_available"] for ur in ur_list_resume),
+                ur_list_last_update=_now(),
+                created_on=_now(),
+            )
+
+        return 200, self._positions[position_key]
+
+    # Recurrences
+
+    def _new_recurrence(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        recurrence = self._recurrence(
+            asset_holder=body["asset_holder"],
+            acquirer=body["acquirer"],
+            payment_scheme=body["payment_scheme"],
+            bank_account=body["bank_account"],
+            ur_percentage=body.get("ur_percentage", 0),
+            discount_rate_per_year=body["discount_rate_per_year"],
+            msc_customer=body.get("msc_customer") or self.msc_customer,
+        )
+
+        return 200, recurrence
+
+    def _get_recurrence(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        if "recurrence_id" in query:
+            recurrence = self._recurrences.get(query["recurrence_id"])
+        else:
+            recurrence = next(
+                (item for item in self._recurrences.values() if item["contract_key"] == query.get("contract_key")),
+                None,
+            )
+
+        return (200, recurrence) if recurrence else (204, {})
+
+    def _list_recurrences(self, query: dict, body: dict, **kwargs) -> tuple[int, dict]:
+        return 200, dict(recurrences=_page(list(self._recurrences.values()), query))
+
+    def _cancel_recurrence(self, query: dict, body: dict, recurrence_id: str, **kwargs) -> tuple[int, dict]:
+        recurrence = self._recurrences.get(recurrence_id)
+
+        if not recurrence:
+            return 204, {}
+
+        recurrence.update(
+            status="CANCELLED", cancel_reason=query.get("cancel_reason"), cancelled_at=_now(), updated_at=_now()
+        )
+
+        return 200, recurrence
+
+    def _update_bank_account(self, query: dict, body: dict, recurrence_id: str, **kwargs) -> tuple[int, dict]:
+        recurrence = self._recurrences.get(recurrence_id)
+
+        if not recurrence:
+            return 204, {}
+
+        recurrence.update(bank_account=body, updated_at=_now())
+
+        return 200, recurrence["bank_account"]
+
+    def _update_discount_rate(self, query: dict, body: dict, recurrence_id: str, **kwargs) -> tuple[int, dict]:
+        recurrence = self._recurrences.get(recurrence_id)
+
+        if not recurrence:
+            return 204, {}
+
+        recurrence.update(discount_rate_per_year=float(query["new_discount_rate"]), updated_at=_now())
+
+        return 200, recurrence
+
+    def _list_operations(self, query: dict, body: dict, recurrence_id: str, **kwargs) -> tuple[int, dict]:
+        return 200, dict(operations=_page(self._operations.get(recurrence_id, []), query))
+
+    def _get_operation(
+        self, query: dict, body: dict, recurrence_id: str, operation_id: str, **kwargs
+    ) -> tuple[int, dict]:
+        operation = next((item for item in self._operations.get(recurrence_id, []) if item["id"] == operation_id), None)
+
+        return (200, operation) if operation else (204, {})
+
+    def _list_rrus(self, query: dict, body: dict, recurrence_id: str, **kwargs) -> tuple[int, dict]:
+        return 200, dict(rrus=_page(self._rrus.get(recurrence_id, []), query))
+
+    def _get_rru(self, query: dict, body: dict, recurrence_id: str, rru_id: str, **kwargs) -> tuple[int, dict]:
+        rru = next((item for item in self._rrus.get(recurrence_id, []) if item["id"] == rru_id), None)
+
+        return (200, rru) if rru else (204, {})
+
+    # Dataset
+
+    def _build_dataset(self, volume: int, items_per_recurrence: int):
+        for index in range(volume):
+            asset_holder = _ASSET_HOLDERS[index % len(_ASSET_HOLDERS)]
+            acquirer = _ACQUIRERS[index % len(_ACQUIRERS)]
+
+            contract = self._contract(
+                asset_holder=asset_holder,
+                bank_account=_BANK_ACCOUNT,
+                contract_due_date=_date(90),
+                effect_type="ownershipAssignment",
+                division_method="fixedAmount",
+                ur_list=[
+                    dict(
+                        ur_id=self._uuid(),
+                        acquirer=acquirer,
+                        payment_scheme=payment_scheme,
+                        due_date=_date(30),
+                        effect_amount=self._amount(),
+                        committed_effect_amount=0,
+                        effect_priority=0,
+                    )
+                    for payment_scheme in _PAYMENT_SCHEMES
+                ],
+            )
+            recurrence = self._recurrence(
+                asset_holder=asset_holder,
+                acquirer=acquirer,
+                payment_scheme=_PAYMENT_SCHEMES,
+                bank_account=_BANK_ACCOUNT,
+                ur_percentage=100,
+                discount_rate_per_year=1200,
+                msc_customer=self.msc_customer,
+                contract_key=contract["key"],
+            )
+
+            for item in range(items_per_recurrence):
+                self._add_operation_and_rru(recurrence, item)
+
+    def _contract(self, **data) -> dict:
+        contract = dict(
+            key=self._uuid(),
+            signature_date=_now(),
+            effect_strategy="specific",
+            balance_due=sum(ur["effect_amount"] for ur in data["ur_list"]),
+            committed_effect_amount=0,
+            status="PENDING",
+            created_on=_now(),
+            **data,
+        )
+        self._contracts[contract["key"]] = contract
+
+        return contract
+
+    def _recurrence(self, contract_key: str = None, **data) -> dict:
+        recurrence = dict(
+            id=self._uuid(),
+            status="ACTIVE",
+            msc_integrator=None,
+            contract_key=contract_key,
+            created_at=_now(),
+            **data,
+        )
+        self._recurrences[recurrence["id"]] = recurrence
+        self._operations[recurrence["id"]] = []
+        self._rrus[recurrence["id"]] = []
+
+        return recurrence
+
+    def _add_operation_and_rru(self, recurrence: dict, days_ago: int):
+        amount = self._amount()
+        discount_amount = amount // 100
+        ur = dict(
+            ur_id=self._uuid(),
+            asset_holder=recurrence["asset_holder"],
+            payment_scheme=recurrence["payment_scheme"][days_ago % len(recurrence["payment_scheme"])],
+            acquirer=recurrence["acquirer"],
+            due_date=_date(30 - days_ago),
+            payment_due_date=_date(30 - days_ago),
+            amount=amount,
+        )
+        operation = dict(
+            id=self._uuid(),
+            operation_date=_now(-days_ago),
+            recurrence_id=recurrence["id"],
+            asset_holder=recurrence["asset_holder"],
+            msc_customer=recurrence["msc_customer"],
+            operation_receivable_units=[
+                dict(
+                    discount_rate_per_year=recurrence["discount_rate_per_year"],
+                    discount_rate=100,
+                    discount_amount=discount_amount,
+                    amount_due=amount - discount_amount,
+                    **ur,
+                )
+            ],
+            amount=amount,
+            amount_due=amount - discount_amount,
+            amount_paid=amount - discount_amount,
+            bank_account=recurrence["bank_account"],
+            created_at=_now(-days_ago),
+        )
+        self._operations[recurrence["id"]].append(operation)
+        self._rrus[recurrence["id"]].append(
+            dict(
+                id=self._uuid(),
+                recurrence_id=recurrence["id"],
+                ur_id=ur["ur_id"],
+                asset_holder=ur["asset_holder"],
+                msc_customer=recurrence["msc_customer"],
+                acquirer=ur["acquirer"],
+                payment_scheme=ur["payment_scheme"],
+                due_date=ur["due_date"],
+                amount=amount,
+                total_operated_amount_gross=amount,
+                total_operated_amount_net=amount - discount_amount,
+                available_amount=0,
+                previous_amount=0,
+                previous_operated_amount_gross=0,
+                previous_operated_amount_net=0,
+                operations=[],
+                created_at=_now(-days_ago),
+            )
+        )
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _amount(self) -> int:
+        return self._rng.randint(1_000, 100_000)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_POST(self):
+        self._respond("POST")
+
+    def do_PATCH(self):
+        self._respond("PATCH")
+
+    def log_message(self, format: str, *args):
+        pass
+
+    def _respond(self, method: str):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or "{}") if length else {}
+
+        status, payload = self.server.fake._handle(method, url.path, query, body, self.headers.get("Authorization"))
+        content = json.dumps(payload).encode() if status != 204 else b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def _page(items: list, query: dict) -> list:
+    page, page_size = int(query.get("page", 1)), int(query.get("page_size", 100))
+
+    return items[(page - 1) * page_size : page * page_size]
+
+
+def _now(delta_days: int = 0) -> str:
+    return (datetime.now() + timedelta(days=delta_days)).isoformat()
+
+
+def _date(delta_days: int) -> str:
+    return (datetime.now() + timedelta(days=delta_days)).strftime("%Y-%m-%d")
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Runs a local fake MSC API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay added to every response, in seconds.")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Maximum random extra delay, in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with errors.")
+    parser.add_argument("--error-status", type=int, default=503, help="Status code of the injected errors.")
+    parser.add_argument("--volume", type=int, default=10, help="Number of recurrences and contracts.")
+    parser.add_argument("--items-per-recurrence", type=int, default=10, help="Operations and RRUs per recurrence.")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = FakeMSCServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        volume=args.volume,
+        items_per_recurrence=args.items_per_recurrence,
+        seed=args.seed,
+    )
+    print(f"Fake MSC API serving on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
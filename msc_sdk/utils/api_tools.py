@@ -1,5 +1,16 @@
+import copy
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, TypeVar
+
 from msc_sdk.enums import APINamespaces
 from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.errors import Unauthorized, ServerError, NotFound, BillingError, BadRequest, NotModified
+from msc_sdk.utils.transport import Transport, AsyncTransport
+
+if TYPE_CHECKING:
+    from msc_sdk.authenticate import Credential
+    from msc_sdk.utils.cache import ResourceCache
+
+M = TypeVar("M")
 
 
 def get_url(namespace: APINamespaces, api_path: str = None) -> str:
@@ -20,3 +31,237 @@ def get_url(namespace: APINamespaces, api_path: str = None) -> str:
         url = f"{ConfigSDK.get_config().base_url}{namespace.value}/{api_path}"
 
     return url
+
+
+def get_transport() -> Transport:
+    """
+    Returns the HTTP transport of the SDK configuration, shared by every API call.
+
+    Returns:
+        Transport: The configured transport.
+    """
+    return ConfigSDK.get_config().transport
+
+
+def get_async_transport() -> AsyncTransport:
+    """
+    Returns the asynchronous HTTP transport of the SDK configuration, shared by every async API call.
+
+    Returns:
+        AsyncTransport: The configured async transport.
+    """
+    return ConfigSDK.get_config().async_transport
+
+
+def cached_response(resource: str, credential: "Credential", ids: tuple, request: Callable[[], dict]) -> dict:
+    """
+    Returns the response data of a resource from the ResourceCache of the SDK configuration, sending the request
+    only on a miss. Without a configured cache, the request is always sent.
+
+    Args:
+        resource (str): The cached resource, e.g. "contract".
+        credential (Credential): The credential fetching the resource.
+        ids (tuple): The ids of the resource.
+        request (Callable[[], dict]): Sends the request and returns its response data.
+
+    Returns:
+        dict: The response data, which the caller can change.
+    """
+    cache = ConfigSDK.get_config().cache
+
+    if cache is None:
+        return request()
+
+    data = cache.get(resource, credential.document, *ids)
+
+    if data is None:
+        data = request()
+        cache.set(resource, credential.document, *ids, value=data)
+
+    return data
+
+
+async def acached_response(
+    resource: str, credential: "Credential", ids: tuple, request: Callable[[], Awaitable[dict]]
+) -> dict:
+    """
+    Async equivalent of cached_response.
+    """
+    cache = ConfigSDK.get_config().cache
+
+    if cache is None:
+        return await request()
+
+    data = cache.get(resource, credential.document, *ids)
+
+    if data is None:
+        data = await request()
+        cache.set(resource, credential.document, *ids, value=data)
+
+    return data
+
+
+def cached_model(
+    resource: str,
+    credential: "Credential",
+    ids: tuple,
+    request: Callable[[Dict[str, str]], Any],
+    build: Callable[[dict], M],
+) -> M:
+    """
+    Returns the model of a resource through the ResourceCache of the SDK configuration, revalidating stale entries
+    with a conditional request. Without a configured cache, the request is always sent.
+
+    A stale entry is requested with the ``If-None-Match``/``If-Modified-Since`` headers of its response; on a 304 the
+    model already built from it is reused without being validated again. When the API sends neither ``ETag`` nor
+    ``Last-Modified``, a response whose ``updated_on`` and ``ur_list_last_update`` did not change reuses it as well.
+
+    Args:
+        resource (str): The cached resource, e.g. "position".
+        credential (Credential): The credential fetching the resource.
+        ids (tuple): The ids of the resource.
+        request (Callable[[Dict[str, str]], Any]): Sends the request with the given extra headers and returns its
+        response.
+        build (Callable[[dict], M]): Builds the model from the response data.
+
+    Returns:
+        M: The model, which the caller can change.
+    """
+    cache = ConfigSDK.get_config().cache
+
+    if cache is None:
+        return build(request({}).json())
+
+    owner = credential.document
+    entry = cache.entry(resource, owner, *ids)
+
+    if entry is not None and cache.is_fresh(entry):
+        return _entry_model(cache, resource, owner, ids, entry, build)
+
+    try:
+        response = request(cache.conditional_headers(entry))
+    except NotModified:
+        if entry is None:
+            raise
+
+        return _entry_model(cache, resource, owner, ids, cache.renew(resource, owner, *ids, entry=entry), build)
+
+    return _response_model(cache, resource, owner, ids, response, build)
+
+
+async def acached_model(
+    resource: str,
+    credential: "Credential",
+    ids: tuple,
+    request: Callable[[Dict[str, str]], Awaitable[Any]],
+    build: Callable[[dict], M],
+) -> M:
+    """
+    Async equivalent of cached_model.
+    """
+    cache = ConfigSDK.get_config().cache
+
+    if cache is None:
+        return build((await request({})).json())
+
+    owner = credential.document
+    entry = cache.entry(resource, owner, *ids)
+
+    if entry is not None and cache.is_fresh(entry):
+        return _entry_model(cache, resource, owner, ids, entry, build)
+
+    try:
+        response = await request(cache.conditional_headers(entry))
+    except NotModified:
+        if entry is None:
+            raise
+
+        return _entry_model(cache, resource, owner, ids, cache.renew(resource, owner, *ids, entry=entry), build)
+
+    return _response_model(cache, resource, owner, ids, response, build)
+
+
+def _response_model(cache: "ResourceCache", resource: str, owner: str, ids: tuple, response, build: Callable):
+    data = response.json()
+    entry = cache.set(
+        resource,
+        owner,
+        *ids,
+        value=data,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        version=_data_version(data),
+    )
+
+    if entry is None:
+        return build(data)
+
+    return _entry_model(cache, resource, owner, ids, entry, build, data)
+
+
+def _entry_model(
+    cache: "ResourceCache", resource: str, owner: str, ids: tuple, entry: dict, build: Callable, data: dict = None
+):
+    tag = cache.tag(entry)
+    model = cache.model(resource, owner, *ids, tag=tag)
+
+    if model is None:
+        model = build(data if data is not None else copy.deepcopy(entry["data"]))
+        cache.set_model(resource, owner, *ids, tag=tag, model=model)
+
+    return model
+
+
+def _data_version(data: dict) -> str | None:
+    if not isinstance(data, dict) or not (data.get("updated_on") or data.get("ur_list_last_update")):
+        return None
+
+    return f"{data.get('updated_on')}|{data.get('ur_list_last_update')}"
+
+
+def invalidate_cached(resource: str, credential: "Credential", *ids: str):
+    """
+    Drops a resource changed by the SDK from the ResourceCache of the SDK configuration, if any.
+    """
+    cache = ConfigSDK.get_config().cache
+
+    if cache is not None:
+        cache.invalidate(resource, credential.document, *ids)
+
+
+def raise_for_status(response, not_found_message: str = None):
+    """
+    Raises the SDK error matching the status code of an unsuccessful response.
+
+    Args:
+        response: The response of the request, from either the sync or the async transport.
+        not_found_message (str, optional): The message of the NotFound error raised on a 204. Defaults to None.
+
+    Raises:
+        NotFound: If the response status code is 204.
+        NotModified: If the response status code is 304, the answer to a conditional request.
+        BadRequest: If the response status code is 400.
+        Unauthorized: If the response status code is 401.
+        BillingError: If the response status code is 402.
+        ServerError: If the response status code is 500 or above.
+        Exception: If the response status code is none of the above.
+    """
+    if response.status_code == 204:
+        raise NotFound(not_found_message)
+
+    elif response.status_code == 304:
+        raise NotModified()
+
+    elif response.status_code == 400:
+        raise BadRequest(response.text)
+
+    elif response.status_code == 401:
+        raise Unauthorized("Wrong credentials")
+
+    elif response.status_code == 402:
+        raise BillingError(response.text)
+
+    elif response.status_code >= 500:
+        raise ServerError("Server error")
+
+    raise Exception(f"Unexpected error - status code {response.status_code} - response: {response.text}")
@@ -0,0 +1,279 @@
+import copy
+import threading
+import time
+from typing import Any, Dict
+
+from cachetools import LRUCache
+
+
+class CacheStore:
+    """
+    Storage backend of the ResourceCache.
+
+    Keys are opaque strings and values are the cache entries, holding the JSON data of the API responses and their
+    validators, stored with their expiry as a Unix timestamp. Subclasses can share the cache between processes (e.g.
+    in Redis).
+    """
+
+    def get(self, key: str) -> Any | None:
+        """
+        Returns the value stored for the key, or None if it is missing or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, expires_at: float):
+        """
+        Stores the value of the key until the given expiry.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """
+        Drops the value of the key.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Drops every value.
+        """
+        raise NotImplementedError
+
+
+class MemoryCacheStore(CacheStore):
+    """
+    Stores the values in the memory of the current process, evicting the least recently used ones.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize (int): The maximum number of values kept. Defaults to 1024.
+        """
+        self._values = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._values.get(key)
+
+            if entry is None:
+                return None
+
+            if time.time() >= entry[1]:
+                del self._values[key]
+                return None
+
+            return entry[0]
+
+    def set(self, key: str, value: Any, expires_at: float):
+        with self._lock:
+            self._values[key] = (value, expires_at)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class ResourceCache:
+    """
+    Read-through cache of the API resources fetched by key: contracts, positions, recurrences, operations and
+    receivable units.
+
+    Entries are keyed by the credential and the id of the resource, kept for the TTL of their resource, and dropped
+    by the SDK mutations of the same resource (e.g. Contract.cancel_by_key, Recurrence.cancel). Every hit returns a
+    copy of the cached data, so the models built from it can be changed freely.
+
+    Entries with a validator, the ``ETag``/``Last-Modified`` of their response or the ``updated_on`` and
+    ``ur_list_last_update`` of their data, are kept ``revalidate_for`` seconds after their TTL, so stale contracts
+    and positions are revalidated with a conditional request instead of being downloaded again. The models built
+    from them are kept in the current process and reused while their entry is not modified.
+    """
+
+    RESOURCES = ("contract", "position", "recurrence", "operation", "rru")
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        ttls: Dict[str, float] = None,
+        store: CacheStore = None,
+        revalidate_for: float = 3600.0,
+        models: int = 256,
+    ):
+        """
+        Args:
+            ttl (float): The time, in seconds, a resource is cached. Defaults to 60.
+            ttls (Dict[str, float], optional): The TTL of specific resources, e.g. ``{"position": 5}``; with a TTL of
+            0 every read of the resource is sent, conditionally if its entry has a validator. Defaults to None.
+            store (CacheStore, optional): The backend where the responses are stored. Defaults to a
+            MemoryCacheStore.
+            revalidate_for (float): The time, in seconds, a stale entry with a validator is kept to be revalidated;
+            0 disables conditional requests. Defaults to 3600.
+            models (int): The maximum number of built models kept for reuse. Defaults to 256.
+        """
+        unknown = set(ttls or {}) - set(self.RESOURCES)
+
+        if unknown:
+            raise ValueError(f"Unknown resources: {', '.join(sorted(unknown))}")
+
+        self.ttls = {resource: ttl for resource in self.RESOURCES} | (ttls or {})
+        self.store = store or MemoryCacheStore()
+        self.revalidate_for = revalidate_for
+        self._models = LRUCache(maxsize=models)
+        self._models_lock = threading.Lock()
+
+    def get(self, resource: str, owner: str, *ids: str) -> Any | None:
+        """
+        Returns a copy of the cached response data of the resource, or None.
+
+        Args:
+            resource (str): The resource, one of RESOURCES.
+            owner (str): The document of the credential that fetched it.
+            *ids (str): The ids of the resource.
+        """
+        entry = self.entry(resource, owner, *ids)
+
+        if entry is None or not self.is_fresh(entry):
+            return None
+
+        return copy.deepcopy(entry["data"])
+
+    def set(
+        self,
+        resource: str,
+        owner: str,
+        *ids: str,
+        value: Any,
+        etag: str = None,
+        last_modified: str = None,
+        version: str = None,
+    ) -> dict | None:
+        """
+        Caches a copy of the response data of the resource for its TTL, along with its validators.
+
+        Args:
+            value (Any): The response data.
+            etag (str, optional): The ``ETag`` header of the response. Defaults to None.
+            last_modified (str, optional): The ``Last-Modified`` header of the response. Defaults to None.
+            version (str, optional): The version of the data, used when the response has no validator header.
+            Defaults to None.
+
+        Returns:
+            dict | None: The stored entry, or None if the resource is not cached.
+        """
+        ttl = self.ttls[resource]
+        revalidate_for = self.revalidate_for if etag or last_modified or version else 0
+
+        if not ttl and not revalidate_for:
+            return None
+
+        now = time.time()
+        entry = dict(
+            data=copy.deepcopy(value),
+            etag=etag,
+            last_modified=last_modified,
+            version=version,
+            fresh_until=now + ttl,
+        )
+        self.store.set(self._key(resource, owner, ids), entry, now + ttl + revalidate_for)
+
+        return entry
+
+    def entry(self, resource: str, owner: str, *ids: str) -> dict | None:
+        """
+        Returns the stored entry of the resource, fresh or kept for revalidation, without copying its data.
+        """
+        return self.store.get(self._key(resource, owner, ids))
+
+    def renew(self, resource: str, owner: str, *ids: str, entry: dict) -> dict:
+        """
+        Keeps an entry revalidated by the API (a 304 response) for another TTL of its resource.
+
+        Returns:
+            dict: The renewed entry.
+        """
+        now = time.time()
+        ttl = self.ttls[resource]
+        entry = entry | dict(fresh_until=now + ttl)
+        self.store.set(self._key(resource, owner, ids), entry, now + ttl + self.revalidate_for)
+
+        return entry
+
+    def model(self, resource: str, owner: str, *ids: str, tag: str) -> Any | None:
+        """
+        Returns a copy of the model built from the entry with the given tag, or None.
+        """
+        if tag is None:
+            return None
+
+        with self._models_lock:
+            cached = self._models.get(self._key(resource, owner, ids))
+
+        if cached is None or cached[0] != tag:
+            return None
+
+        return cached[1].model_copy(deep=True)
+
+    def set_model(self, resource: str, owner: str, *ids: str, tag: str, model: Any):
+        """
+        Keeps a copy of the model built from the entry with the given tag.
+        """
+        if tag is not None:
+            with self._models_lock:
+                self._models[self._key(resource, owner, ids)] = (tag, model.model_copy(deep=True))
+
+    def invalidate(self, resource: str, owner: str, *ids: str):
+        """
+        Drops the cached response data of the resource.
+        """
+        key = self._key(resource, owner, ids)
+        self.store.delete(key)
+
+        with self._models_lock:
+            self._models.pop(key, None)
+
+    def clear(self):
+        """
+        Drops every cached resource.
+        """
+        self.store.clear()
+
+        with self._models_lock:
+            self._models.clear()
+
+    @staticmethod
+    def is_fresh(entry: dict) -> bool:
+        """
+        Whether the entry can be served without a request.
+        """
+        return time.time() < entry["fresh_until"]
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> Dict[str, str]:
+        """
+        Returns the ``If-None-Match``/``If-Modified-Since`` headers revalidating the entry, if it has validators.
+        """
+        headers = {}
+
+        if entry is not None and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+
+        if entry is not None and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+    @staticmethod
+    def tag(entry: dict) -> str | None:
+        """
+        Identifies the state of the resource in the entry: its ETag, Last-Modified or version, or None.
+        """
+        return entry["etag"] or entry["last_modified"] or entry["version"]
+
+    @staticmethod
+    def _key(resource: str, owner: str, ids: tuple) -> str:
+        return "\x00".join((resource, owner, *(str(value or "") for value in ids)))
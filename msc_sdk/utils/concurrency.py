@@ -0,0 +1,43 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+def run_concurrently(calls: Dict[Hashable, Callable], concurrency: int = 8) -> Dict[Hashable, object]:
+    """
+    Runs the given calls in a bounded thread pool, collecting each result or error.
+
+    Args:
+        calls (Dict[Hashable, Callable]): The calls to run, without arguments, by key.
+        concurrency (int, optional): The maximum number of calls running at the same time. Defaults to 8.
+
+    Returns:
+        Dict[Hashable, object]: The result of each call by key, or the exception it raised.
+    """
+    if not calls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(calls))) as executor:
+        futures = {key: executor.submit(call) for key, call in calls.items()}
+
+    results = {}
+    for key, future in futures.items():
+        error = future.exception()
+        results[key] = error if error is not None else future.result()
+
+    return results
+
+
+async def arun_concurrently(calls: Dict[Hashable, Callable[[], Awaitable]], concurrency: int = 8) -> Dict:
+    """
+    Async equivalent of run_concurrently, bounding the calls awaited at the same time with a semaphore.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], Awaitable]):
+        async with semaphore:
+            return await call()
+
+    results = await asyncio.gather(*[run(call) for call in calls.values()], return_exceptions=True)
+
+    return dict(zip(calls.keys(), results))
@@ -1,6 +1,9 @@
 from datetime import datetime
 from typing import List, Dict
 
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.utils.money import Cents, MoneyMode
+
 
 def list_int_to_float(data_list: List[Dict], fields_to_convert: List[str]) -> List[Dict]:
     """
@@ -40,6 +43,29 @@ def list_float_to_int(data_list: List[Dict], fields_to_convert: List[str]) -> Li
     return data_list
 
 
+def list_cents_to_amount(data_list: List[Dict], fields_to_convert: List[str]) -> List[Dict]:
+    """
+    Converts specified money fields in a list from the API integer cents to the money mode of the SDK: floats
+    in MoneyMode.FLOAT, Cents in MoneyMode.CENTS.
+
+    Args:
+        data_list: A list containing the list data.
+        fields_to_convert: A list of money fields to convert.
+
+    Returns:
+        A list with specified fields converted.
+    """
+    if ConfigSDK.get_config().money_mode != MoneyMode.CENTS:
+        return list_int_to_float(data_list, fields_to_convert)
+
+    for item in data_list:
+        for field_name in fields_to_convert:
+            if item.get(field_name) is not None:
+                item[field_name] = Cents(item[field_name])
+
+    return data_list
+
+
 def dict_int_to_float(model_dict: Dict, fields_to_convert: List[str]) -> Dict:
     """
     Converts specified fields in a dictionary from integers to floats with two decimal places precision.
@@ -75,6 +101,27 @@ def dict_float_to_int(model_dict: Dict, fields_to_convert: List[str]) -> Dict:
     return model_dict
 
 
+def dict_cents_to_amount(model_dict: Dict, fields_to_convert: List[str]) -> Dict:
+    """
+    Converts specified money fields in a dictionary from the API integer cents to the money mode of the SDK.
+
+    Args:
+        model_dict: A dictionary containing the dict data.
+        fields_to_convert: A list of money fields to convert.
+
+    Returns:
+        A dictionary with specified fields converted.
+    """
+    if ConfigSDK.get_config().money_mode != MoneyMode.CENTS:
+        return dict_int_to_float(model_dict, fields_to_convert)
+
+    for field_name in fields_to_convert:
+        if model_dict.get(field_name) is not None:
+            model_dict[field_name] = Cents(model_dict[field_name])
+
+    return model_dict
+
+
 def datetime_to_date_str(dt: datetime = datetime.now()) -> str:
     return dt.strftime("%Y-%m-%d")
 
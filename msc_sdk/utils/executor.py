@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+import requests
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.utils.api_tools import get_transport, get_async_transport, raise_for_status
+from msc_sdk.utils.retry import RetryPolicy
+
+
+def execute(method: str, url: str, not_found_message: str = None, deadline: float = None, **kwargs):
+    """
+    Sends a request through the shared transport, applying the retry policy of the SDK configuration.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The URL of the request.
+        not_found_message (str, optional): The message of the NotFound error raised on a 204. Defaults to None.
+        deadline (float, optional): Overrides the deadline, in seconds, of the retry policy for this call.
+        **kwargs: Extra arguments forwarded to the transport.
+
+    Returns:
+        requests.Response: The successful response of the request.
+
+    Raises:
+        NotFound, NotModified, BadRequest, Unauthorized, BillingError, ServerError: If the response status code is
+        not 200.
+        requests.RequestException: If the request still fails after the last attempt.
+    """
+    policy = ConfigSDK.get_config().retry_policy
+    expires_at = _expires_at(policy, deadline)
+    timeout = kwargs.pop("timeout", None)
+
+    transport = get_transport()
+    timeout = _configured_timeout(policy, transport, timeout)
+
+    attempt = 0
+    while True:
+        _set_timeout(kwargs, _attempt_timeout(expires_at, timeout))
+
+        response, error = None, None
+        try:
+            response = transport.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            error = e
+
+        if error is None and response.status_code == 200:
+            return response
+
+        delay = policy.retry_delay(method, attempt, response=response, error=error)
+
+        if delay is None or not _fits_deadline(expires_at, delay):
+            if error is not None:
+                raise error
+
+            raise_for_status(response, not_found_message)
+
+        time.sleep(delay)
+        attempt += 1
+
+
+async def async_execute(method: str, url: str, not_found_message: str = None, deadline: float = None, **kwargs):
+    """
+    Async equivalent of execute, sending the request through the shared async transport.
+    """
+    import httpx
+
+    policy = ConfigSDK.get_config().retry_policy
+    expires_at = _expires_at(policy, deadline)
+    timeout = kwargs.pop("timeout", None)
+
+    transport = get_async_transport()
+    timeout = _configured_timeout(policy, transport, timeout)
+
+    attempt = 0
+    while True:
+        _set_timeout(kwargs, _attempt_timeout(expires_at, timeout))
+
+        response, error = None, None
+        try:
+            response = await transport.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            error = e
+
+        if error is None and response.status_code == 200:
+            return response
+
+        delay = policy.retry_delay(method, attempt, response=response, error=error)
+
+        if delay is None or not _fits_deadline(expires_at, delay):
+            if error is not None:
+                raise error
+
+            raise_for_status(response, not_found_message)
+
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _expires_at(policy: RetryPolicy, deadline: float = None) -> float | None:
+    deadline = deadline if deadline is not None else policy.deadline
+
+    if deadline is None:
+        return None
+
+    return time.monotonic() + deadline
+
+
+def _configured_timeout(policy: RetryPolicy, transport, timeout: float = None) -> float | None:
+    """
+    Returns the timeout of each attempt: the one of the call, else the one of the retry policy, else the one of the
+    transport.
+    """
+    for configured in (timeout, policy.timeout, transport.timeout):
+        if configured is not None:
+            return configured
+
+    return None
+
+
+def _attempt_timeout(expires_at: float | None, timeout: float = None) -> float | None:
+    if expires_at is None:
+        return timeout
+
+    remaining = max(expires_at - time.monotonic(), 0.001)
+
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _set_timeout(kwargs: dict, timeout: float | None):
+    # Without a timeout, the default of the transport applies.
+    if timeout is None:
+        kwargs.pop("timeout", None)
+    else:
+        kwargs["timeout"] = timeout
+
+
+def _fits_deadline(expires_at: float | None, delay: float) -> bool:
+    return expires_at is None or time.monotonic() + delay < expires_at
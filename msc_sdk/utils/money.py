@@ -0,0 +1,120 @@
+from decimal import Decimal, ROUND_HALF_UP
+from enum import Enum
+from typing import Annotated, Iterable
+
+from pydantic import PlainSerializer, SerializationInfo, ValidationInfo, WrapValidator
+
+
+class MoneyMode(str, Enum):
+    """
+    How the amounts sent by the API in integer cents are kept in the models.
+
+    FLOAT converts them to floats (e.g. 10.5), as the SDK always did. CENTS keeps them as exact integer cents
+    (e.g. Cents(1050)), which avoids the float round-trip and its truncations (0.29 * 100 = 28.999...).
+    """
+
+    FLOAT = "float"
+    CENTS = "cents"
+
+    def __str__(self):
+        return self.value
+
+
+class Cents(int):
+    """
+    An exact amount of money, in integer cents.
+
+    Arithmetic between Cents returns Cents, so sums of amounts stay exact. ``as_decimal`` and ``as_float`` give the
+    amount in currency units.
+    """
+
+    __slots__ = ()
+
+    def as_decimal(self) -> Decimal:
+        """
+        Returns the amount in currency units as a Decimal, e.g. Decimal("10.50") for Cents(1050).
+        """
+        return Decimal(int(self)).scaleb(-2)
+
+    def as_float(self) -> float:
+        """
+        Returns the amount in currency units as a float, e.g. 10.5 for Cents(1050).
+        """
+        return int(self) / 100
+
+    @classmethod
+    def from_amount(cls, amount: float | Decimal | str) -> "Cents":
+        """
+        Converts an amount in currency units to Cents, rounding half up instead of truncating.
+
+        Args:
+            amount (float | Decimal | str): The amount in currency units, e.g. 0.29.
+
+        Returns:
+            Cents: The exact amount in cents, e.g. Cents(29).
+        """
+        if isinstance(amount, float):
+            amount = repr(amount)
+
+        return cls(Decimal(amount).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+    @classmethod
+    def total(cls, amounts: Iterable[int]) -> "Cents":
+        """
+        Sums amounts in cents exactly.
+        """
+        return cls(sum(amounts))
+
+    def __add__(self, other):
+        result = int.__add__(self, other)
+        return Cents(result) if isinstance(other, int) and result is not NotImplemented else result
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        result = int.__sub__(self, other)
+        return Cents(result) if isinstance(other, int) and result is not NotImplemented else result
+
+    def __rsub__(self, other):
+        result = int.__rsub__(self, other)
+        return Cents(result) if isinstance(other, int) and result is not NotImplemented else result
+
+    def __neg__(self):
+        return Cents(-int(self))
+
+    def __repr__(self) -> str:
+        return f"Cents({int(self)})"
+
+
+WIRE_FORMAT = {"wire_format": True}
+"""
+Serialization context that dumps every Amount in the API wire format, integer cents, e.g.
+``model.model_dump_json(context=WIRE_FORMAT)``. As a validation context, integer amounts are read back as cents, e.g.
+``Model.model_validate_json(data, context=WIRE_FORMAT)``.
+"""
+
+
+def _validate_amount(value, handler, info: ValidationInfo):
+    if isinstance(value, Cents):
+        return value
+
+    if isinstance(value, int) and info.context and info.context.get("wire_format"):
+        # Imported here, the configuration of the SDK imports this module.
+        from msc_sdk.config_sdk import ConfigSDK
+
+        return Cents(value) if ConfigSDK.get_config().money_mode == MoneyMode.CENTS else value / 100
+
+    return handler(value)
+
+
+def _serialize_amount(value, info: SerializationInfo):
+    if isinstance(value, float) and info.context and info.context.get("wire_format"):
+        return Cents.from_amount(value)
+
+    return value
+
+
+Amount = Annotated[float, WrapValidator(_validate_amount), PlainSerializer(_serialize_amount)]
+"""
+A money field: a float in MoneyMode.FLOAT, or Cents when the SDK runs in MoneyMode.CENTS.
+"""
@@ -0,0 +1,171 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List
+
+from msc_sdk.errors import NotFound
+
+
+def iter_pages(
+    fetch_page: Callable[[int], List], page_size: int, start_page: int = 1, prefetch: bool = False
+) -> Iterator[List]:
+    """
+    Lazily walks a paginated list endpoint, yielding one page at a time.
+
+    The walk stops on an empty page, on a page shorter than page_size, or when the API answers the page
+    is not found.
+
+    Args:
+        fetch_page (Callable[[int], List]): Fetches the items of the given page number.
+        page_size (int): The number of items requested per page.
+        start_page (int, optional): The first page to fetch. Defaults to 1.
+        prefetch (bool, optional): Fetches the next page in a background thread while the current one is
+        consumed. Defaults to False.
+
+    Yields:
+        List: The items of each page.
+    """
+    if not prefetch:
+        page = start_page
+        while True:
+            items = _fetch_or_empty(fetch_page, page)
+
+            if items:
+                yield items
+
+            if len(items) < page_size:
+                return
+
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = start_page
+        future = executor.submit(_fetch_or_empty, fetch_page, page)
+        while True:
+            items = future.result()
+
+            if len(items) >= page_size:
+                future = executor.submit(_fetch_or_empty, fetch_page, page + 1)
+
+            if items:
+                yield items
+
+            if len(items) < page_size:
+                return
+
+            page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[List]], page_size: int, start_page: int = 1, prefetch: bool = False
+) -> AsyncIterator[List]:
+    """
+    Async equivalent of iter_pages, prefetching the next page in a background task.
+    """
+    page = start_page
+    task = asyncio.ensure_future(_afetch_or_empty(fetch_page, page))
+    try:
+        while True:
+            items = await task
+
+            if prefetch and len(items) >= page_size:
+                task = asyncio.ensure_future(_afetch_or_empty(fetch_page, page + 1))
+
+            if items:
+                yield items
+
+            if len(items) < page_size:
+                return
+
+            page += 1
+
+            if not prefetch:
+                task = asyncio.ensure_future(_afetch_or_empty(fetch_page, page))
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def fetch_pages(
+    fetch_page: Callable[[int], List], page_size: int, concurrency: int = 4, start_page: int = 1
+) -> List[List]:
+    """
+    Fetches every page of a paginated list endpoint, requesting up to ``concurrency`` pages at a time.
+
+    The first page is fetched alone; if it is full, the following pages are requested in concurrent waves
+    until a short or missing page is found. Pages past the end may be requested by the last wave.
+
+    Args:
+        fetch_page (Callable[[int], List]): Fetches the items of the given page number.
+        page_size (int): The number of items requested per page.
+        concurrency (int, optional): The maximum number of pages fetched at the same time. Defaults to 4.
+        start_page (int, optional): The first page to fetch. Defaults to 1.
+
+    Returns:
+        List[List]: The items of each page, in page order.
+    """
+    first = _fetch_or_empty(fetch_page, start_page)
+    pages = [first] if first else []
+
+    if len(first) < page_size:
+        return pages
+
+    next_page = start_page + 1
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            wave = executor.map(
+                lambda page: _fetch_or_empty(fetch_page, page), range(next_page, next_page + concurrency)
+            )
+
+            for items in wave:
+                if items:
+                    pages.append(items)
+
+                if len(items) < page_size:
+                    return pages
+
+            next_page += concurrency
+
+
+async def afetch_pages(
+    fetch_page: Callable[[int], Awaitable[List]], page_size: int, concurrency: int = 4, start_page: int = 1
+) -> List[List]:
+    """
+    Async equivalent of fetch_pages.
+    """
+    first = await _afetch_or_empty(fetch_page, start_page)
+    pages = [first] if first else []
+
+    if len(first) < page_size:
+        return pages
+
+    next_page = start_page + 1
+    while True:
+        wave = await asyncio.gather(
+            *[_afetch_or_empty(fetch_page, page) for page in range(next_page, next_page + concurrency)]
+        )
+
+        for items in wave:
+            if items:
+                pages.append(items)
+
+            if len(items) < page_size:
+                return pages
+
+        next_page += concurrency
+
+
+def _fetch_or_empty(fetch_page: Callable[[int], List], page: int) -> List:
+    try:
+        return fetch_page(page)
+    except NotFound:
+        return []
+
+
+async def _afetch_or_empty(fetch_page: Callable[[int], Awaitable[List]], page: int) -> List:
+    try:
+        return await fetch_page(page)
+    except NotFound:
+        return []
@@ -0,0 +1,145 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from urllib3.exceptions import ProtocolError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """
+    Retry policy of the request executor, shared by every API call.
+
+    Idempotent requests are retried on connection errors, timeouts and transient status codes. Non-idempotent
+    requests are only retried when the connection could not be established, or when the server explicitly asks
+    for a retry with a ``Retry-After`` header. Waits between attempts grow exponentially with full jitter, while a
+    ``Retry-After`` wait is respected as is, within the deadline of the call.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: tuple = (429, 502, 503, 504),
+        timeout: float = None,
+        deadline: float = 120.0,
+    ):
+        """
+        Args:
+            max_attempts (int): The maximum number of attempts of each call. Defaults to 5.
+            backoff_factor (float): The base wait, in seconds, doubled on each retry. Defaults to 0.5.
+            max_backoff (float): The maximum backoff, in seconds, between two attempts. Defaults to 30.
+            retry_statuses (tuple): The transient status codes that are retried. Defaults to (429, 502, 503, 504).
+            timeout (float, optional): The timeout, in seconds, of each attempt, overriding the timeout of the
+            transport. Defaults to None.
+            deadline (float, optional): The maximum time, in seconds, spent on a call including its retries.
+            Defaults to 120.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.timeout = timeout
+        self.deadline = deadline
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the wait before the next attempt, using exponential backoff with full jitter.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 0.
+
+        Returns:
+            float: The wait, in seconds.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
+
+    def retry_delay(self, method: str, attempt: int, response=None, error: Exception = None) -> float | None:
+        """
+        Decides whether a failed attempt is retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the failed attempt, starting at 0.
+            response (optional): The response of the attempt, if any.
+            error (Exception, optional): The transport error of the attempt, if any.
+
+        Returns:
+            float | None: The wait, in seconds, before the next attempt, or None if it must not be retried.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        if error is not None:
+            if idempotent and _is_transient_error(error):
+                return self.backoff(attempt)
+
+            if _is_connect_error(error):
+                return self.backoff(attempt)
+
+            return None
+
+        if response.status_code not in self.retry_statuses:
+            return None
+
+        retry_after = _retry_after(response)
+
+        if retry_after is not None and response.status_code in (429, 503):
+            return retry_after
+
+        if idempotent:
+            return self.backoff(attempt)
+
+        return None
+
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+
+    try:
+        import httpx
+    except ImportError:
+        return False
+
+    return isinstance(error, httpx.TransportError)
+
+
+def _is_connect_error(error: Exception) -> bool:
+    """
+    Whether the request failed before reaching the server, so it is safe to retry even if not idempotent.
+    """
+    if isinstance(error, requests.ConnectionError):
+        # A connection dropped after the request was sent may have reached the server.
+        return not any(isinstance(arg, ProtocolError) for arg in error.args)
+
+    try:
+        import httpx
+    except ImportError:
+        return False
+
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _retry_after(response) -> float | None:
+    value = response.headers.get("Retry-After")
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
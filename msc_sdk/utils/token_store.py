@@ -0,0 +1,167 @@
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class TokenStore:
+    """
+    Storage backend of the tokens managed by the TokenManager.
+
+    Keys are opaque hashes of the credential, tokens are stored with their expiry as a Unix timestamp.
+    Subclasses can share the tokens between processes, in which case ``locked`` must serialize the token
+    requests across those processes.
+    """
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """
+        Returns the access token and its expiry stored for the key, or None.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, access_token: str, expires_at: float):
+        """
+        Stores the access token of the key until the given expiry.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """
+        Drops the token of the key.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Drops every token.
+        """
+        raise NotImplementedError
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Serializes token requests between every user of the store.
+        """
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """
+    Stores the tokens in the memory of the current process.
+    """
+
+    def __init__(self):
+        self._tokens = {}
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        return self._tokens.get(key)
+
+    def set(self, key: str, access_token: str, expires_at: float):
+        self._tokens[key] = (access_token, expires_at)
+
+    def delete(self, key: str):
+        self._tokens.pop(key, None)
+
+    def clear(self):
+        self._tokens.clear()
+
+
+class FileTokenStore(TokenStore):
+    """
+    Stores the tokens in a local file shared by every process of the host.
+
+    Reads and writes are guarded by an exclusive lock on a sibling ``.lock`` file, and the file is only
+    readable by its owner.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path (str, optional): The path of the token file. Defaults to ``msc_sdk_tokens_<uid>.json`` in the
+            temporary directory of the user.
+        """
+        self.path = path or os.path.join(tempfile.gettempdir(), f"msc_sdk_tokens_{_user_id()}.json")
+        self.lock_path = f"{self.path}.lock"
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        with self.locked():
+            token = self._read().get(key)
+
+        if token is None:
+            return None
+
+        return token["access_token"], token["expires_at"]
+
+    def set(self, key: str, access_token: str, expires_at: float):
+        with self.locked():
+            tokens = self._read()
+            tokens[key] = dict(access_token=access_token, expires_at=expires_at)
+            self._write(tokens)
+
+    def delete(self, key: str):
+        with self.locked():
+            tokens = self._read()
+
+            if tokens.pop(key, None) is not None:
+                self._write(tokens)
+
+    def clear(self):
+        with self.locked():
+            self._write({})
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                self._lock_file = open(self.lock_path, "a")
+
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+
+                if self._lock_depth == 0:
+                    if fcntl is not None:
+                        fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path) as file:
+                tokens = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        now = time.time()
+
+        return {key: token for key, token in tokens.items() if token.get("expires_at", 0) > now}
+
+    def _write(self, tokens: dict):
+        temp_path = f"{self.path}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        with os.fdopen(fd, "w") as file:
+            json.dump(tokens, file)
+
+        os.replace(temp_path, self.path)
+
+
+def _user_id() -> str:
+    return str(os.getuid()) if hasattr(os, "getuid") else os.getlogin()
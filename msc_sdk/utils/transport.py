@@ -0,0 +1,154 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class Transport:
+    """
+    HTTP transport shared by every API call, backed by a keep-alive requests.Session.
+
+    Connections are pooled per host, so consecutive calls to the MSC API reuse the same
+    TCP/TLS connection instead of performing a new handshake on every request.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, timeout: float = None):
+        """
+        Args:
+            pool_connections (int): The number of host pools to keep cached. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept alive per host. Defaults to 10.
+            timeout (float, optional): Default timeout, in seconds, of each request. Defaults to None.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            # The first calls may come from several threads at once, only one of them creates the session.
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request through the pooled session.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL of the request.
+            **kwargs: Extra arguments forwarded to requests.Session.request.
+
+        Returns:
+            requests.Response: The response of the request.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def close(self):
+        """
+        Closes the session and every pooled connection.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class AsyncTransport:
+    """
+    Asynchronous HTTP transport shared by every async API call, backed by a pooled httpx.AsyncClient.
+
+    Requires the optional ``httpx`` dependency (``pip install msc-sdk[aio]``).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = None,
+        http_transport=None,
+    ):
+        """
+        Args:
+            max_connections (int): The maximum number of concurrent connections. Defaults to 100.
+            max_keepalive_connections (int): The maximum number of idle connections kept alive. Defaults to 20.
+            timeout (float, optional): Default timeout, in seconds, of each request. Defaults to None.
+            http_transport (httpx.AsyncBaseTransport, optional): A custom httpx transport, e.g. for testing.
+            Defaults to None.
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+        self.http_transport = http_transport
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "httpx is required for async calls, install it with 'pip install msc-sdk[aio]'"
+                ) from e
+
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+                timeout=self.timeout,
+                transport=self.http_transport,
+            )
+
+        return self._client
+
+    async def request(self, method: str, url: str, **kwargs):
+        """
+        Sends a request through the pooled client.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL of the request.
+            **kwargs: Extra arguments forwarded to httpx.AsyncClient.request.
+
+        Returns:
+            httpx.Response: The response of the request.
+        """
+        return await self.client.request(method=method, url=url, **kwargs)
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs):
+        return await self.request("PATCH", url, **kwargs)
+
+    async def aclose(self):
+        """
+        Closes the client and every pooled connection.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
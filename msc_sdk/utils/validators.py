@@ -1,20 +1,78 @@
 import re
-from itertools import cycle
+from functools import lru_cache
+from typing import Iterable, List
 
+_NON_DIGITS = re.compile("[^0-9]")
+_REPEATED_DIGITS = frozenset(c * 14 for c in "1234567890")
 
+
+@lru_cache(maxsize=4096)
 def validate_cnpj(cnpj: str) -> str:
-    cnpj = re.sub("[^0-9]", "", cnpj)
+    """
+    Validates a CNPJ and returns it normalized to 14 digits, without punctuation.
+
+    Results are memoized, since the same few acquirer and asset holder CNPJs are validated by every model.
+
+    Args:
+        cnpj (str): The CNPJ, with or without punctuation.
+
+    Returns:
+        str: The normalized CNPJ.
 
-    cnpj = cnpj.zfill(14)
+    Raises:
+        ValueError: If the CNPJ is invalid.
+    """
+    cnpj = _NON_DIGITS.sub("", cnpj).zfill(14)
 
-    if cnpj in (c * 14 for c in "1234567890"):
+    if cnpj in _REPEATED_DIGITS:
         raise ValueError("Invalid CNPJ")
 
-    cnpj_r = cnpj[::-1]
-    for i in range(2, 0, -1):
-        cnpj_enum = zip(cycle(range(2, 10)), cnpj_r[i:])
-        dv = sum(map(lambda x: int(x[1]) * x[0], cnpj_enum)) * 10 % 11
-        if cnpj_r[i - 1 : i] != str(dv % 10):
+    digits = [ord(c) - 48 for c in cnpj]
+    for check in (len(digits) - 2, len(digits) - 1):
+        total = sum(d * w for d, w in zip(digits[:check], _weights(check)))
+
+        if digits[check] != total * 10 % 11 % 10:
             raise ValueError("Invalid CNPJ")
 
     return cnpj
+
+
+def validate_cnpjs(cnpjs: Iterable[str], strict: bool = True) -> List[str | None]:
+    """
+    Validates many CNPJs, validating each distinct value only once.
+
+    Args:
+        cnpjs (Iterable[str]): The CNPJs, with or without punctuation.
+        strict (bool, optional): Raises on the first invalid CNPJ. If False, invalid CNPJs are returned as None.
+        Defaults to True.
+
+    Returns:
+        List[str | None]: The normalized CNPJs, in the given order.
+
+    Raises:
+        ValueError: If a CNPJ is invalid and strict is True.
+    """
+    validated = {}
+    result = []
+
+    for cnpj in cnpjs:
+        if cnpj not in validated:
+            try:
+                validated[cnpj] = validate_cnpj(cnpj)
+            except ValueError:
+                if strict:
+                    raise
+
+                validated[cnpj] = None
+
+        result.append(validated[cnpj])
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def _weights(length: int) -> tuple:
+    """
+    Returns the check digit weights of the first ``length`` digits: 2 to 9, cycling from the rightmost digit.
+    """
+    return tuple(2 + (position % 8) for position in reversed(range(length)))
@@ -0,0 +1,69 @@
+"""
+Benchmarks of the SDK hot paths, run with pytest-benchmark (``pip install msc-sdk[benchmark]``).
+
+A baseline is kept in ``tests/benchmarks/.baselines/0001_baseline.json``, at the root of the storage rather than in
+the per-interpreter directory of pytest-benchmark, so it is found whichever Python version runs the suite. Compare a
+run against it, failing on regressions of more than 25% of the mean time per call:
+
+    pytest tests/benchmarks --benchmark-storage=tests/benchmarks/.baselines --benchmark-compare=0001 \
+        --benchmark-compare-fail=mean:25%
+
+Timings depend on the machine: on other hardware, save a local baseline first, then compare against it:
+
+    pytest tests/benchmarks --benchmark-storage=tests/benchmarks/.baselines --benchmark-save=baseline
+
+Saved runs only record the machine info shared by every host (see pytest_benchmark_update_machine_info), not the
+host name, CPU or interpreter build.
+"""
+
+import importlib.util
+
+import pytest
+
+from msc_sdk.authenticate import Credential, token_manager
+from msc_sdk.commons import BankAccount
+from msc_sdk.config_sdk import ConfigSDK, Environment
+from msc_sdk.enums import AccountType
+from msc_sdk.testing import FakeMSCServer
+from msc_sdk.utils.retry import RetryPolicy
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+_SHARED_MACHINE_INFO = ("machine", "system", "python_implementation")
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    for key in set(machine_info) - set(_SHARED_MACHINE_INFO):
+        del machine_info[key]
+
+
+@pytest.fixture(scope="session")
+def fake_server():
+    ConfigSDK.setup(environment=Environment.TEST)
+
+    with FakeMSCServer(volume=10, items_per_recurrence=100, seed=1) as server:
+        config = ConfigSDK.get_config()
+        default_url, default_policy = config.base_url, config.retry_policy
+        config.base_url = server.url
+        config.retry_policy = RetryPolicy(max_attempts=1)
+
+        yield server
+
+        config.base_url, config.retry_policy = default_url, default_policy
+        token_manager.clear()
+
+
+@pytest.fixture(scope="session")
+def credential(fake_server) -> Credential:
+    bank_account = BankAccount(
+        branch="1234",
+        account="123456789",
+        account_digit="1",
+        account_type=AccountType.CHECKING_ACCOUNT,
+        ispb="12345678900",
+        document_type="CNPJ",
+        document_number="20299078000166",
+    )
+
+    return Credential.new("20299078000166", bank_account, "bench_user", "bench_pass")
@@ -0,0 +1,35 @@
+from msc_sdk.authenticate import token_manager
+from msc_sdk.contract.contract import Contract
+from msc_sdk.recurrence import OperationList, RecurrenceList
+
+
+def test_cached_token(benchmark, credential):
+    token_manager.get(credential)
+
+    benchmark(token_manager.get, credential)
+
+
+def test_get_contract(benchmark, fake_server, credential):
+    key = fake_server.contract_keys[0]
+
+    contract = benchmark(Contract.get_by_key, key, credential)
+
+    assert contract.key == key
+
+
+def test_get_recurrence_page(benchmark, credential):
+    recurrences = benchmark(RecurrenceList.get, credential, 1, 10)
+
+    assert len(recurrences.recurrences) == 10
+
+
+def test_get_operation_page(benchmark, fake_server, credential):
+    operations = benchmark(OperationList.get, credential, fake_server.recurrence_ids[0], 1, 100)
+
+    assert len(operations.operations) == 100
+
+
+def test_get_many_contracts(benchmark, fake_server, credential):
+    contracts = benchmark(Contract.get_many, fake_server.contract_keys, credential)
+
+    assert len(contracts) == len(fake_server.contract_keys)
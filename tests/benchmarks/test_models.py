@@ -0,0 +1,85 @@
+import copy
+
+import pytest
+
+from msc_sdk.authenticate import authorized_execute
+from msc_sdk.enums import APINamespaces
+from msc_sdk.recurrence import OperationList, RecurrenceReceivableUnitList
+from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.converters import list_int_to_float, list_float_to_int, dict_int_to_float
+from msc_sdk.utils.validators import validate_cnpj
+
+
+def raw_page(credential, recurrence_id: str, resource: str) -> dict:
+    response = authorized_execute(
+        credential,
+        "GET",
+        url=get_url(APINamespaces.RECURRENCES, f"{recurrence_id}/{resource}/list"),
+        params={"page": 1, "page_size": 100},
+    )
+
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+def operations_page(fake_server, credential) -> dict:
+    return raw_page(credential, fake_server.recurrence_ids[0], "operations")
+
+
+@pytest.fixture(scope="module")
+def rrus_page(fake_server, credential) -> dict:
+    return raw_page(credential, fake_server.recurrence_ids[0], "rrus")
+
+
+def test_parse_operation_page(benchmark, operations_page):
+    result = benchmark.pedantic(
+        OperationList._from_response_data, setup=lambda: ((copy.deepcopy(operations_page),), {}), rounds=100
+    )
+
+    assert len(result.operations) == 100
+
+
+def test_parse_rru_page(benchmark, rrus_page):
+    result = benchmark.pedantic(
+        RecurrenceReceivableUnitList._from_response_data, setup=lambda: ((copy.deepcopy(rrus_page),), {}), rounds=100
+    )
+
+    assert len(result.rrus) == 100
+
+
+def test_parse_operation_page_raw(benchmark, operations_page):
+    result = benchmark.pedantic(
+        OperationList._from_response_data, setup=lambda: ((copy.deepcopy(operations_page), True), {}), rounds=100
+    )
+
+    assert len(result) == 100
+
+
+def test_list_int_to_float(benchmark, rrus_page):
+    fields = ["amount", "total_operated_amount_gross", "total_operated_amount_net", "available_amount"]
+
+    benchmark.pedantic(list_int_to_float, setup=lambda: ((copy.deepcopy(rrus_page["rrus"]), fields), {}), rounds=200)
+
+
+def test_list_float_to_int(benchmark):
+    items = [dict(value_available=index + 0.25, effect_amount=index + 0.5) for index in range(1000)]
+
+    benchmark.pedantic(
+        list_float_to_int,
+        setup=lambda: (([dict(item) for item in items], ["value_available", "effect_amount"]), {}),
+        rounds=200,
+    )
+
+
+def test_dict_int_to_float(benchmark):
+    data = dict(amount=1000, amount_due=990, amount_paid=990)
+
+    benchmark.pedantic(
+        dict_int_to_float, setup=lambda: ((dict(data), ["amount", "amount_due", "amount_paid"]), {}), rounds=1000
+    )
+
+
+def test_validate_cnpj(benchmark):
+    cnpjs = ["15365935000149", "89785141000170", "01027058000191", "15111975000164", "20299078000166"]
+
+    benchmark(lambda: [validate_cnpj(cnpj) for cnpj in cnpjs])
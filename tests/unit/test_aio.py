@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+from datetime import datetime
+
+import httpx
+import pytest
+
+from msc_sdk.aio import AsyncTransport, Contract, Position, RecurrenceList
+from msc_sdk.authenticate import token_manager
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.contract.contract import DivisionMethod, EffectType, EffectStrategy
+from msc_sdk.enums import APINamespaces
+from msc_sdk.errors import NotFound
+from msc_sdk.utils.api_tools import get_url
+
+
+@pytest.fixture
+def mock_async_transport():
+    routes = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/authenticate/token"):
+            return httpx.Response(200, json={"access_token": "test_token"})
+
+        return routes[(request.method, request.url.path)](request)
+
+    config = ConfigSDK.get_config()
+    default_transport = config.async_transport
+    config.async_transport = AsyncTransport(http_transport=httpx.MockTransport(handler))
+    # Tokens cached by the sync tests would skip the mocked token endpoint.
+    token_manager.clear()
+
+    yield routes
+
+    config.async_transport = default_transport
+
+
+def test_aget_contract_by_key(credential, mock_async_transport):
+    key = str(uuid.uuid4())
+
+    contract_data = {
+        "key": key,
+        "asset_holder": "89785141000170",
+        "bank_account": credential.bank_account.model_dump(),
+        "contract_due_date": datetime.now().isoformat(),
+        "effect_type": EffectType.OWNERSHIP_ASSIGNMENT.value,
+        "division_method": DivisionMethod.FIXED_AMOUNT.value,
+        "effect_strategy": EffectStrategy.SPECIFIC.value,
+        "balance_due": 1000,
+        "created_on": datetime.now().isoformat(),
+    }
+
+    def get_contract(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["key"] == key
+        assert request.headers["Authorization"] == "Bearer test_token"
+        return httpx.Response(200, json=contract_data)
+
+    mock_async_transport[("GET", "/contracts")] = get_contract
+
+    contract = asyncio.run(Contract.aget_by_key(key=key, credential=credential))
+
+    assert contract.key == key
+    assert contract.balance_due == 10
+
+
+def test_aget_positions_concurrently(credential, mock_async_transport):
+    def get_position(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=dict(
+                key=str(uuid.uuid4()),
+                asset_holder=request.url.params["asset_holder"],
+                payment_scheme=request.url.params["payment_scheme"],
+                acquirer=request.url.params["acquirer"],
+                update_position_end=datetime.now().isoformat(),
+                ur_list_resume=[dict(due_date="2030-01-01", ur_amount=1000, value_available=1000)],
+                total_ur_amount=1000,
+                total_value_available=1000,
+            ),
+        )
+
+    mock_async_transport[("GET", "/positions/report")] = get_position
+
+    async def get_positions():
+        return await asyncio.gather(
+            *[
+                Position.aget_by_data(credential, payment_scheme, "1027058000191", "89785141000170")
+                for payment_scheme in ["VCC", "MCC", "ECC"]
+            ]
+        )
+
+    positions = asyncio.run(get_positions())
+
+    assert [position.payment_scheme for position in positions] == ["VCC", "MCC", "ECC"]
+    assert positions[0].ur_list_resume[0].value_available == 10
+
+
+def test_aget_contract_not_found(credential, mock_async_transport):
+    mock_async_transport[("GET", "/contracts")] = lambda request: httpx.Response(204)
+
+    with pytest.raises(NotFound):
+        asyncio.run(Contract.aget_by_key(key=str(uuid.uuid4()), credential=credential))
+
+
+def test_aget_recurrence_list_of_an_integrator(credential, mock_async_transport):
+    def list_recurrences(request: httpx.Request) -> httpx.Response:
+        assert dict(request.url.params) == {
+            "msc_customer": credential.document,
+            "page": "2",
+            "page_size": "10",
+            "msc_integrator": "89785141000170",
+        }
+        return httpx.Response(200, json={"recurrences": []})
+
+    mock_async_transport[("GET", httpx.URL(get_url(APINamespaces.RECURRENCES, "list")).path)] = list_recurrences
+
+    recurrences = asyncio.run(RecurrenceList.aget(credential, page=2, page_size=10, msc_integrator="89785141000170"))
+
+    assert recurrences.recurrences == []
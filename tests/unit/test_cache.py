@@ -0,0 +1,231 @@
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.contract.contract import Contract
+from msc_sdk.contract.ownership_assignment import ContractOwnershipAssignment, ContractPositionList
+from msc_sdk.position import Position
+from msc_sdk.position.position import (
+    RequestPositionType,
+    RequestPositionUR,
+    RequestPositionURList,
+    request_position_report,
+)
+from msc_sdk.enums import APINamespaces
+from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.cache import MemoryCacheStore, ResourceCache
+
+
+@pytest.fixture
+def cache():
+    config = ConfigSDK.get_config()
+    config.cache = ResourceCache(ttl=60, ttls={"position": 0})
+
+    yield config.cache
+
+    config.cache = None
+
+
+def contract_data(key: str, credential) -> dict:
+    return {
+        "key": key,
+        "asset_holder": "89785141000170",
+        "bank_account": credential.bank_account.model_dump(),
+        "signature_date": datetime.now().isoformat(),
+        "contract_due_date": datetime.now().isoformat(),
+        "effect_type": "ownershipAssignment",
+        "division_method": "fixedAmount",
+        "effect_strategy": "specific",
+        "balance_due": 1050,
+        "ur_list": [],
+        "status": "COMPLETED",
+        "created_on": datetime.now().isoformat(),
+    }
+
+
+@pytest.fixture
+def contract_url(credential, requests_mock):
+    key = str(uuid.uuid4())
+    url = get_url(APINamespaces.CONTRACTS) + f"?key={key}&msc_customer={credential.document}"
+    requests_mock.get(url, json=contract_data(key, credential), status_code=200)
+    requests_mock.patch(get_url(APINamespaces.CONTRACTS, "cancel"), json={}, status_code=200)
+
+    return key, url
+
+
+def contract_requests(requests_mock, url: str) -> int:
+    return sum(1 for request in requests_mock.request_history if request.method == "GET" and request.url == url)
+
+
+def test_get_by_key_is_served_from_the_cache(cache, credential, requests_mock, contract_url):
+    key, url = contract_url
+
+    first = Contract.get_by_key(key, credential)
+    first.balance_due = 0
+    second = Contract.get_by_key(key, credential)
+
+    assert contract_requests(requests_mock, url) == 1
+    assert second.balance_due == 10.5
+
+
+def test_cancel_by_key_invalidates_the_contract(cache, credential, requests_mock, contract_url):
+    key, url = contract_url
+
+    Contract.get_by_key(key, credential)
+    Contract.cancel_by_key(key, credential, fetch=False)
+    Contract.get_by_key(key, credential)
+
+    assert contract_requests(requests_mock, url) == 2
+
+
+def test_without_cache_every_call_is_sent(credential, requests_mock, contract_url):
+    key, url = contract_url
+
+    Contract.get_by_key(key, credential)
+    Contract.get_by_key(key, credential)
+
+    assert contract_requests(requests_mock, url) == 2
+
+
+def test_stale_contract_is_revalidated_with_its_etag(credential, requests_mock, contract_url):
+    key, url = contract_url
+    ConfigSDK.get_config().cache = ResourceCache(ttl=0)
+    requests_mock.get(
+        url,
+        [
+            {"json": contract_data(key, credential), "headers": {"ETag": '"v1"'}, "status_code": 200},
+            {"status_code": 304},
+        ],
+    )
+
+    try:
+        first = Contract.get_by_key(key, credential)
+        first.balance_due = 0
+        second = Contract.get_by_key(key, credential)
+    finally:
+        ConfigSDK.get_config().cache = None
+
+    conditional = [request for request in requests_mock.request_history if request.url == url][-1]
+
+    assert contract_requests(requests_mock, url) == 2
+    assert conditional.headers["If-None-Match"] == '"v1"'
+    assert second.key == key
+    assert second.balance_due == 10.5
+
+
+def test_unchanged_position_reuses_the_built_model(cache, credential, requests_mock, monkeypatch):
+    url = get_url(APINamespaces.POSITIONS, "report")
+    requests_mock.get(
+        url,
+        json={
+            "key": str(uuid.uuid4()),
+            "asset_holder": "89785141000170",
+            "payment_scheme": "VCC",
+            "acquirer": "89785141000170",
+            "update_position_end": "2024-01-01T00:00:00",
+            "ur_list_resume": [{"due_date": "2024-02-01T00:00:00", "ur_amount": 1050, "value_available": 1050}],
+            "ur_list_last_update": "2024-01-01T00:00:00",
+        },
+        status_code=200,
+    )
+    builds = []
+    build = Position._from_response_data.__func__
+    monkeypatch.setattr(
+        Position, "_from_response_data", classmethod(lambda cls, data: builds.append(1) or build(cls, data))
+    )
+
+    first = Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+    second = Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+
+    assert requests_mock.call_count == 2
+    assert len(builds) == 1
+    assert second == first and second is not first
+
+
+@pytest.fixture
+def position_url(requests_mock):
+    url = get_url(APINamespaces.POSITIONS, "report")
+    requests_mock.get(
+        url,
+        json={
+            "key": str(uuid.uuid4()),
+            "asset_holder": "89785141000170",
+            "payment_scheme": "VCC",
+            "acquirer": "89785141000170",
+            "update_position_end": "2024-01-01T00:00:00",
+            "ur_list_resume": [{"due_date": "2030-02-01T00:00:00", "ur_amount": 1050, "value_available": 1050}],
+            "ur_list_last_update": "2024-01-01T00:00:00",
+        },
+        status_code=200,
+    )
+    ConfigSDK.get_config().cache = ResourceCache(ttl=60)
+
+    yield url
+
+    ConfigSDK.get_config().cache = None
+
+
+def position_requests(requests_mock, url: str) -> int:
+    return sum(
+        1 for request in requests_mock.request_history if request.method == "GET" and request.url.startswith(url)
+    )
+
+
+def test_new_ownership_assignment_invalidates_its_positions(credential, requests_mock, position_url):
+    requests_mock.post(get_url(APINamespaces.CONTRACTS, "detailed/fixed_amount"), json={"key": "key"}, status_code=200)
+    position = Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+    positions = ContractPositionList()
+    positions.add_from_position_urs(position.ur_list_resume, "VCC", "89785141000170")
+
+    ContractOwnershipAssignment.new(credential, "89785141000170", positions, fetch=False)
+    Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+
+    assert position_requests(requests_mock, position_url) == 2
+
+
+def test_position_report_request_invalidates_its_positions(credential, requests_mock, position_url):
+    requests_mock.post(
+        position_url,
+        json={"optin": [{"payment_scheme": "VCC", "acquirer": "89785141000170", "success": True}]},
+        status_code=200,
+    )
+    request_position_ur_list = RequestPositionURList(
+        optin=[RequestPositionUR(payment_scheme="VCC", acquirer="89785141000170")]
+    )
+
+    Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+    Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+    request_position_report(
+        credential, "89785141000170", RequestPositionType.SINGLE, request_position_ur_list, fetch_positions=False
+    )
+    Position.get_by_data(credential, "VCC", "89785141000170", "89785141000170")
+
+    assert position_requests(requests_mock, position_url) == 2
+
+
+def test_resource_cache_ttls():
+    cache = ResourceCache(ttl=60, ttls={"position": 0})
+    cache.set("position", "20299078000166", "VCC", value={"key": "position"})
+    cache.set("contract", "20299078000166", "key", value={"key": "contract"})
+
+    assert cache.get("position", "20299078000166", "VCC") is None
+    assert cache.get("contract", "20299078000166", "key") == {"key": "contract"}
+    assert cache.get("contract", "74634410000120", "key") is None
+
+    with pytest.raises(ValueError):
+        ResourceCache(ttls={"contracts": 10})
+
+
+def test_memory_cache_store_evicts_expired_and_least_recently_used():
+    store = MemoryCacheStore(maxsize=2)
+    store.set("expired", 1, time.time() - 1)
+    store.set("a", 1, time.time() + 60)
+    store.set("b", 2, time.time() + 60)
+    store.get("a")
+    store.set("c", 3, time.time() + 60)
+
+    assert store.get("expired") is None
+    assert (store.get("a"), store.get("b"), store.get("c")) == (1, None, 3)
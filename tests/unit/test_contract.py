@@ -3,8 +3,9 @@ from datetime import datetime
 
 import pytest
 
-from msc_sdk.contract.contract import DivisionMethod, EffectType, EffectStrategy
+from msc_sdk.contract.contract import Contract, LazyContract, DivisionMethod, EffectType, EffectStrategy
 from msc_sdk.enums import APINamespaces
+from msc_sdk.errors import NotFound
 from msc_sdk.contract import ContractOwnershipAssignment
 from msc_sdk.contract.ownership_assignment import ContractPositionList
 from msc_sdk.position.position import PositionUR
@@ -132,3 +133,76 @@ def test_get_ownership_assignment_with_valid_inputs(credential, test_data, reque
     assert contract.created_on.isoformat() == get_response_data["created_on"]
     assert contract.updated_on.isoformat() == get_response_data["updated_on"]
     assert contract.canceled_on.isoformat() == get_response_data["canceled_on"]
+
+
+def test_get_many_contracts_reports_each_failure(credential, test_data, requests_mock):
+    keys = [str(uuid.uuid4()) for _ in range(3)]
+    missing_key = keys[1]
+
+    for key in keys:
+        get_response_data = {
+            "key": key,
+            "asset_holder": test_data["asset_holder"],
+            "bank_account": credential.bank_account.model_dump(),
+            "signature_date": datetime.now().isoformat(),
+            "contract_due_date": test_data["contract_position"].max_due_date.isoformat(),
+            "effect_type": EffectType.OWNERSHIP_ASSIGNMENT.value,
+            "division_method": DivisionMethod.FIXED_AMOUNT.value,
+            "effect_strategy": EffectStrategy.SPECIFIC.value,
+            "balance_due": int(test_data["balance_due"] * 100),
+            "ur_list": [],
+            "status": "COMPLETED",
+            "created_on": datetime.now().isoformat(),
+        }
+        url = get_url(APINamespaces.CONTRACTS) + f"?key={key}&msc_customer={credential.document}"
+
+        if key == missing_key:
+            requests_mock.get(url, status_code=204)
+        else:
+            requests_mock.get(url, json=get_response_data, status_code=200)
+
+    contracts = Contract.get_many(keys, credential=credential, concurrency=2)
+
+    assert list(contracts) == keys
+    assert isinstance(contracts[missing_key], NotFound)
+    assert all(contracts[key].key == key for key in keys if key != missing_key)
+
+
+def test_new_ownership_assignment_without_fetching(credential, test_data, requests_mock):
+    key = str(uuid.uuid4())
+
+    requests_mock.post(
+        get_url(APINamespaces.CONTRACTS, "detailed/fixed_amount"),
+        json={"key": key, "asset_holder": test_data["asset_holder"]},
+        status_code=200,
+    )
+    get_mock = requests_mock.get(
+        get_url(APINamespaces.CONTRACTS) + f"?key={key}&msc_customer={credential.document}",
+        json={
+            "key": key,
+            "asset_holder": test_data["asset_holder"],
+            "bank_account": credential.bank_account.model_dump(),
+            "contract_due_date": test_data["contract_position"].max_due_date.isoformat(),
+            "effect_type": EffectType.OWNERSHIP_ASSIGNMENT.value,
+            "division_method": DivisionMethod.FIXED_AMOUNT.value,
+            "effect_strategy": EffectStrategy.SPECIFIC.value,
+            "status": "PENDING",
+            "created_on": datetime.now().isoformat(),
+        },
+        status_code=200,
+    )
+
+    contract = ContractOwnershipAssignment.new(
+        credential=credential,
+        asset_holder=test_data["asset_holder"],
+        positions=test_data["contract_position"],
+        fetch=False,
+    )
+
+    assert isinstance(contract, LazyContract)
+    assert contract.key == key
+    assert get_mock.call_count == 0
+
+    assert contract.status == "PENDING"
+    assert contract.asset_holder == test_data["asset_holder"]
+    assert get_mock.call_count == 1
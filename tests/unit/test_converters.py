@@ -0,0 +1,8 @@
+from msc_sdk.utils.converters import list_float_to_int, list_int_to_float
+
+
+def test_list_conversions_skip_missing_fields():
+    data = [dict(amount=1050, amount_due=999), dict(amount=1)]
+
+    assert list_int_to_float(data, ["amount", "amount_due"]) == [dict(amount=10.5, amount_due=9.99), dict(amount=0.01)]
+    assert list_float_to_int(data, ["amount", "amount_due"]) == [dict(amount=1050, amount_due=999), dict(amount=1)]
@@ -0,0 +1,134 @@
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.enums import APINamespaces
+from msc_sdk.errors import ServerError
+from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.executor import execute
+from msc_sdk.utils.retry import RetryPolicy
+from msc_sdk.utils.transport import Transport
+
+
+@pytest.fixture
+def retry_policy():
+    config = ConfigSDK.get_config()
+    default_policy = config.retry_policy
+    config.retry_policy = RetryPolicy(max_attempts=3, backoff_factor=0)
+
+    yield config.retry_policy
+
+    config.retry_policy = default_policy
+
+
+def test_execute_retries_idempotent_transient_status(retry_policy, requests_mock):
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, [{"status_code": 503}, {"status_code": 200, "json": {"key": "test"}}])
+
+    response = execute("GET", url=url)
+
+    assert response.json() == {"key": "test"}
+    assert requests_mock.call_count == 2
+
+
+def test_execute_retries_idempotent_connection_error(retry_policy, requests_mock):
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, [{"exc": requests.ConnectionError}, {"status_code": 200, "json": {}}])
+
+    execute("GET", url=url)
+
+    assert requests_mock.call_count == 2
+
+
+def test_execute_gives_up_after_max_attempts(retry_policy, requests_mock):
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, status_code=503)
+
+    with pytest.raises(ServerError):
+        execute("GET", url=url)
+
+    assert requests_mock.call_count == retry_policy.max_attempts
+
+
+def test_execute_does_not_retry_non_idempotent(retry_policy, requests_mock):
+    url = get_url(APINamespaces.CONTRACTS, "cancel")
+    dropped = requests.ConnectionError(ProtocolError("Connection aborted."))
+    requests_mock.patch(url, [{"exc": dropped}, {"status_code": 200, "json": {}}])
+
+    with pytest.raises(requests.ConnectionError):
+        execute("PATCH", url=url)
+
+    assert requests_mock.call_count == 1
+
+
+def test_execute_retries_non_idempotent_refused_connection(retry_policy, requests_mock):
+    url = get_url(APINamespaces.RECURRENCES)
+    refused = requests.ConnectionError("Failed to establish a new connection: Connection refused")
+    requests_mock.post(url, [{"exc": refused}, {"status_code": 200, "json": {}}])
+
+    execute("POST", url=url)
+
+    assert requests_mock.call_count == 2
+
+
+def test_execute_retries_non_idempotent_on_retry_after(retry_policy, requests_mock):
+    url = get_url(APINamespaces.RECURRENCES)
+    requests_mock.post(url, [{"status_code": 429, "headers": {"Retry-After": "0"}}, {"status_code": 200, "json": {}}])
+
+    execute("POST", url=url)
+
+    assert requests_mock.call_count == 2
+
+
+def test_execute_does_not_retry_programming_errors(retry_policy, requests_mock):
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, exc=ValueError)
+
+    with pytest.raises(ValueError):
+        execute("GET", url=url)
+
+    assert requests_mock.call_count == 1
+
+
+def test_execute_respects_deadline(retry_policy, requests_mock):
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, [{"status_code": 503, "headers": {"Retry-After": "10"}}, {"status_code": 200}])
+
+    with pytest.raises(ServerError):
+        execute("GET", url=url, deadline=1)
+
+    assert requests_mock.call_count == 1
+
+
+def test_execute_uses_the_transport_timeout(retry_policy, requests_mock):
+    config = ConfigSDK.get_config()
+    default_transport = config.transport
+    config.transport = Transport(timeout=5)
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, status_code=200, json={})
+
+    try:
+        execute("GET", url=url)
+        execute("GET", url=url, deadline=1)
+    finally:
+        config.transport = default_transport
+
+    assert requests_mock.request_history[0].timeout == 5
+    assert requests_mock.request_history[1].timeout <= 1
+
+
+def test_retry_after_is_not_capped_by_the_backoff():
+    policy = RetryPolicy(max_backoff=4)
+    response = requests.Response()
+    response.status_code = 503
+    response.headers["Retry-After"] = "60"
+
+    assert policy.retry_delay("POST", 0, response=response) == 60
+
+
+def test_retry_policy_backoff_is_bounded():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=4)
+
+    for attempt in range(10):
+        assert 0 <= policy.backoff(attempt) <= min(4, 2**attempt)
@@ -0,0 +1,117 @@
+import csv
+import uuid
+from datetime import datetime
+
+import pytest
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.enums import APINamespaces
+from msc_sdk.recurrence.export import _flat_row, iter_operation_tables, write_csv, write_parquet
+from msc_sdk.recurrence.operation import Payment
+from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.money import MoneyMode
+
+
+@pytest.fixture
+def recurrence_id(credential, requests_mock) -> str:
+    recurrence_id = str(uuid.uuid4())
+
+    def operation(index: int) -> dict:
+        return dict(
+            id=f"operation-{index}",
+            operation_date=datetime(2024, 4, 30).isoformat(),
+            recurrence_id=recurrence_id,
+            asset_holder="89785141000170",
+            msc_customer=credential.document,
+            bank_account=credential.bank_account.model_dump(),
+            operation_receivable_units=[
+                dict(
+                    ur_id=str(uuid.uuid4()),
+                    asset_holder="89785141000170",
+                    payment_scheme="VCC",
+                    acquirer="01027058000191",
+                    due_date="2024-05-30T00:00:00",
+                    payment_due_date="2024-05-31T00:00:00",
+                    amount=1050,
+                    discount_rate_per_year=1200,
+                )
+            ],
+            amount=1050,
+            created_at=datetime(2024, 4, 30).isoformat(),
+        )
+
+    requests_mock.get(
+        get_url(APINamespaces.RECURRENCES, f"{recurrence_id}/operations/list"),
+        [
+            {"json": {"operations": [operation(1), operation(2)]}, "status_code": 200},
+            {"json": {"operations": [operation(3)]}, "status_code": 200},
+        ],
+    )
+
+    return recurrence_id
+
+
+def test_iter_operation_tables_flattens_each_page(credential, recurrence_id):
+    pages = list(iter_operation_tables(credential, recurrence_id, page_size=2, prefetch=False))
+
+    assert [len(page["operations"]) for page in pages] == [2, 1]
+    assert pages[0]["operations"][0]["amount"] == 1050
+    assert pages[0]["operations"][0]["bank_account_ispb"] == credential.bank_account.ispb
+    assert "operation_receivable_units" not in pages[0]["operations"][0]
+    assert pages[1]["operation_receivable_units"][0]["operation_id"] == "operation-3"
+    assert pages[1]["payments"] == []
+
+
+def test_write_csv(credential, recurrence_id, tmp_path):
+    paths = write_csv(iter_operation_tables(credential, recurrence_id, page_size=2), str(tmp_path))
+
+    with open(paths["operation_receivable_units"]) as file:
+        rows = list(csv.DictReader(file))
+
+    assert [row["operation_id"] for row in rows] == ["operation-1", "operation-2", "operation-3"]
+    assert rows[0]["amount"] == "1050"
+    assert rows[0]["discount_amount"] == ""
+
+
+def test_write_parquet(credential, recurrence_id, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    paths = write_parquet(iter_operation_tables(credential, recurrence_id, page_size=2), str(tmp_path))
+    operations = parquet.read_table(paths["operations"])
+
+    assert operations.num_rows == 3
+    assert operations.column("amount").to_pylist() == [1050, 1050, 1050]
+    assert str(operations.schema.field("amount").type) == "int64"
+    assert str(operations.schema.field("updated_at").type) == "string"
+    assert parquet.read_table(paths["payments"]).num_rows == 0
+
+
+def test_amounts_are_exported_in_cents_in_every_money_mode(credential, recurrence_id):
+    config = ConfigSDK.get_config()
+    config.money_mode = MoneyMode.CENTS
+    try:
+        pages = list(iter_operation_tables(credential, recurrence_id, page_size=2, prefetch=False))
+    finally:
+        config.money_mode = MoneyMode.FLOAT
+
+    amounts = [
+        row["amount"] for page in pages for name in ("operations", "operation_receivable_units") for row in page[name]
+    ]
+
+    assert amounts == [1050] * 6
+    assert all(type(amount) is int for amount in amounts)
+
+
+def test_untyped_values_are_exported_as_json_strings(credential):
+    payment = dict(
+        amount_paid=1050,
+        bank_account=credential.bank_account.model_dump(),
+        payment_date="2024-05-31T00:00:00",
+        proof_of_payment=12345,
+        metadata={"source": "pix"},
+    )
+
+    row = _flat_row(Payment, payment)
+
+    assert row["proof_of_payment"] == "12345"
+    assert row["metadata"] == '{"source": "pix"}'
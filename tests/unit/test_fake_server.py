@@ -0,0 +1,73 @@
+import pytest
+
+from msc_sdk.authenticate import Credential
+from msc_sdk.commons import BankAccount
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.contract.contract import Contract
+from msc_sdk.enums import AccountType
+from msc_sdk.errors import NotFound, ServerError
+from msc_sdk.position.position import (
+    request_position_report,
+    RequestPositionType,
+    RequestPositionURList,
+    RequestPositionUR,
+)
+from msc_sdk.recurrence import RecurrenceList, OperationList
+from msc_sdk.testing import FakeMSCServer
+from msc_sdk.utils.retry import RetryPolicy
+
+
+@pytest.fixture
+def fake_server():
+    with FakeMSCServer(volume=5, items_per_recurrence=3, seed=1) as server:
+        config = ConfigSDK.get_config()
+        default_url, default_policy = config.base_url, config.retry_policy
+        config.base_url = server.url
+        config.retry_policy = RetryPolicy(max_attempts=2, backoff_factor=0)
+
+        yield server
+
+        config.base_url, config.retry_policy = default_url, default_policy
+
+
+@pytest.fixture
+def fake_credential() -> Credential:
+    bank_account = BankAccount(
+        branch="1234",
+        account="123456789",
+        account_digit="1",
+        account_type=AccountType.CHECKING_ACCOUNT,
+        ispb="12345678900",
+        document_type="CNPJ",
+        document_number="20299078000166",
+    )
+
+    return Credential.new("20299078000166", bank_account, "test_user", "test_pass")
+
+
+def test_fake_server_serves_the_sdk_calls(fake_server, fake_credential):
+    contract = Contract.get_by_key(fake_server.contract_keys[0], fake_credential)
+    recurrences = RecurrenceList.get_all(fake_credential, page_size=2)
+    operations = OperationList.get_all(fake_credential, fake_server.recurrence_ids[0], page_size=2)
+    positions, _ = request_position_report(
+        fake_credential,
+        "89785141000170",
+        RequestPositionType.SINGLE,
+        RequestPositionURList(optin=[RequestPositionUR(payment_scheme="VCC", acquirer="1027058000191")]),
+    )
+
+    assert contract.key == fake_server.contract_keys[0]
+    assert [recurrence.id for recurrence in recurrences.recurrences] == fake_server.recurrence_ids
+    assert len(operations.operations) == 3
+    assert positions[0].payment_scheme == "VCC"
+    assert fake_server.requests["_token"] == 1
+
+    with pytest.raises(NotFound):
+        Contract.get_by_key("missing", fake_credential)
+
+
+def test_fake_server_injects_errors(fake_server, fake_credential):
+    fake_server.error_rate = 1.0
+
+    with pytest.raises(ServerError):
+        Contract.get_by_key(fake_server.contract_keys[0], fake_credential)
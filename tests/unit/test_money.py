@@ -0,0 +1,146 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.contract.contract import Contract
+from msc_sdk.contract.ownership_assignment import ContractPositionList
+from msc_sdk.position.position import PositionUR
+from msc_sdk.recurrence.operation import Operation
+from msc_sdk.utils.money import Cents, MoneyMode, WIRE_FORMAT
+
+
+@pytest.fixture
+def cents_mode():
+    config = ConfigSDK.get_config()
+    config.money_mode = MoneyMode.CENTS
+
+    yield
+
+    config.money_mode = MoneyMode.FLOAT
+
+
+@pytest.fixture
+def contract_data() -> dict:
+    return dict(
+        key="test",
+        asset_holder="89785141000170",
+        bank_account=dict(
+            branch="1234",
+            account="123456",
+            account_digit="1",
+            account_type="CC",
+            ispb="60701190",
+            document_number="74634410000120",
+        ),
+        contract_due_date="2030-01-01",
+        effect_type="ownershipAssignment",
+        division_method="fixedAmount",
+        effect_strategy="specific",
+        balance_due=58,
+        ur_list=[dict(due_date="2030-01-01", effect_amount=29), dict(due_date="2030-02-01", effect_amount=29)],
+        created_on="2024-01-01T00:00:00",
+    )
+
+
+def test_cents():
+    assert Cents.from_amount(0.29) == 29
+    assert Cents.from_amount("10.005") == 1001
+    assert Cents(1050).as_decimal() == Decimal("10.50")
+    assert Cents(1050).as_float() == 10.5
+    assert isinstance(Cents(1) + Cents(2), Cents)
+    assert isinstance(sum([Cents(1), Cents(2)]), Cents)
+
+
+def test_contract_keeps_exact_cents(cents_mode, contract_data):
+    contract = Contract._from_response_data(contract_data)
+
+    assert contract.balance_due == Cents(58)
+    assert isinstance(contract.ur_list[0].effect_amount, Cents)
+    assert sum(ur.effect_amount for ur in contract.ur_list) == contract.balance_due
+
+    data = json.loads(contract.model_dump_json())
+
+    assert data["balance_due"] == 58
+    assert [ur["effect_amount"] for ur in data["ur_list"]] == [29, 29]
+
+
+def test_operation_keeps_rates_as_floats(cents_mode):
+    operation = Operation._from_response_data(
+        dict(
+            operation_date="2024-01-01T00:00:00",
+            recurrence_id="test",
+            asset_holder="89785141000170",
+            msc_customer="20299078000166",
+            operation_receivable_units=[
+                dict(
+                    ur_id="test",
+                    asset_holder="89785141000170",
+                    payment_scheme="VCC",
+                    acquirer="01027058000191",
+                    due_date="2030-01-01",
+                    payment_due_date="2030-01-01",
+                    amount=1050,
+                    discount_rate_per_year=1200,
+                    discount_amount=10,
+                    amount_due=1040,
+                )
+            ],
+            amount=1050,
+            amount_due=1040,
+            bank_account=dict(
+                branch="1234",
+                account="123456",
+                account_digit="1",
+                account_type="CC",
+                ispb="60701190",
+                document_number="74634410000120",
+            ),
+            created_at="2024-01-01T00:00:00",
+        )
+    )
+
+    assert operation.amount == Cents(1050)
+    assert operation.operation_receivable_units[0].amount_due == Cents(1040)
+    assert operation.operation_receivable_units[0].discount_rate_per_year == 12.0
+
+
+def test_contract_position_list_sends_cents_unchanged():
+    positions = ContractPositionList()
+    positions.add_from_position_urs(
+        position_urs=[
+            PositionUR(due_date="2030-01-01", ur_amount=Cents(29), value_available=Cents(29)),
+            PositionUR(due_date="2030-02-01", ur_amount=0.29, value_available=0.29),
+        ],
+        payment_scheme="VCC",
+        acquirer="1027058000191",
+    )
+
+    ur_list = json.loads(positions.model_dump_json())["positions"][0]["ur_list"]
+
+    assert ur_list[0]["value_available"] == 29
+    assert ur_list[1]["value_available"] == 29
+
+
+def test_float_amounts_are_rounded_to_cents_in_wire_format(contract_data):
+    contract = Contract._from_response_data(contract_data | dict(balance_due=435))
+
+    assert contract.balance_due == 4.35
+    assert int(4.35 * 100) == 434
+    assert json.loads(contract.model_dump_json())["balance_due"] == 435
+
+
+def test_amounts_are_dumped_in_cents_only_in_wire_format():
+    positions = ContractPositionList()
+    positions.add_from_position_urs(
+        position_urs=[PositionUR(due_date="2030-01-01", ur_amount=10.5, value_available=10.5)],
+        payment_scheme="VCC",
+        acquirer="1027058000191",
+    )
+
+    plain = positions.model_dump(mode="json")["positions"][0]["ur_list"][0]
+    wire = positions.model_dump(mode="json", context=WIRE_FORMAT)["positions"][0]["ur_list"][0]
+
+    assert plain["value_available"] == 10.5
+    assert wire["value_available"] == 1050
@@ -0,0 +1,153 @@
+import asyncio
+import uuid
+from datetime import datetime
+
+from msc_sdk.enums import APINamespaces
+from msc_sdk.errors import NotFound
+from msc_sdk.recurrence import OperationList
+from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.pagination import iter_pages, aiter_pages, fetch_pages, afetch_pages
+
+
+def paged_fetch(total: int, page_size: int, calls: list):
+    def fetch_page(page: int) -> list:
+        calls.append(page)
+        items = list(range(total))[(page - 1) * page_size : page * page_size]
+        if not items:
+            raise NotFound("Contract not found")
+        return items
+
+    return fetch_page
+
+
+def test_iter_pages_walks_until_short_page():
+    calls = []
+
+    pages = list(iter_pages(paged_fetch(25, 10, calls), page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert calls == [1, 2, 3]
+
+
+def test_iter_pages_stops_on_not_found():
+    calls = []
+
+    pages = list(iter_pages(paged_fetch(20, 10, calls), page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10]
+    assert calls == [1, 2, 3]
+
+
+def test_iter_pages_with_prefetch_keeps_page_order():
+    calls = []
+
+    items = [item for page in iter_pages(paged_fetch(95, 10, calls), page_size=10, prefetch=True) for item in page]
+
+    assert items == list(range(95))
+
+
+def test_iter_pages_is_lazy():
+    calls = []
+
+    pages = iter_pages(paged_fetch(100, 10, calls), page_size=10)
+    next(pages)
+
+    assert calls == [1]
+
+
+def test_aiter_pages_with_prefetch():
+    calls = []
+    fetch = paged_fetch(35, 10, calls)
+
+    async def afetch(page: int) -> list:
+        return fetch(page)
+
+    async def collect():
+        return [item async for page in aiter_pages(afetch, page_size=10, prefetch=True) for item in page]
+
+    assert asyncio.run(collect()) == list(range(35))
+
+
+def test_fetch_pages_returns_pages_in_order():
+    calls = []
+
+    pages = fetch_pages(paged_fetch(95, 10, calls), page_size=10, concurrency=3)
+
+    assert [item for page in pages for item in page] == list(range(95))
+    assert sorted(calls) == list(range(1, 11))
+
+
+def test_fetch_pages_single_short_page():
+    calls = []
+
+    pages = fetch_pages(paged_fetch(5, 10, calls), page_size=10, concurrency=3)
+
+    assert pages == [list(range(5))]
+    assert calls == [1]
+
+
+def test_afetch_pages_returns_pages_in_order():
+    calls = []
+    fetch = paged_fetch(42, 10, calls)
+
+    async def afetch(page: int) -> list:
+        await asyncio.sleep(0.01 * (5 - page % 5))
+        return fetch(page)
+
+    pages = asyncio.run(afetch_pages(afetch, page_size=10, concurrency=4))
+
+    assert [item for page in pages for item in page] == list(range(42))
+
+
+def test_operation_list_iter_all(credential, requests_mock):
+    recurrence_id = str(uuid.uuid4())
+    url = get_url(APINamespaces.RECURRENCES, f"{recurrence_id}/operations/list")
+
+    def operation():
+        return dict(
+            id=str(uuid.uuid4()),
+            operation_date=datetime.now().isoformat(),
+            recurrence_id=recurrence_id,
+            asset_holder="89785141000170",
+            msc_customer=credential.document,
+            bank_account=credential.bank_account.model_dump(),
+            amount=1000,
+            created_at=datetime.now().isoformat(),
+        )
+
+    requests_mock.get(
+        url,
+        [
+            {"json": {"operations": [operation(), operation()]}, "status_code": 200},
+            {"json": {"operations": [operation()]}, "status_code": 200},
+        ],
+    )
+
+    operations = list(OperationList.iter_all(credential, recurrence_id, page_size=2))
+
+    assert len(operations) == 3
+    assert operations[0].amount == 10
+    assert [request.qs["page"] for request in requests_mock.request_history if request.url.startswith(url)] == [
+        ["1"],
+        ["2"],
+    ]
+
+
+def test_operation_list_get_all_raw(credential, requests_mock):
+    recurrence_id = str(uuid.uuid4())
+    url = get_url(APINamespaces.RECURRENCES, f"{recurrence_id}/operations/list")
+    operation = dict(
+        id=str(uuid.uuid4()),
+        operation_date=datetime.now().isoformat(),
+        recurrence_id=recurrence_id,
+        asset_holder="89785141000170",
+        msc_customer=credential.document,
+        bank_account=credential.bank_account.model_dump(),
+        amount=1050,
+        created_at=datetime.now().isoformat(),
+    )
+    requests_mock.get(url, json={"operations": [operation]}, status_code=200)
+
+    operations = OperationList.get_all(credential, recurrence_id, page_size=2, raw=True)
+
+    assert operations == [{**operation, "amount": 10.5}]
@@ -2,16 +2,22 @@ import uuid
 from datetime import datetime
 
 import pytest
+from pydantic import ValidationError
 
 from msc_sdk.enums import APINamespaces
+from msc_sdk.errors import BadRequest
 from msc_sdk.position.position import (
     RequestPositionURList,
     RequestPositionUR,
     RequestPositionType,
     request_position_report,
     Position,
+    PositionUR,
+    URSchedule,
 )
+from msc_sdk.contract.ownership_assignment import ContractPositionList
 from msc_sdk.utils.api_tools import get_url
+from msc_sdk.utils.money import WIRE_FORMAT
 
 
 @pytest.fixture
@@ -128,6 +134,36 @@ def test_new_single_with_valid_inputs(credential, test_data, requests_mock):
     assert positions[0].updated_on.isoformat() == test_data["positions"][0]["updated_on"]
 
 
+def test_new_single_keeps_the_urs_whose_positions_were_not_fetched(credential, test_data, requests_mock):
+    post_response_data = dict(optin=[])
+
+    for position in test_data["positions"]:
+        post_response_data["optin"].append(
+            dict(payment_scheme=position["payment_scheme"], acquirer=position["acquirer"], success=True)
+        )
+        # fmt: off
+        get_parms_data = (f"?payment_scheme={position['payment_scheme']}&acquirer={position['acquirer']}"
+                          f"&asset_holder={test_data['asset_holder']}&msc_customer={credential.document}")
+        # fmt: on
+        url = get_url(APINamespaces.POSITIONS, "report") + get_parms_data
+
+        if position["payment_scheme"] == "MCC":
+            requests_mock.get(url, json={"detail": "Invalid acquirer"}, status_code=400)
+        else:
+            requests_mock.get(url, json=position, status_code=200)
+
+    requests_mock.post(get_url(APINamespaces.POSITIONS, "report"), json=post_response_data, status_code=200)
+    request_position_ur_list = test_data["request_position_ur_list"]
+
+    with pytest.raises(BadRequest):
+        request_position_report(
+            credential, test_data["asset_holder"], RequestPositionType.SINGLE, request_position_ur_list
+        )
+
+    assert [ur.payment_scheme for ur in request_position_ur_list.optin] == ["MCC"]
+    assert request_position_ur_list.optin[0].error_message
+
+
 def test_get_with_valid_inputs(credential, test_data, requests_mock):
     # fmt: off
     get_parms_data = (f'?payment_scheme={test_data["positions"][0]["payment_scheme"]}'
@@ -175,3 +211,99 @@ def test_get_with_valid_inputs(credential, test_data, requests_mock):
     assert position.ur_list_last_update.isoformat() == test_data["positions"][0]["ur_list_last_update"]
     assert position.created_on.isoformat() == test_data["positions"][0]["created_on"]
     assert position.updated_on.isoformat() == test_data["positions"][0]["updated_on"]
+
+
+def test_new_single_without_fetching_positions(credential, test_data, requests_mock):
+    post_response_data = dict(
+        optin=[
+            dict(payment_scheme=position["payment_scheme"], acquirer=position["acquirer"], success=True)
+            for position in test_data["positions"]
+        ]
+    )
+    requests_mock.post(get_url(APINamespaces.POSITIONS, "report"), json=post_response_data, status_code=200)
+
+    handles, errors = request_position_report(
+        credential,
+        test_data["asset_holder"],
+        RequestPositionType.SINGLE,
+        test_data["request_position_ur_list"],
+        fetch_positions=False,
+    )
+
+    assert [handle.payment_scheme for handle in handles] == ["VCC", "MCC", "ECC"]
+    assert all(request.method == "POST" for request in requests_mock.request_history)
+
+    position = test_data["positions"][0]
+    # fmt: off
+    get_parms_data = (f"?payment_scheme={position['payment_scheme']}&acquirer={position['acquirer']}"
+                      f"&asset_holder={test_data['asset_holder']}&msc_customer={credential.document}")
+    # fmt: on
+    requests_mock.get(get_url(APINamespaces.POSITIONS, "report") + get_parms_data, json=position, status_code=200)
+
+    assert handles[0].fetch(credential).key == position["key"]
+
+
+def test_ur_list_resume_is_a_compact_schedule(test_data):
+    position = Position._from_response_data(test_data["positions"][0])
+    schedule = position.ur_list_resume
+
+    assert isinstance(schedule, URSchedule)
+    assert len(schedule) == 3
+    assert schedule[2] == PositionUR(due_date="2030-03-01", ur_amount=30, value_available=30)
+    assert schedule.amounts("value_available") == [10, 20, 30]
+    assert schedule.max_due_date == datetime(2030, 3, 1)
+    assert position.model_dump(mode="json")["ur_list_resume"][0] == dict(
+        due_date="2030-01-01T00:00:00", ur_amount=10, value_available=10
+    )
+
+
+def test_contract_positions_reuse_the_position_schedule(test_data):
+    position = Position._from_response_data(test_data["positions"][0])
+    positions = ContractPositionList()
+    positions.add_from_position_urs(position.ur_list_resume, position.payment_scheme, position.acquirer)
+
+    ur_list = positions.model_dump(mode="json", context=WIRE_FORMAT)["positions"][0]["ur_list"]
+
+    assert ur_list == [
+        dict(due_date="2030-01-01", value_available=1000),
+        dict(due_date="2030-02-01", value_available=2000),
+        dict(due_date="2030-03-01", value_available=3000),
+    ]
+    assert positions.max_due_date == datetime(2030, 3, 1)
+
+
+def test_schedules_keep_the_offset_of_their_due_dates():
+    schedule = URSchedule(
+        [
+            PositionUR(due_date="2030-01-01T00:00:00+03:00", ur_amount=10, value_available=10),
+            PositionUR(due_date="2030-01-01T00:00:00", ur_amount=20, value_available=20),
+        ]
+    )
+    positions = ContractPositionList()
+    positions.add_from_position_urs(schedule, "VCC", "1027058000191")
+
+    assert schedule[0].due_date.isoformat() == "2030-01-01T00:00:00+03:00"
+    assert schedule[1].due_date.tzinfo is None
+    assert schedule.max_due_date == datetime(2030, 1, 1)
+    assert [ur.due_date.isoformat() for ur in positions.positions[0].ur_list] == ["2030-01-01", "2030-01-01"]
+
+
+def test_schedule_items_can_not_be_modified():
+    schedule = URSchedule.from_response_data(
+        [{"due_date": "2030-01-01T00:00:00", "ur_amount": 10, "value_available": 10}]
+    )
+
+    with pytest.raises(ValidationError):
+        schedule[0].ur_amount = 3
+
+    assert schedule[0].ur_amount == 0.1
+    assert list(schedule) == [PositionUR(due_date="2030-01-01T00:00:00", ur_amount=0.1, value_available=0.1)]
+
+
+def test_schedules_have_a_json_schema():
+    position_schema = Position.model_json_schema()
+    contract_schema = ContractPositionList.model_json_schema()
+
+    assert position_schema["properties"]["ur_list_resume"]["anyOf"][0]["items"] == {"$ref": "#/$defs/PositionUR"}
+    assert "ContractURData" in contract_schema["$defs"]
+    assert ContractPositionList.model_json_schema(mode="serialization")["$defs"]
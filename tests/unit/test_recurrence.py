@@ -1,3 +1,4 @@
+import asyncio
 import random
 import uuid
 from datetime import datetime
@@ -5,12 +6,15 @@ from datetime import datetime
 import pytest
 
 from msc_sdk.enums import APINamespaces, AccountType
+from msc_sdk.config_sdk import ConfigSDK, Environment
+from msc_sdk.errors import BadRequest, NotFound
 from msc_sdk.recurrence import mock_data
+from msc_sdk.recurrence.mock import build_mock_data, get_mock_data
 from msc_sdk.recurrence import Operation, OperationList
-from msc_sdk.recurrence import RecurrenceList, Recurrence
+from msc_sdk.recurrence import RecurrenceList, Recurrence, RecurrenceSpec
 from msc_sdk.recurrence import RecurrenceReceivableUnitList, RecurrenceReceivableUnit
 from msc_sdk.commons import BankAccount
-from msc_sdk.recurrence.recurrence import RecurrenceCancelReason
+from msc_sdk.recurrence.recurrence import PaymentScheme, RecurrenceCancelReason
 from msc_sdk.utils.api_tools import get_url
 from msc_sdk.utils.converters import dict_float_to_int, dict_datetime_to_str
 from tests.unit.conftest import setup_config
@@ -240,6 +244,19 @@ def test_get_recurrence_list_with_valid_inputs(credential, recurrence_list_mock,
     )
 
 
+def test_get_recurrence_list_of_an_integrator(credential, requests_mock):
+    requests_mock.get(get_url(APINamespaces.RECURRENCES, "list"), json={"recurrences": []}, status_code=200)
+
+    RecurrenceList.get(credential, page=2, page_size=10, msc_integrator="89785141000170")
+
+    assert requests_mock.last_request.qs == {
+        "msc_customer": [credential.document],
+        "page": ["2"],
+        "page_size": ["10"],
+        "msc_integrator": ["89785141000170"],
+    }
+
+
 def test_get_recurrence_with_valid_inputs(credential, recurrence_mock, requests_mock):
     id = recurrence_mock["id"]
 
@@ -437,6 +454,20 @@ def test_get_operation_by_id_with_valid_inputs(credential, requests_mock, operat
     assert operation_response.payments == []
 
 
+def test_get_unknown_operation_by_id_raises_not_found_in_dev(credential):
+    config = ConfigSDK.get_config()
+    config.environment = Environment.DEV
+
+    try:
+        with pytest.raises(NotFound):
+            Operation.get_by_id(credential, str(uuid.uuid4()), "unknown")
+
+        with pytest.raises(NotFound):
+            asyncio.run(Operation.aget_by_id(credential, str(uuid.uuid4()), "unknown"))
+    finally:
+        config.environment = Environment.TEST
+
+
 def test_get_operation_by_recurrence_id_with_valid_inputs(credential, requests_mock, operations_list_mock):
     operation = operations_list_mock["operations"][1]
 
@@ -576,3 +607,43 @@ def test_get_rru_list_by_ur_id(credential, requests_mock, rru_list_mock, recurre
         recurrence_response.operations[0].total_operated_amount_net
         == rru["operations"][0]["total_operated_amount_net"] / 100
     )
+
+
+def test_mock_data_is_reproducible_with_seed():
+    first, second = build_mock_data(seed=42), build_mock_data(seed=42)
+
+    assert [rru["id"] for rru in first["rru_list"]] == [rru["id"] for rru in second["rru_list"]]
+    assert [op["amount"] for op in first["operation_list"]] == [op["amount"] for op in second["operation_list"]]
+    assert get_mock_data() is mock_data
+
+
+def test_new_many_recurrences_reports_each_failure(credential, recurrence_mock, requests_mock):
+    acquirers = ["01027058000191", "20299078000166", "89785141000170"]
+
+    def create(request, context):
+        body = request.json()
+
+        if body["acquirer"] == acquirers[1]:
+            context.status_code = 400
+            return {"detail": "Invalid acquirer"}
+
+        return recurrence_mock | dict(id=body["acquirer"], acquirer=body["acquirer"], msc_integrator=None)
+
+    requests_mock.post(get_url(APINamespaces.RECURRENCES), json=create)
+    specs = [
+        RecurrenceSpec(
+            asset_holder=recurrence_mock["asset_holder"],
+            acquirer=acquirer,
+            bank_account=BankAccount(**recurrence_mock["bank_account"]),
+            ur_percentage=recurrence_mock["ur_percentage"],
+            discount_rate_per_year=recurrence_mock["discount_rate_per_year"],
+            payment_scheme=[PaymentScheme.VISA],
+        )
+        for acquirer in acquirers
+    ]
+
+    recurrences = Recurrence.new_many(specs, credential, concurrency=2)
+
+    assert [recurrence.id for recurrence in recurrences[::2]] == [acquirers[0], acquirers[2]]
+    assert isinstance(recurrences[1], BadRequest)
+    assert requests_mock.request_history[-1].json()["payment_scheme"] == ["VCC"]
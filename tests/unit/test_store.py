@@ -0,0 +1,217 @@
+import json
+from datetime import date, datetime
+
+import pytest
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.contract.contract import Contract
+from msc_sdk.position import Position
+from msc_sdk.recurrence import Operation, Recurrence, RecurrenceReceivableUnit
+from msc_sdk.store import LocalStore
+from msc_sdk.utils.money import Cents, MoneyMode
+
+
+@pytest.fixture
+def store(tmp_path):
+    with LocalStore(str(tmp_path / "mirror.db")) as store:
+        yield store
+
+
+def position(acquirer: str, due_days: list) -> Position:
+    return Position._from_response_data(
+        dict(
+            key=f"position-{acquirer}",
+            asset_holder="89785141000170",
+            payment_scheme="VCC",
+            acquirer=acquirer,
+            update_position_end="2024-04-30T00:00:00",
+            ur_list_resume=[
+                dict(due_date=f"2024-05-{day:02d}T00:00:00", ur_amount=1050, value_available=29) for day in due_days
+            ],
+        )
+    )
+
+
+def test_positions_and_urs_are_queried_by_their_indexed_fields(store):
+    first, second = position("01027058000191", [6, 13, 20]), position("20299078000166", [7])
+    store.put(first, second)
+
+    urs = store.urs(acquirer="01027058000191", due_from=date(2024, 5, 6), due_to=date(2024, 5, 13))
+
+    assert store.position("89785141000170", "VCC", "01027058000191") == first
+    assert [item.key for item in store.positions(payment_scheme="VCC")] == [first.key, second.key]
+    assert [(ur.due_date, ur.ur_amount, ur.value_available) for ur in urs] == [(datetime(2024, 5, 6), 10.5, 0.29)]
+    assert [ur.acquirer for ur in store.urs(due_from=date(2024, 5, 7))] == [
+        "20299078000166",
+        "01027058000191",
+        "01027058000191",
+    ]
+
+
+def test_replaced_position_drops_its_previous_urs(store):
+    store.put(position("01027058000191", [6, 13, 20]))
+    store.put(position("01027058000191", [27]))
+
+    assert [ur.due_date.day for ur in store.urs()] == [27]
+
+
+def test_contracts_and_rrus_are_filtered_by_acquirer_and_due_date(store, credential):
+    contract = Contract._from_response_data(
+        dict(
+            key="contract-1",
+            asset_holder="89785141000170",
+            bank_account=credential.bank_account.model_dump(),
+            contract_due_date="2024-12-31T00:00:00",
+            effect_type="ownershipAssignment",
+            division_method="fixedAmount",
+            effect_strategy="specific",
+            ur_list=[dict(acquirer="01027058000191", payment_scheme="VCC", due_date="2024-05-06T00:00:00")],
+            created_on="2024-04-30T00:00:00",
+        )
+    )
+    rru = RecurrenceReceivableUnit._from_response_data(
+        dict(
+            id="rru-1",
+            recurrence_id="recurrence-1",
+            ur_id="ur-1",
+            asset_holder="89785141000170",
+            msc_customer=credential.document,
+            acquirer="01027058000191",
+            payment_scheme="VCC",
+            due_date="2024-05-06T00:00:00",
+            amount=1050,
+            total_operated_amount_gross=1050,
+            total_operated_amount_net=1000,
+            available_amount=0,
+            previous_amount=0,
+            previous_operated_amount_gross=0,
+            previous_operated_amount_net=0,
+            created_at="2024-04-30T00:00:00",
+        )
+    )
+    store.put(contract, rru)
+
+    assert store.contract("contract-1") == contract
+    assert store.contracts(acquirer="01027058000191", due_from=date(2024, 5, 1)) == [contract]
+    assert store.contracts(acquirer="20299078000166") == []
+    assert store.rrus(acquirer="01027058000191", due_to=date(2024, 5, 7)) == [rru]
+    assert store.rrus(due_from=date(2024, 5, 7)) == []
+
+    with pytest.raises(TypeError):
+        store.put(credential)
+
+
+def test_models_are_stored_as_json_and_read_in_the_money_mode(store):
+    store.put(position("01027058000191", [6, 13]))
+    config = ConfigSDK.get_config()
+    (stored,) = store._connection.execute("SELECT model FROM positions").fetchone()
+
+    config.money_mode = MoneyMode.CENTS
+    try:
+        loaded = store.position("89785141000170", "VCC", "01027058000191")
+    finally:
+        config.money_mode = MoneyMode.FLOAT
+
+    assert json.loads(stored)["ur_list_resume"][0] == dict(
+        due_date="2024-05-06T00:00:00", ur_amount=1050, value_available=29
+    )
+    assert loaded.key_optin_tag is None
+    assert isinstance(loaded.ur_list_resume[0].ur_amount, Cents)
+    assert [(ur.ur_amount, ur.value_available) for ur in loaded.ur_list_resume] == [(Cents(1050), Cents(29))] * 2
+
+
+def test_models_round_trip_in_cents_mode(store, credential):
+    config = ConfigSDK.get_config()
+    config.money_mode = MoneyMode.CENTS
+
+    try:
+        contract = Contract._from_response_data(
+            dict(
+                key="contract-1",
+                asset_holder="89785141000170",
+                bank_account=credential.bank_account.model_dump(),
+                contract_due_date="2024-12-31T00:00:00",
+                effect_type="ownershipAssignment",
+                division_method="fixedAmount",
+                effect_strategy="specific",
+                balance_due=1050,
+                ur_list=[
+                    dict(
+                        acquirer="01027058000191",
+                        payment_scheme="VCC",
+                        due_date="2024-05-06T00:00:00",
+                        effect_amount=29,
+                    )
+                ],
+                created_on="2024-04-30T00:00:00",
+            )
+        )
+        rru = RecurrenceReceivableUnit._from_response_data(
+            dict(
+                id="rru-1",
+                recurrence_id="recurrence-1",
+                ur_id="ur-1",
+                asset_holder="89785141000170",
+                msc_customer=credential.document,
+                acquirer="01027058000191",
+                payment_scheme="VCC",
+                due_date="2024-05-06T00:00:00",
+                amount=1050,
+                total_operated_amount_gross=1050,
+                total_operated_amount_net=1000,
+                available_amount=29,
+                previous_amount=0,
+                previous_operated_amount_gross=0,
+                previous_operated_amount_net=0,
+                created_at="2024-04-30T00:00:00",
+            )
+        )
+        recurrence = Recurrence._from_response_data(
+            dict(
+                id="recurrence-1",
+                status="ACTIVE",
+                asset_holder="89785141000170",
+                msc_integrator=None,
+                msc_customer=credential.document,
+                payment_scheme=["VCC"],
+                acquirer="01027058000191",
+                bank_account=credential.bank_account.model_dump(),
+                discount_rate_per_year=1200,
+                created_at="2024-04-01T00:00:00",
+            )
+        )
+        operation = Operation._from_response_data(
+            dict(
+                id="operation-1",
+                operation_date="2024-04-10T00:00:00",
+                recurrence_id="recurrence-1",
+                asset_holder="89785141000170",
+                msc_customer=credential.document,
+                bank_account=credential.bank_account.model_dump(),
+                amount=1050,
+                amount_paid=1050,
+                payments=[
+                    dict(
+                        amount_paid=1050,
+                        bank_account=credential.bank_account.model_dump(),
+                        payment_date="2024-04-11T00:00:00",
+                        proof_of_payment=12,
+                    )
+                ],
+                created_at="2024-04-10T00:00:00",
+            )
+        )
+        first = position("01027058000191", [6])
+        store.put(contract, rru, recurrence, operation, first)
+
+        loaded = store.operations()[0]
+
+        assert store.contract("contract-1") == contract
+        assert store.recurrence("recurrence-1") == recurrence
+        assert store.rrus() == [rru]
+        assert store.position("89785141000170", "VCC", "01027058000191") == first
+        assert loaded == operation
+        assert isinstance(loaded.payments[0].amount_paid, Cents) and loaded.payments[0].amount_paid == 1050
+        assert isinstance(store.contract("contract-1").ur_list[0].effect_amount, Cents)
+    finally:
+        config.money_mode = MoneyMode.FLOAT
@@ -0,0 +1,98 @@
+import json
+import uuid
+
+import pytest
+
+from msc_sdk.enums import APINamespaces
+from msc_sdk.recurrence.sync import ChangeType, FileWatermarkStore, RecurrenceSync
+from msc_sdk.utils.api_tools import get_url
+
+
+@pytest.fixture
+def recurrence(credential) -> dict:
+    return dict(
+        id=str(uuid.uuid4()),
+        status="ACTIVE",
+        asset_holder="89785141000170",
+        msc_integrator=None,
+        msc_customer=credential.document,
+        payment_scheme=["VCC"],
+        acquirer="01027058000191",
+        bank_account=credential.bank_account.model_dump(),
+        discount_rate_per_year=1200,
+        created_at="2024-04-01T00:00:00",
+    )
+
+
+def operation(credential, recurrence_id: str, index: int, created_at: str, updated_at: str = None) -> dict:
+    return dict(
+        id=f"operation-{index}",
+        operation_date=created_at,
+        recurrence_id=recurrence_id,
+        asset_holder="89785141000170",
+        msc_customer=credential.document,
+        bank_account=credential.bank_account.model_dump(),
+        amount=1050,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def mock_lists(requests_mock, recurrences: list, operations: list):
+    requests_mock.get(get_url(APINamespaces.RECURRENCES, "list"), json={"recurrences": recurrences})
+
+    for recurrence in recurrences:
+        requests_mock.get(
+            get_url(APINamespaces.RECURRENCES, f"{recurrence['id']}/operations/list"),
+            json={"operations": operations},
+        )
+        requests_mock.get(get_url(APINamespaces.RECURRENCES, f"{recurrence['id']}/rrus/list"), json={"rrus": []})
+
+
+def test_run_emits_only_the_changes_since_the_previous_run(credential, requests_mock, recurrence, tmp_path):
+    path = str(tmp_path / "watermarks.json")
+    first_operation = operation(credential, recurrence["id"], 1, "2024-04-10T00:00:00")
+    mock_lists(requests_mock, [recurrence], [first_operation])
+
+    events = list(RecurrenceSync(credential, FileWatermarkStore(path)).run())
+
+    assert [(event.resource, event.change) for event in events] == [
+        ("recurrence", ChangeType.CREATED),
+        ("operation", ChangeType.CREATED),
+    ]
+    assert json.load(open(path))[f"{recurrence['id']}/operations"] == "2024-04-10T00:00:00"
+
+    cancelled = recurrence | dict(status="CANCELLED", updated_at="2024-04-20T00:00:00")
+    updated_operation = operation(credential, recurrence["id"], 1, "2024-04-10T00:00:00", "2024-04-21T00:00:00")
+    new_operation = operation(credential, recurrence["id"], 2, "2024-04-22T00:00:00")
+    mock_lists(requests_mock, [cancelled], [updated_operation, new_operation])
+
+    events = list(RecurrenceSync(credential, FileWatermarkStore(path)).run())
+
+    assert [(event.resource, event.change, event.item.id) for event in events] == [
+        ("recurrence", ChangeType.CANCELLED, recurrence["id"]),
+        ("operation", ChangeType.UPDATED, "operation-1"),
+        ("operation", ChangeType.CREATED, "operation-2"),
+    ]
+    assert events[2].item.amount == 10.5
+    assert list(RecurrenceSync(credential, FileWatermarkStore(path)).run()) == []
+
+
+def test_ordered_by_update_stops_at_the_first_unchanged_item(credential, requests_mock, recurrence):
+    url = get_url(APINamespaces.RECURRENCES, f"{recurrence['id']}/operations/list")
+    sync = RecurrenceSync(credential, page_size=1, ordered_by_update=True)
+    sync.store.set(f"{recurrence['id']}/operations", "2024-04-15T00:00:00")
+    requests_mock.get(
+        url,
+        [
+            {"json": {"operations": [operation(credential, recurrence["id"], 2, "2024-04-20T00:00:00")]}},
+            {"json": {"operations": [operation(credential, recurrence["id"], 1, "2024-04-10T00:00:00")]}},
+            {"json": {"operations": [operation(credential, recurrence["id"], 0, "2024-04-01T00:00:00")]}},
+        ],
+    )
+
+    events = list(sync.sync_operations(recurrence["id"]))
+
+    assert [event.item.id for event in events] == ["operation-2"]
+    assert sum(1 for request in requests_mock.request_history if request.path in url) == 2
+    assert sync.store.get(f"{recurrence['id']}/operations") == "2024-04-20T00:00:00"
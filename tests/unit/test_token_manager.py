@@ -0,0 +1,235 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import uuid
+
+from msc_sdk.authenticate import FileTokenStore, TokenManager, token_manager
+from msc_sdk.config_sdk import ConfigSDK, Environment
+from msc_sdk.contract.contract import Contract
+from msc_sdk.enums import APINamespaces
+from msc_sdk.utils.api_tools import get_url
+
+
+def mock_token_endpoint(requests_mock, *expires_in: int, delay: float = 0):
+    calls = []
+
+    def token(request, context):
+        calls.append(request)
+        time.sleep(delay)
+        data = {"access_token": f"token_{len(calls)}"}
+        if expires_in:
+            data["expires_in"] = expires_in[min(len(calls), len(expires_in)) - 1]
+        return data
+
+    requests_mock.post(get_url(APINamespaces.AUTHENTICATE, "token"), json=token, status_code=200)
+
+    return calls
+
+
+def test_token_manager_caches_token(credential, requests_mock):
+    calls = mock_token_endpoint(requests_mock)
+    manager = TokenManager()
+
+    assert manager.get(credential) == "token_1"
+    assert manager.get(credential) == "token_1"
+    assert len(calls) == 1
+
+
+def test_token_manager_reads_expiry_from_response(credential, requests_mock):
+    calls = mock_token_endpoint(requests_mock, 0)
+    manager = TokenManager(refresh_margin=0)
+
+    assert manager.get(credential) == "token_1"
+    assert manager.get(credential) == "token_2"
+    assert len(calls) == 2
+
+
+def test_token_manager_single_flights_concurrent_requests(credential, requests_mock):
+    calls = mock_token_endpoint(requests_mock, delay=0.05)
+    manager = TokenManager()
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(manager.get(credential))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["token_1"] * 10
+    assert len(calls) == 1
+
+
+def test_token_manager_refreshes_ahead_of_expiry(credential, requests_mock):
+    calls = mock_token_endpoint(requests_mock, 60, 3600)
+    manager = TokenManager(refresh_margin=120)
+
+    assert manager.get(credential) == "token_1"
+    assert manager.get(credential) == "token_1"
+
+    for _ in range(100):
+        if manager.get(credential) != "token_1":
+            break
+        time.sleep(0.01)
+
+    assert manager.get(credential) == "token_2"
+    assert len(calls) == 2
+
+
+def test_resource_reauthenticates_once_on_unauthorized(credential, requests_mock):
+    calls = mock_token_endpoint(requests_mock)
+    token_manager.clear()
+
+    key = str(uuid.uuid4())
+    requests_mock.get(
+        get_url(APINamespaces.CONTRACTS),
+        [
+            {"status_code": 401},
+            {
+                "status_code": 200,
+                "json": {
+                    "key": key,
+                    "asset_holder": "89785141000170",
+                    "bank_account": credential.bank_account.model_dump(),
+                    "contract_due_date": "2030-01-01T00:00:00",
+                    "effect_type": "ownershipAssignment",
+                    "division_method": "fixedAmount",
+                    "effect_strategy": "specific",
+                    "created_on": "2024-01-01T00:00:00",
+                },
+            },
+        ],
+    )
+
+    contract = Contract.get_by_key(key=key, credential=credential)
+
+    assert contract.key == key
+    assert len(calls) == 2
+    assert requests_mock.request_history[-1].headers["Authorization"] == "Bearer token_2"
+
+
+def test_file_token_store_shares_token_between_managers(credential, requests_mock, tmp_path):
+    calls = mock_token_endpoint(requests_mock, 3600)
+    path = str(tmp_path / "tokens.json")
+
+    first_process = TokenManager(store=FileTokenStore(path))
+    second_process = TokenManager(store=FileTokenStore(path))
+
+    assert first_process.get(credential) == "token_1"
+    assert second_process.get(credential) == "token_1"
+    assert len(calls) == 1
+
+    with open(path) as file:
+        content = file.read()
+
+    assert credential.api_pass.get_secret_value() not in content
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_token_store_is_set_up_with_the_sdk(credential, requests_mock, tmp_path):
+    calls = mock_token_endpoint(requests_mock, 3600)
+    path = str(tmp_path / "tokens.json")
+    default_config = ConfigSDK.get_config()
+    del ConfigSDK._instance
+
+    try:
+        ConfigSDK.setup(environment=Environment.TEST, token_store=FileTokenStore(path))
+
+        assert TokenManager().get(credential) == "token_1"
+        assert TokenManager().get(credential) == "token_1"
+    finally:
+        ConfigSDK._instance = default_config
+
+    assert len(calls) == 1
+    assert os.path.exists(path)
+
+
+def test_file_token_store_ignores_expired_tokens(tmp_path):
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+
+    store.set("valid", "token_1", time.time() + 60)
+    store.set("expired", "token_2", time.time() - 1)
+
+    assert store.get("valid")[0] == "token_1"
+    assert store.get("expired") is None
+
+
+def test_invalidate_drops_shared_token(credential, requests_mock, tmp_path):
+    calls = mock_token_endpoint(requests_mock, 3600)
+    path = str(tmp_path / "tokens.json")
+
+    first_process = TokenManager(store=FileTokenStore(path))
+    second_process = TokenManager(store=FileTokenStore(path))
+
+    first_process.get(credential)
+    first_process.invalidate(credential, "token_1")
+
+    assert second_process.get(credential) == "token_2"
+    assert len(calls) == 2
+
+
+def test_cancelled_aget_does_not_cancel_the_shared_refresh(credential, monkeypatch):
+    calls = []
+
+    async def token_request(credential) -> dict:
+        calls.append(credential)
+        await asyncio.sleep(0.05)
+        return {"access_token": "token_1", "expires_in": 3600}
+
+    monkeypatch.setattr(sys.modules[TokenManager.__module__], "_async_token_request", token_request)
+    manager = TokenManager()
+
+    async def get_tokens():
+        first = asyncio.ensure_future(manager.aget(credential))
+        second = asyncio.ensure_future(manager.aget(credential))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(get_tokens())
+
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == "token_1"
+    assert len(calls) == 1
+
+
+def test_aget_waits_for_the_store_lock_of_another_process_off_the_event_loop(credential, monkeypatch, tmp_path):
+    calls = []
+
+    async def token_request(credential) -> dict:
+        calls.append(credential)
+        return {"access_token": "token_2", "expires_in": 3600}
+
+    monkeypatch.setattr(sys.modules[TokenManager.__module__], "_async_token_request", token_request)
+    path = str(tmp_path / "tokens.json")
+    other_process = FileTokenStore(path)
+    manager = TokenManager(store=FileTokenStore(path))
+    locked = threading.Event()
+
+    def request_token_in_other_process():
+        with other_process.locked():
+            locked.set()
+            time.sleep(0.2)
+            other_process.set(manager._key(credential), "token_1", time.time() + 3600)
+
+    async def get_token() -> tuple[str, int]:
+        ticks = 0
+        task = asyncio.ensure_future(manager.aget(credential))
+
+        while not task.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+        return task.result(), ticks
+
+    thread = threading.Thread(target=request_token_in_other_process)
+    thread.start()
+    locked.wait()
+    token, ticks = asyncio.run(get_token())
+    thread.join()
+
+    assert token == "token_1"
+    assert calls == []
+    assert ticks >= 10
@@ -0,0 +1,63 @@
+import threading
+import time
+
+import requests
+
+from msc_sdk.config_sdk import ConfigSDK
+from msc_sdk.enums import APINamespaces
+from msc_sdk.utils.api_tools import get_url, get_transport
+from msc_sdk.utils.transport import Transport
+
+
+def test_transport_is_owned_by_config():
+    assert isinstance(ConfigSDK.get_config().transport, Transport)
+    assert get_transport() is ConfigSDK.get_config().transport
+
+
+def test_transport_reuses_session():
+    transport = Transport(pool_connections=2, pool_maxsize=4)
+
+    session = transport.session
+    adapter = session.get_adapter("https://backend-test.mercadosimples.tech")
+
+    assert transport.session is session
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 4
+
+    transport.close()
+
+    assert transport.session is not session
+
+
+def test_requests_go_through_shared_session(requests_mock):
+    url = get_url(APINamespaces.CONTRACTS)
+    requests_mock.get(url, json={}, status_code=200)
+
+    response = get_transport().get(url=url)
+
+    assert response.status_code == 200
+    assert get_transport()._session is not None
+
+
+def test_concurrent_first_calls_share_one_session(monkeypatch):
+    created = []
+
+    class SlowSession(requests.Session):
+        def __init__(self):
+            time.sleep(0.01)
+            super().__init__()
+            created.append(self)
+
+    monkeypatch.setattr(requests, "Session", SlowSession)
+    transport = Transport()
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(transport.session)) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(session is created[0] for session in sessions)
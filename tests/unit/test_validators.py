@@ -0,0 +1,23 @@
+import pytest
+
+from msc_sdk.utils.validators import validate_cnpj, validate_cnpjs
+
+
+def test_validate_cnpj_normalizes_valid_cnpj():
+    assert validate_cnpj("01.027.058/0001-91") == "01027058000191"
+    assert validate_cnpj("1027058000191") == "01027058000191"
+
+
+@pytest.mark.parametrize("cnpj", ["01027058000192", "11111111111111", ""])
+def test_validate_cnpj_rejects_invalid_cnpj(cnpj):
+    with pytest.raises(ValueError):
+        validate_cnpj(cnpj)
+
+
+def test_validate_cnpjs():
+    cnpjs = ["1027058000191", "89785141000170", "1027058000191", "01027058000192"]
+
+    assert validate_cnpjs(cnpjs, strict=False) == ["01027058000191", "89785141000170", "01027058000191", None]
+
+    with pytest.raises(ValueError):
+        validate_cnpjs(cnpjs)